@@ -8,24 +8,1802 @@ with therapeutic insights, philosophical reflections, and warm conversational to
 
 import os
 import json
-import requests
+import hashlib
+import math
+import io
+import queue
+import random
+import re
+import shutil
+import tempfile
 import time
+from email.utils import parsedate_to_datetime
+import threading
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional
 import argparse
+import contextvars
+import importlib.util
+import multiprocessing
 import sys
 
-# Add OpenAI client
-try:
-    from openai import OpenAI
-except ImportError:
-    print("⚠️ OpenAI library not found. Installing...")
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "openai"])
-    from openai import OpenAI
+# openai, pydub, requests and numpy are imported where they are first needed, so
+# modes that never touch a provider or mix audio (--help, --prune-cache, ...) start quickly
+
+# Default location for persistent caches (TTS audio, ...)
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "calmi")
+
+# Version of the OpenAI prompt templates; bump it whenever a prompt changes so
+# cached responses generated from the old prompt are no longer reused
+PROMPT_VERSION = 2
+
+# Fields of a conversation analysis, and how the analysis prompts describe them
+ANALYSIS_FIELDS = {
+    "core_themes": "List of 2-3 main psychological/emotional themes",
+    "emotional_patterns": "Key emotional patterns you notice",
+    "therapeutic_insights": "3-4 specific therapeutic observations",
+    "philosophical_angles": "2-3 deeper life questions or philosophical themes",
+    "reframing_opportunities": "Specific ways to reframe challenges positively",
+    "growth_indicators": "Signs of resilience, self-awareness, or growth",
+    "support_suggestions": "Practical support or coping strategies"
+}
+ANALYSIS_FIELDS_PROMPT = "Please provide a JSON response with these exact fields:\n" + "".join(
+    f'- "{field}": {description}\n' for field, description in ANALYSIS_FIELDS.items())
+
+# What a generated podcast script has to look like
+SCRIPT_REQUIREMENTS_PROMPT = """REQUIREMENTS:
+1. Use the EXACT same format markers as the examples: [INTRO - Host 1], [Host 2], [OVERLAP - Host 1], [OUTRO - Host 2], etc.
+2. Make it deeply personal and specific to THIS conversation - reference actual quotes and moments
+3. Include therapeutic reframes and philosophical insights like the examples
+4. Feel warm, conversational, and sometimes overlapping like real friends talking
+5. Sarah (Host 1) tends to be more philosophical, Rachel (Host 2) more therapeutic
+6. Address the specific struggles and growth signs from this person's sharing
+7. End with genuine encouragement and wisdom
+8. Match the natural flow and conversational style of the examples
+"""
+
+# Size budget for cached OpenAI responses (they are small text/JSON entries)
+LLM_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+# Bundled files resolve relative to the package, not the working directory
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(PACKAGE_DIR, "scripts")
+
+# Per-job scratch space (segment audio); one private directory per generation
+DEFAULT_WORK_DIR = os.path.join(tempfile.gettempdir(), "calmi")
+
+
+class DiskCache:
+    """
+    Persistent, content-addressed byte store with LRU eviction under a size budget.
+    
+    Entries are files named after their SHA-256 key. A file's mtime doubles as its
+    last-access time, so eviction order survives across runs and processes.
+    """
+    
+    def __init__(self, cache_dir: str, max_bytes: int = 500 * 1024 * 1024):
+        """
+        Args:
+            cache_dir: Directory holding the cache entries
+            max_bytes: Size budget; least recently used entries are evicted beyond it
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._total_bytes = None  # Computed lazily on the first write
+    
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Build a stable cache key from JSON-serializable parts."""
+        payload = json.dumps(parts, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key)
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up an entry and mark it as recently used.
+        
+        Args:
+            key: Cache key from make_key
+            
+        Returns:
+            The cached bytes, or None on a miss
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return data
+    
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Store an entry, evicting least recently used entries if over budget.
+        
+        Args:
+            key: Cache key from make_key
+            data: Bytes to store
+        """
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            # An overwritten entry's old size no longer counts towards the total
+            try:
+                replaced_bytes = os.path.getsize(path)
+            except OSError:
+                replaced_bytes = 0
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️  Could not write cache entry: {str(e)}")
+            return
+        
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._entries())
+            else:
+                self._total_bytes += len(data) - replaced_bytes
+            over_budget = self._total_bytes > self.max_bytes
+        
+        if over_budget:
+            # Evict down to 90% so we don't walk the cache on every write
+            self.prune(int(self.max_bytes * 0.9))
+    
+    def _entries(self) -> List[tuple]:
+        """Return (mtime, size, path) for every entry in the cache."""
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+        return entries
+    
+    def prune(self, max_bytes: Optional[int] = None) -> tuple:
+        """
+        Evict least recently used entries until the cache fits the budget.
+        
+        Args:
+            max_bytes: Target size (defaults to the cache's own budget)
+            
+        Returns:
+            (entries_removed, bytes_freed) tuple
+        """
+        target = self.max_bytes if max_bytes is None else max_bytes
+        with self._lock:
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            freed = 0
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                freed += size
+                removed += 1
+            self._total_bytes = total
+        return removed, freed
+    
+    def stats(self) -> Dict:
+        """Return hit/miss counters and the current on-disk footprint."""
+        entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries)
+        }
+
+
+class Span:
+    """
+    One timed operation: a stage of the episode or a single provider request.
+    
+    Counters (bytes, chars, retries, cache_hits, ...) are summed with add(); other
+    attributes are recorded with set().
+    """
+    
+    __slots__ = ("name", "fields", "start", "duration", "thread", "_metrics")
+    
+    def __init__(self, metrics: 'Metrics', name: str, fields: Dict):
+        self._metrics = metrics
+        self.name = name
+        self.fields = fields
+        self.start = 0.0
+        self.duration = 0.0
+        self.thread = None
+    
+    def add(self, **counts) -> None:
+        for key, value in counts.items():
+            self.fields[key] = self.fields.get(key, 0) + value
+    
+    def set(self, **fields) -> None:
+        self.fields.update(fields)
+    
+    def __enter__(self) -> 'Span':
+        self._metrics._push(self)
+        self.thread = threading.current_thread().name
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.duration = time.perf_counter() - self.start
+        if exc_type is not None:
+            self.fields["error"] = exc_type.__name__
+        self._metrics._pop(self)
+        return False
+
+
+class _NullSpan:
+    """Shared stand-in returned while metrics are disabled."""
+    
+    def add(self, **counts) -> None:
+        pass
+    
+    def set(self, **fields) -> None:
+        pass
+    
+    def __enter__(self) -> '_NullSpan':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Metrics:
+    """
+    Lightweight span recorder for stage and provider-request timings.
+    
+    Spans nest per thread, so low-level code (such as the HTTP retry loop) can
+    attach counters to whichever span is open with add(). While disabled, span()
+    and add() return immediately and nothing is recorded.
+    """
+    
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.spans = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+    
+    def span(self, name: str, **fields):
+        """Context manager timing one operation; yields the span so counters can be added."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, fields)
+    
+    def add(self, **counts) -> None:
+        """Add counters to the innermost open span in this thread (if any)."""
+        if not self.enabled:
+            return
+        stack = getattr(self._local, "stack", None)
+        if stack:
+            stack[-1].add(**counts)
+    
+    def record(self, span, started: float) -> None:
+        """Record a span that was timed by hand instead of used as a context manager."""
+        if not isinstance(span, Span):
+            return
+        span.start = started
+        span.duration = time.perf_counter() - started
+        span.thread = threading.current_thread().name
+        with self._lock:
+            self.spans.append(span)
+    
+    def _push(self, span: Span) -> None:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(span)
+    
+    def _pop(self, span: Span) -> None:
+        stack = self._local.stack
+        if span in stack:
+            stack.remove(span)
+        with self._lock:
+            self.spans.append(span)
+    
+    def summary(self) -> Dict:
+        """Per span name: count, total/mean/max seconds and the summed numeric counters."""
+        with self._lock:
+            spans = list(self.spans)
+        
+        summary = {}
+        for span in spans:
+            entry = summary.setdefault(span.name, {"count": 0, "total_s": 0.0, "max_s": 0.0})
+            entry["count"] += 1
+            entry["total_s"] += span.duration
+            entry["max_s"] = max(entry["max_s"], span.duration)
+            for key, value in span.fields.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool) and key != "index":
+                    entry[key] = entry.get(key, 0) + value
+                elif key == "error":
+                    entry["errors"] = entry.get("errors", 0) + 1
+        for entry in summary.values():
+            entry["mean_s"] = entry["total_s"] / entry["count"]
+        return summary
+    
+    def write(self, path: str, **extra) -> None:
+        """
+        Write the summary and every recorded span to a JSON file.
+        
+        Args:
+            path: Output file
+            **extra: Additional top-level values (e.g. run-wide counters)
+        """
+        with self._lock:
+            spans = list(self.spans)
+        spans.sort(key=lambda span: span.start)
+        
+        report = {
+            "generated": datetime.now().isoformat(timespec="seconds"),
+            **extra,
+            "summary": self.summary(),
+            "spans": [{"name": span.name, "start_s": round(span.start - self._origin, 6),
+                       "duration_s": round(span.duration, 6), "thread": span.thread, **span.fields}
+                      for span in spans]
+        }
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+class ProviderSession:
+    """
+    Shared HTTP session for TTS provider calls.
+    
+    Keeps a pool of keep-alive connections, applies explicit connect/read timeouts,
+    and retries transient failures (429, 5xx, connection errors) with jittered
+    exponential backoff, honoring Retry-After when the server sends it.
+    
+    Requests that are not idempotent (POSTs, unless the caller says otherwise) are
+    only resent when the server cannot have acted on them: a 429, a 503 with
+    Retry-After, or a connection that was never established. A read timeout or
+    another 5xx may arrive after the provider accepted the job, and resending it
+    would start (and bill) a duplicate.
+    """
+    
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+    
+    def __init__(self, pool_size: int = 4, connect_timeout: float = 5.0, read_timeout: float = 60.0,
+                 max_retries: int = 4, backoff_base: float = 0.5, backoff_max: float = 30.0,
+                 metrics: Optional[Metrics] = None):
+        """
+        Args:
+            pool_size: Number of pooled connections per host (match the synthesis concurrency)
+            connect_timeout: Seconds to wait for a connection
+            read_timeout: Seconds to wait for the server to send data
+            max_retries: Retries per request before giving up
+            backoff_base: First backoff ceiling in seconds, doubled on every retry
+            backoff_max: Upper bound for any single wait, including Retry-After
+            metrics: Optional Metrics; retries are counted on the caller's open span
+        """
+        self.metrics = metrics or Metrics()
+        self.on_throttle = None  # Optional callback(url) for every 429 response
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retries = 0
+        self.pool_size = pool_size
+        self._lock = threading.Lock()
+        self._session = None
+    
+    @property
+    def session(self) -> 'requests.Session':
+        """The pooled requests session, created (and requests imported) on first use."""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+        return self._session
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given retry attempt."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+    
+    def resize(self, pool_size: int) -> None:
+        """Change the connection pool size (takes effect for a new underlying session)."""
+        with self._lock:
+            self.pool_size = pool_size
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+    
+    def _retry_after(self, response: 'requests.Response') -> Optional[float]:
+        """Parse a Retry-After header given either in seconds or as an HTTP date."""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(self.backoff_max, max(0.0, delay))
+    
+    def _unsent(self, error: Exception) -> bool:
+        """Whether a failed request never reached the server (so it is safe to send again)."""
+        import requests
+        from urllib3.exceptions import NewConnectionError
+        
+        if isinstance(error, requests.ConnectTimeout):
+            return True
+        if isinstance(error, requests.Timeout):
+            return False
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(reason, NewConnectionError)
+    
+    def _retryable(self, response: 'requests.Response', idempotent: bool) -> bool:
+        """Whether a response with this status may be retried."""
+        if response.status_code not in self.RETRY_STATUSES:
+            return False
+        if idempotent or response.status_code == 429:
+            return True
+        return response.status_code == 503 and "Retry-After" in response.headers
+    
+    def request(self, method: str, url: str, cancel_event: Optional[threading.Event] = None,
+                idempotent: Optional[bool] = None, **kwargs) -> 'requests.Response':
+        """
+        Send a request, retrying transient failures.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            cancel_event: Optional event that aborts the backoff wait once set
+            idempotent: Whether resending after an ambiguous failure is harmless
+                (default: true for GET, HEAD, OPTIONS, PUT and DELETE)
+            **kwargs: Passed through to requests.Session.request
+            
+        Returns:
+            The final response (which may still be an error status once retries run out);
+            its attempt_seconds is how long that attempt alone took, without earlier
+            attempts or backoff waits
+        """
+        import requests
+        
+        kwargs.setdefault("timeout", self.timeout)
+        if idempotent is None:
+            idempotent = method.upper() in self.IDEMPOTENT_METHODS
+        attempt = 0
+        
+        while True:
+            try:
+                started = time.perf_counter()
+                response = self.session.request(method, url, **kwargs)
+                response.attempt_seconds = time.perf_counter() - started
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.max_retries or not (idempotent or self._unsent(e)):
+                    raise
+                delay = self._backoff_delay(attempt)
+                reason = type(e).__name__
+                response = None
+            else:
+                if response.status_code == 429 and self.on_throttle is not None:
+                    self.on_throttle(url)
+                if not self._retryable(response, idempotent) or attempt >= self.max_retries:
+                    return response
+                delay = self._retry_after(response)
+                if delay is None:
+                    delay = self._backoff_delay(attempt)
+                reason = f"HTTP {response.status_code}"
+            
+            attempt += 1
+            with self._lock:
+                self.retries += 1
+            self.metrics.add(retries=1)
+            print(f"   ↻ {reason} from {url.split('?')[0]}, retry {attempt}/{self.max_retries} in {delay:.1f}s")
+            
+            if cancel_event is None:
+                time.sleep(delay)
+            elif cancel_event.wait(delay):
+                if response is not None:
+                    return response
+                raise requests.ConnectionError(f"Request to {url} cancelled during retry backoff")
+    
+    def get(self, url: str, **kwargs) -> 'requests.Response':
+        return self.request("GET", url, **kwargs)
+    
+    def post(self, url: str, **kwargs) -> 'requests.Response':
+        return self.request("POST", url, **kwargs)
+    
+    def close(self) -> None:
+        """Close the underlying session, if one was ever created."""
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+
+class PlayhtJob:
+    """One submitted Play.ht job as tracked by PlayhtJobPoller."""
+    
+    __slots__ = ("job_id", "status_url", "headers", "interval", "next_poll", "deadline", "in_flight",
+                 "polls", "audio_url", "error", "done")
+    
+    def __init__(self, job_id: str, status_url: str, headers: Dict, interval: float, timeout: float):
+        now = time.monotonic()
+        self.job_id = job_id
+        self.status_url = status_url
+        self.headers = headers
+        self.interval = interval
+        self.next_poll = now + interval
+        self.deadline = now + timeout
+        self.in_flight = False
+        self.polls = 0
+        self.audio_url = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class PlayhtJobPoller:
+    """
+    Polls every outstanding Play.ht job from one shared scheduler.
+    
+    Each job is checked on its own backoff schedule: the first poll comes
+    initial_interval after submission and every "still generating" answer stretches
+    the interval by backoff (up to max_interval), so quick jobs are noticed within a
+    few hundred milliseconds while slow ones aren't polled needlessly often. Due polls
+    run on a few shared threads; callers block on the job's event instead of sleeping.
+    The scheduler thread exits when nothing is outstanding and restarts on demand.
+    """
+    
+    def __init__(self, http: ProviderSession, initial_interval: float = 0.25, backoff: float = 1.5,
+                 max_interval: float = 2.0, timeout: float = 30.0, poll_workers: int = 4):
+        """
+        Args:
+            http: Session the status requests are sent through
+            initial_interval: Seconds from submission to the first poll
+            backoff: Factor applied to a job's interval after each incomplete poll
+            max_interval: Upper bound on a job's polling interval
+            timeout: Seconds after which an unfinished job is given up
+            poll_workers: Status requests that may be in flight at once
+        """
+        self.http = http
+        self.initial_interval = initial_interval
+        self.backoff = backoff
+        self.max_interval = max_interval
+        self.timeout = timeout
+        self.poll_workers = poll_workers
+        self._jobs = {}
+        self._cond = threading.Condition()
+        self._thread = None
+        self._executor = None
+    
+    def watch(self, job_id: str, status_url: str, headers: Dict) -> PlayhtJob:
+        """Start tracking a submitted job."""
+        job = PlayhtJob(job_id, status_url, headers, self.initial_interval, self.timeout)
+        with self._cond:
+            self._jobs[job_id] = job
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.poll_workers, thread_name_prefix="playht-poll")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="playht-poller", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return job
+    
+    def wait(self, job: PlayhtJob, cancel_event: Optional[threading.Event] = None) -> Optional[str]:
+        """
+        Block until the job completes.
+        
+        Returns:
+            The audio URL, or None if the job failed, timed out or was cancelled
+            (job.error says which)
+        """
+        while not job.done.wait(0.1):
+            if cancel_event is not None and cancel_event.is_set():
+                with self._cond:
+                    self._jobs.pop(job.job_id, None)
+                job.error = "cancelled"
+                return None
+        return job.audio_url
+    
+    def _run(self) -> None:
+        """Dispatch each job's poll when it falls due."""
+        while True:
+            with self._cond:
+                if not self._jobs:
+                    self._thread = None
+                    return
+                now = time.monotonic()
+                idle = [job for job in self._jobs.values() if not job.in_flight]
+                due = [job for job in idle if job.next_poll <= now]
+                if not due:
+                    # Sleep until the next job is due, or a poll finishes / a job is added
+                    self._cond.wait(min(job.next_poll for job in idle) - now if idle else None)
+                    continue
+                for job in due:
+                    job.in_flight = True
+                executor = self._executor
+            for job in due:
+                executor.submit(self._poll, job)
+    
+    def _poll(self, job: PlayhtJob) -> None:
+        audio_url = error = None
+        try:
+            response = self.http.get(job.status_url, headers=job.headers)
+            if response.status_code == 200:
+                status = response.json()
+                if status.get("output") and status["output"].get("url"):
+                    audio_url = status["output"]["url"]
+                elif status.get("status") == "error":
+                    error = status.get("error", "Unknown error")
+        except Exception as e:
+            # Transient by the time retries are exhausted; keep polling until the deadline
+            print(f"⚠️  Polling Play.ht job {job.job_id} failed: {str(e)}")
+        
+        with self._cond:
+            job.polls += 1
+            job.in_flight = False
+            now = time.monotonic()
+            if audio_url is None and error is None and now >= job.deadline:
+                error = "timed out"
+            if audio_url is not None or error is not None:
+                job.audio_url, job.error = audio_url, error
+                self._jobs.pop(job.job_id, None)
+                job.done.set()
+            else:
+                job.interval = min(self.max_interval, job.interval * self.backoff)
+                job.next_poll = now + job.interval
+            self._cond.notify()
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at rate tokens per second, holding at most capacity.
+    
+    reserve() always succeeds but may leave the bucket in debt; the caller then waits
+    the returned delay, so requests are admitted in order at the configured rate.
+    A rate of None means unlimited.
+    """
+    
+    def __init__(self, rate: Optional[float] = None, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else (rate or 0.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self, amount: float) -> float:
+        """Take amount tokens; returns the seconds to wait before using them."""
+        if self.rate is None or amount <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= amount
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+# Ledger of the episode currently being generated (see AIPodcastGenerator._episode_job)
+_TTS_LEDGER = contextvars.ContextVar("tts_ledger", default=None)
+
+
+class CharacterLedger:
+    """Requests and characters sent to each TTS provider, e.g. for one episode."""
+    
+    def __init__(self):
+        self.usage = {}
+        self._lock = threading.Lock()
+    
+    def charge(self, provider: str, chars: int, requests: int = 1) -> None:
+        with self._lock:
+            entry = self.usage.setdefault(provider, {"requests": 0, "chars": 0})
+            entry["requests"] += requests
+            entry["chars"] += chars
+    
+    @property
+    def chars(self) -> int:
+        return sum(entry["chars"] for entry in self.usage.values())
+    
+    def describe(self) -> str:
+        return ", ".join(f"{provider} {entry['chars']:,} chars / {entry['requests']} requests"
+                         for provider, entry in sorted(self.usage.items())) or "nothing"
+
+
+class ProviderGovernor:
+    """
+    Admission control in front of one TTS provider.
+    
+    Requests are admitted through token buckets for requests and characters per
+    minute (when quotas are set) and under a concurrency limit adjusted AIMD-style:
+    each healthy response adds 1/limit (about +1 per round of requests), while a
+    429 or latency well above the best observed halves it (at most once per
+    cooldown). Characters of successful requests are counted for the provider and
+    for the current episode.
+    """
+    
+    def __init__(self, name: str, max_concurrency: int = 4, min_concurrency: int = 1,
+                 requests_per_minute: Optional[float] = None, chars_per_minute: Optional[float] = None,
+                 latency_factor: float = 3.0, cooldown: float = 2.0):
+        """
+        Args:
+            name: Provider name (used in usage accounting)
+            max_concurrency: Upper bound (and starting value) for requests in flight
+            min_concurrency: Lower bound the limit never drops below
+            requests_per_minute: Request quota (None for unlimited)
+            chars_per_minute: Character quota (None for unlimited)
+            latency_factor: Seconds per character above this multiple of the best smoothed
+                value count as congestion
+            cooldown: Minimum seconds between two decreases
+        """
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.latency_factor = latency_factor
+        self.cooldown = cooldown
+        self.limit = float(max_concurrency)
+        self.in_flight = 0
+        self.requests = 0
+        self.chars = 0
+        self.throttled = 0
+        self.set_quota(requests_per_minute, chars_per_minute)
+        self._smoothed = None
+        self._baseline = None
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+    
+    def set_quota(self, requests_per_minute: Optional[float] = None, chars_per_minute: Optional[float] = None) -> None:
+        """Set the per-minute request and character quotas (None for unlimited)."""
+        self.request_bucket = TokenBucket(requests_per_minute / 60 if requests_per_minute else None)
+        # Allow a burst of one typical request's worth of characters
+        self.char_bucket = TokenBucket(chars_per_minute / 60 if chars_per_minute else None,
+                                       max(500.0, chars_per_minute / 60) if chars_per_minute else None)
+    
+    def set_max_concurrency(self, max_concurrency: int) -> None:
+        with self._cond:
+            self.max_concurrency = max(self.min_concurrency, max_concurrency)
+            self.limit = float(self.max_concurrency)
+            self._cond.notify_all()
+    
+    def acquire(self, chars: int = 0, cancel_event: Optional[threading.Event] = None) -> bool:
+        """
+        Wait for a request slot and quota.
+        
+        Args:
+            chars: Characters the request will send (for the character quota)
+            cancel_event: Optional event that abandons the wait once set
+        
+        Returns:
+            True once admitted (release() must follow), False if cancelled while waiting
+        """
+        with self._cond:
+            while self.in_flight >= max(self.min_concurrency, int(self.limit)):
+                if cancel_event is not None and cancel_event.is_set():
+                    return False
+                self._cond.wait(0.1)
+            self.in_flight += 1
+        
+        delay = max(self.request_bucket.reserve(1), self.char_bucket.reserve(chars))
+        if delay > 0:
+            if cancel_event is not None:
+                if cancel_event.wait(delay):
+                    self.release()
+                    return False
+            else:
+                time.sleep(delay)
+        return True
+    
+    def release(self, seconds: Optional[float] = None, chars: int = 0, billed: bool = False) -> None:
+        """
+        Free a slot, optionally reporting how long the request took.
+        
+        Args:
+            seconds: Latency of the successful attempt alone (None when the request says
+                nothing about congestion, e.g. it failed)
+            chars: Characters in the request, to compare latencies across lengths
+            billed: Whether the provider accepted the request, so its characters count
+        """
+        if billed:
+            ledger = _TTS_LEDGER.get()
+            if ledger is not None:
+                ledger.charge(self.name, chars)
+        with self._cond:
+            self.in_flight -= 1
+            if billed:
+                self.requests += 1
+                self.chars += chars
+            if seconds is not None:
+                per_char = seconds / max(chars, 50)
+                self._smoothed = per_char if self._smoothed is None else 0.8 * self._smoothed + 0.2 * per_char
+                # The baseline drifts up slowly so a provider that became slower for good isn't throttled forever
+                self._baseline = self._smoothed if self._baseline is None else min(self._smoothed, self._baseline * 1.02)
+                if self._smoothed > self.latency_factor * self._baseline:
+                    self._decrease()
+                else:
+                    self.limit = min(float(self.max_concurrency), self.limit + 1 / self.limit)
+            self._cond.notify_all()
+    
+    def throttle(self) -> None:
+        """Report a 429 from the provider."""
+        with self._cond:
+            self.throttled += 1
+            self._decrease()
+    
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease >= self.cooldown:
+            self._last_decrease = now
+            self.limit = max(float(self.min_concurrency), self.limit / 2)
+    
+    def stats(self) -> Dict:
+        with self._cond:
+            return {"requests": self.requests, "chars": self.chars, "throttled": self.throttled,
+                    "concurrency_limit": round(self.limit, 2)}
+
+
+class TimelineMixer:
+    """
+    Two-phase episode mixer: plan every segment's placement, then render once.
+    
+    The placement rules reproduce combine_audio_files_smart's original timing
+    semantics (normal crossfade, overlap, simultaneous) and the silence trim of the
+    running episode, but instead of rebuilding an AudioSegment on every step they
+    only record events (offset, gain, fades, cuts). render() then mixes everything
+    into a single preallocated NumPy buffer, so mixing time grows linearly with
+    episode length.
+    
+    All positions are in milliseconds on the untrimmed timeline; start_ms/end_ms
+    delimit the part of it that is currently "the episode". Where speech starts and
+    where trailing silence begins are tracked incrementally as segments are added,
+    so trimming the episode costs the same at segment 40 as at segment 2.
+    
+    For streaming output, flush() renders just the prefix of the timeline that no
+    future segment can change and drops the events that are fully behind it.
+    """
+    
+    SAMPLE_DTYPES = {1: "<i1", 2: "<i2", 4: "<i4"}
+    
+    # Furthest a new segment can reach back before the current speech end (overlap cap)
+    MAX_BACKREACH_MS = 2000
+    
+    def __init__(self, frame_rate: int, channels: int, sample_width: int, end_padding_ms: int = 200,
+                 start_padding_ms: int = 100):
+        """
+        Args:
+            frame_rate: Output frame rate (segments are converted to it)
+            channels: Output channel count
+            sample_width: Output sample width in bytes (1, 2 or 4)
+            end_padding_ms: Padding kept after the last speech when trimming the episode tail
+            start_padding_ms: Padding kept before the first speech when trimming the episode head
+        """
+        self.frame_rate = frame_rate
+        self.channels = channels
+        self.sample_width = sample_width
+        self.end_padding_ms = end_padding_ms
+        self.start_padding_ms = start_padding_ms
+        
+        self.start_ms = 0
+        self.end_ms = 0
+        self.extent_ms = 0     # Furthest point any placement has reached
+        self.segment_count = 0
+        self.flushed_ms = None  # Where the next flush() starts (None until the head is settled)
+        
+        # (kind, start_ms, end_ms, ...) with kind "place", "cut" or "fade_out"; start/end
+        # bound the audio the event can affect
+        self.events = []
+        
+        # Where the first speech starts and where the trailing silence begins
+        self.speech_start_ms = None
+        self.speech_end_ms = None
+    
+    def __len__(self) -> int:
+        """Current episode length in milliseconds (len(combined) in the old mixer)."""
+        return self.end_ms - self.start_ms
+    
+    def _samples(self, segment: 'AudioSegment') -> 'np.ndarray':
+        """Return a (frames, channels) view of a segment's samples in the output format."""
+        import numpy as np
+        
+        if segment.frame_rate != self.frame_rate:
+            segment = segment.set_frame_rate(self.frame_rate)
+        if segment.channels != self.channels:
+            segment = segment.set_channels(self.channels)
+        if segment.sample_width != self.sample_width:
+            segment = segment.set_sample_width(self.sample_width)
+        samples = np.frombuffer(segment.raw_data, dtype=self.SAMPLE_DTYPES[self.sample_width])
+        return samples.reshape(-1, self.channels)
+    
+    def _frames(self, ms: float) -> int:
+        return int(round(ms * self.frame_rate / 1000.0))
+    
+    @property
+    def needs_speech_start(self) -> bool:
+        """Whether the next segment's speech start matters (no speech on the timeline yet)."""
+        return self.speech_start_ms is None
+    
+    def _place(self, segment: 'AudioSegment', offset_ms: int, gain_db: float, speech: Optional[tuple],
+               fade_in_ms: int = 0, max_ms: Optional[int] = None) -> None:
+        """Record a segment placement and fold its speech span into the tail tracking."""
+        duration_ms = len(segment) if max_ms is None else min(len(segment), max_ms)
+        clip_end_ms = offset_ms + duration_ms
+        self.events.append(("place", offset_ms, clip_end_ms, self._samples(segment), gain_db, fade_in_ms))
+        self.extent_ms = max(self.extent_ms, clip_end_ms)
+        
+        if not speech:
+            return
+        speech_start, speech_end = speech
+        if speech_start is not None and offset_ms + speech_start < clip_end_ms:
+            start = offset_ms + speech_start
+            if self.speech_start_ms is None or start < self.speech_start_ms:
+                self.speech_start_ms = start
+        end = min(offset_ms + speech_end, clip_end_ms)
+        if end > offset_ms and (self.speech_end_ms is None or end > self.speech_end_ms):
+            self.speech_end_ms = end
+    
+    def trim(self) -> None:
+        """
+        Trim leading and trailing silence from the episode, keeping the usual padding.
+        
+        Equivalent to the old _trim_silence(combined) call, but uses the tracked
+        speech boundaries instead of re-analyzing the accumulated audio.
+        """
+        if self.speech_start_ms is None or self.speech_end_ms is None:
+            return
+        
+        start = max(self.start_ms, self.speech_start_ms - self.start_padding_ms)
+        end = min(self.end_ms, self.speech_end_ms + self.end_padding_ms)
+        if end <= start:
+            return
+        
+        # Cuts only ever remove audio after the last speech, so the tracked
+        # boundaries stay valid without touching earlier placements
+        self.start_ms = start
+        if self.flushed_ms is None:
+            self.flushed_ms = start
+        if end < self.end_ms:
+            # A cut silences everything already placed past it
+            if self.extent_ms > end:
+                self.events.append(("cut", end, self.extent_ms))
+            self.end_ms = end
+    
+    def add(self, segment: 'AudioSegment', timing_info: str, gain_db: float = 0.0,
+            speech: Optional[tuple] = None, index: int = 0, pause_ms: int = 400,
+            crossfade_ms: int = 100) -> None:
+        """
+        Plan the placement of the next segment.
+        
+        Args:
+            segment: Trimmed (but not yet normalized) audio segment
+            timing_info: "normal", "overlap", "simultaneous" or "continue" (placed like
+                normal; the caller passes a shorter pause)
+            gain_db: Gain to apply when rendering (volume normalization)
+            speech: (start_ms, end_ms) of speech within the segment at the normalized level;
+                start_ms may be None unless needs_speech_start is set
+            index: Segment position, for progress output
+            pause_ms: Silence between segments in normal flow
+            crossfade_ms: Crossfade length in normal flow (see _add_with_crossfade)
+        """
+        self.segment_count += 1
+        if self.segment_count == 1:
+            # First segment becomes the episode as-is
+            self._place(segment, 0, gain_db, speech)
+            self.end_ms = len(segment)
+            return
+        
+        if timing_info == "overlap":
+            # MUCH more aggressive overlap - cut into previous segment
+            # Trim end of combined first, then overlap heavily
+            self.trim()
+            overlap_ms = int(min(2000, len(segment) // 1.5, len(self) // 2))  # Very aggressive
+            print(f"   🔄 TIGHT overlap segment {index+1} by {overlap_ms} ms")
+            
+            if overlap_ms > 100:  # Only overlap if meaningful
+                offset_ms = self.end_ms - overlap_ms
+            else:
+                # Direct connection - no pause at all
+                offset_ms = self.end_ms
+            self._place(segment, offset_ms, gain_db, speech)
+            self.end_ms = offset_ms + len(segment)
+        
+        elif timing_info == "simultaneous":
+            # True simultaneous - back up significantly and overlay
+            print(f"   🎭 SIMULTANEOUS overlay for segment {index+1}")
+            self.trim()
+            backup_ms = min(1000, len(self) // 3, len(segment))
+            if backup_ms > 0:
+                self._place(segment, self.end_ms - backup_ms, gain_db, speech, max_ms=backup_ms)
+            else:
+                self._place(segment, self.start_ms, gain_db, speech, max_ms=len(self))
+        
+        else:  # normal - natural conversation flow
+            # Trim the episode, add a pause, then crossfade into the new segment
+            self.trim()
+            with_pause_ms = len(self) + pause_ms
+            if with_pause_ms < crossfade_ms or len(segment) < crossfade_ms:
+                # Not enough audio for crossfade, just concatenate
+                offset_ms = self.end_ms + pause_ms
+                self._place(segment, offset_ms, gain_db, speech)
+            else:
+                offset_ms = self.end_ms + pause_ms - crossfade_ms
+                self.events.append(("fade_out", offset_ms, offset_ms + crossfade_ms))
+                self._place(segment, offset_ms, gain_db, speech, fade_in_ms=crossfade_ms)
+            self.end_ms = offset_ms + len(segment)
+            print(f"   ➡️  Added segment {index+1} with smooth crossfade")
+    
+    def _render_window(self, start_ms: int, end_ms: int) -> 'np.ndarray':
+        """
+        Replay the recorded events over [start_ms, end_ms) of the timeline.
+        
+        Returns:
+            Mixed samples for the window as a float32 (frames, channels) array
+        """
+        import numpy as np
+        
+        window_start = self._frames(start_ms)
+        window_end = self._frames(end_ms)
+        buffer = np.zeros((max(0, window_end - window_start), self.channels), dtype=np.float32)
+        
+        for event in self.events:
+            kind, event_start_ms, event_end_ms = event[:3]
+            start = self._frames(event_start_ms)
+            end = self._frames(event_end_ms)
+            lo = max(start, window_start)
+            hi = min(end, window_end)
+            if hi <= lo:
+                continue
+            
+            if kind == "place":
+                samples, gain_db, fade_in_ms = event[3:]
+                hi = min(hi, start + len(samples))
+                if hi <= lo:
+                    continue
+                chunk = samples[lo - start:hi - start].astype(np.float32)
+                if gain_db:
+                    chunk *= 10 ** (gain_db / 20.0)
+                fade = self._frames(fade_in_ms)
+                if fade and lo - start < fade:
+                    ramp = np.arange(lo - start, min(hi - start, fade), dtype=np.float32) / fade
+                    chunk[:len(ramp)] *= ramp[:, None]
+                buffer[lo - window_start:hi - window_start] += chunk
+            elif kind == "cut":
+                buffer[lo - window_start:hi - window_start] = 0
+            elif kind == "fade_out":
+                fade = end - start
+                ramp = 1.0 - np.arange(lo - start, hi - start, dtype=np.float32) / fade
+                buffer[lo - window_start:hi - window_start] *= ramp[:, None]
+        
+        return buffer
+    
+    def _to_pcm(self, buffer: 'np.ndarray') -> bytes:
+        """Clip mixed float samples to the output sample width and pack them."""
+        import numpy as np
+        
+        limit = float(2 ** (8 * self.sample_width - 1))
+        np.clip(buffer, -limit, limit - 1, out=buffer)
+        return buffer.astype(self.SAMPLE_DTYPES[self.sample_width]).tobytes()
+    
+    def render(self) -> 'AudioSegment':
+        """
+        Mix all planned placements into one preallocated buffer.
+        
+        Returns:
+            The finished episode as an AudioSegment
+        """
+        from pydub import AudioSegment
+        
+        start_ms = self.start_ms if self.flushed_ms is None else self.flushed_ms
+        data = self._to_pcm(self._render_window(start_ms, self.end_ms))
+        return AudioSegment(data=data, sample_width=self.sample_width,
+                            frame_rate=self.frame_rate, channels=self.channels)
+    
+    def flush(self, final: bool = False) -> bytes:
+        """
+        Render the part of the episode that can no longer change.
+        
+        Nothing is final until the head of the episode has been trimmed; after that,
+        everything up to MAX_BACKREACH_MS before the current speech end is. Events
+        that lie entirely behind the flushed point are dropped.
+        
+        Args:
+            final: No more segments will be added; flush through the end
+        
+        Returns:
+            Raw PCM bytes for the newly finalized audio (possibly empty)
+        """
+        if self.flushed_ms is None:
+            if not final:
+                return b""
+            self.flushed_ms = self.start_ms
+        
+        if final:
+            final_ms = self.end_ms
+        elif self.speech_end_ms is None:
+            return b""
+        else:
+            final_ms = min(self.end_ms, self.speech_end_ms - self.MAX_BACKREACH_MS)
+        
+        if final_ms <= self.flushed_ms:
+            return b""
+        
+        data = self._to_pcm(self._render_window(self.flushed_ms, final_ms))
+        self.flushed_ms = final_ms
+        self.events = [event for event in self.events if event[2] > final_ms]
+        return data
+
+
+class PreparedSegment(NamedTuple):
+    """
+    One segment decoded, trimmed and measured for the mixer, as compact raw PCM.
+    
+    This is what the segment preparation workers send back: a bytes buffer and a
+    few numbers pickle cheaply, unlike a decoded AudioSegment or an MP3 file path
+    that would have to be decoded again.
+    """
+    pcm: bytes
+    frame_rate: int
+    channels: int
+    sample_width: int
+    gain_db: float  # Gain that levels the segment to the target loudness
+    speech: Optional[tuple]  # (start_ms, end_ms) of speech at that level, or None if silent
+    
+    def audio(self) -> 'AudioSegment':
+        """The trimmed segment as an AudioSegment (wraps the buffer without copying)."""
+        from pydub import AudioSegment
+        return AudioSegment(data=self.pcm, sample_width=self.sample_width, frame_rate=self.frame_rate,
+                            channels=self.channels)
+
+
+class StreamingEncoder:
+    """
+    Long-lived ffmpeg process that encodes raw PCM as it arrives.
+    
+    The output (stdout for "-", otherwise a partial file next to the output file)
+    grows while the rest of the episode is still being synthesized and mixed. A
+    complete file is moved into place when the encoder is closed.
+    """
+    
+    CODECS = {
+        "mp3": ["-c:a", "libmp3lame", "-b:a", "128k", "-f", "mp3"],
+        "opus": ["-c:a", "libopus", "-b:a", "64k", "-f", "ogg"],
+    }
+    
+    def __init__(self, output_filename: str, frame_rate: int, channels: int, sample_width: int = 2,
+                 output_format: Optional[str] = None):
+        """
+        Args:
+            output_filename: Output file, or "-" for stdout
+            frame_rate: Frame rate of the incoming PCM
+            channels: Channel count of the incoming PCM
+            sample_width: Sample width of the incoming PCM in bytes
+            output_format: "mp3" or "opus" (defaults to the file extension, else mp3)
+        """
+        import subprocess
+        
+        if output_format is None:
+            extension = os.path.splitext(output_filename)[1].lower()
+            output_format = "opus" if extension in (".opus", ".ogg") else "mp3"
+        input_format = {1: "s8", 2: "s16le", 4: "s32le"}[sample_width]
+        
+        cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error",
+               "-f", input_format, "-ar", str(frame_rate), "-ac", str(channels), "-i", "pipe:0",
+               *self.CODECS[output_format], "-flush_packets", "1",
+               "pipe:1" if output_filename == "-" else partial_output_for(output_filename), "-y"]
+        self.output_filename = output_filename
+        self.partial_filename = None if output_filename == "-" else cmd[-2]
+        self.bytes_written = 0
+        self.process = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+    
+    def write(self, pcm: bytes) -> None:
+        """Feed finalized PCM to the encoder."""
+        if not pcm:
+            return
+        self.process.stdin.write(pcm)
+        self.process.stdin.flush()
+        self.bytes_written += len(pcm)
+    
+    def close(self, complete: bool = True) -> bool:
+        """
+        Finish encoding.
+        
+        Args:
+            complete: Whether the whole episode was written (otherwise the partial
+                file is discarded instead of moved into place)
+        
+        Returns:
+            True if ffmpeg exited cleanly and the episode was complete
+        """
+        try:
+            self.process.stdin.close()
+        except BrokenPipeError:
+            pass
+        success = self.process.wait() == 0 and complete
+        if self.partial_filename is not None:
+            publish_output(self.partial_filename, self.output_filename, success)
+        return success
+
+
+class Workspace:
+    """
+    Private scratch directory for one generation job.
+    
+    Anonymous jobs get a fresh directory (created with mkdtemp, so names never
+    collide across threads or processes). A job_id gives the job a stable directory
+    instead, so an interrupted run can be resumed from what it left behind. Used as
+    a context manager the directory is removed on exit unless keep is set.
+    """
+    
+    def __init__(self, root: Optional[str] = None, keep: bool = False, job_id: Optional[str] = None):
+        """
+        Args:
+            root: Parent directory for job workspaces (default: DEFAULT_WORK_DIR)
+            keep: Leave the workspace on disk after the job (e.g. for --combine-only)
+            job_id: Stable workspace name; reused if it already exists
+        """
+        self.root = root or DEFAULT_WORK_DIR
+        self.keep = keep
+        self.job_id = job_id
+        self.path = None
+        self.segments_dir = None
+    
+    def __enter__(self) -> 'Workspace':
+        os.makedirs(self.root, exist_ok=True)
+        if self.job_id:
+            self.path = os.path.join(self.root, self.job_id)
+        else:
+            self.path = tempfile.mkdtemp(prefix=datetime.now().strftime("%Y%m%d_%H%M%S_"), dir=self.root)
+        self.segments_dir = os.path.join(self.path, "segments")
+        os.makedirs(self.segments_dir, exist_ok=True)
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if self.keep:
+            print(f"📂 Segment files kept in: {self.segments_dir}")
+        else:
+            self.cleanup()
+        return False
+    
+    def cleanup(self) -> None:
+        """Remove the workspace and everything in it."""
+        if self.path:
+            shutil.rmtree(self.path, ignore_errors=True)
+
+
+class EpisodeManifest:
+    """
+    Stage checkpoints for one episode, persisted as manifest.json in its segment directory.
+    
+    Records the analysis, the script, the parsed voice segments (by host number)
+    with their timing and, per segment, the audio file, its SHA-256 and a status.
+    Reopening the manifest for the same source text and identity (the settings
+    the audio depends on: provider, audio format, packing budget, voices) resumes
+    from the first incomplete stage: only segments that are missing, failed or no
+    longer match their hash are synthesized again. A different source or identity
+    starts a fresh manifest.
+    """
+    
+    FILENAME = "manifest.json"
+    VERSION = 2
+    STAGES = ("analysis", "script", "segments", "audio", "complete")
+    
+    def __init__(self, directory: str, source: str, resumable: bool = True, identity: Optional[Dict] = None):
+        """
+        Args:
+            directory: Segment directory the manifest (and its audio files) live in
+            source: Transcript or script text the episode is generated from
+            resumable: Pick up an existing manifest for the same source and identity
+            identity: JSON-serializable settings the checkpoints are only valid for
+        """
+        self.directory = directory
+        self.path = os.path.join(directory, self.FILENAME)
+        self.resumable = resumable
+        self._lock = threading.Lock()
+        
+        identity = identity or {}
+        source_sha256 = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        existing = self.read(directory) if resumable else None
+        same_source = existing is not None and existing.get("source_sha256") == source_sha256
+        self.resumed = (same_source and existing.get("version") == self.VERSION
+                        and existing.get("identity") == identity)
+        # Settings that differ from a discarded manifest for the same source
+        self.stale = []
+        if same_source and not self.resumed:
+            if existing.get("version") != self.VERSION:
+                self.stale = ["version"]
+            else:
+                previous = existing.get("identity") or {}
+                self.stale = sorted(key for key in set(identity) | set(previous)
+                                    if previous.get(key) != identity.get(key))
+        if self.resumed:
+            self.data = existing
+        else:
+            self.data = {
+                "version": self.VERSION,
+                "source_sha256": source_sha256,
+                "identity": identity,
+                "stage": "analysis",
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "analysis": None,
+                "script": None,
+                "segments": None
+            }
+            self.save()
+    
+    @classmethod
+    def read(cls, directory: str) -> Optional[Dict]:
+        """Load the manifest stored in a segment directory, if there is a readable one."""
+        try:
+            with open(os.path.join(directory, cls.FILENAME), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    @property
+    def stage(self) -> str:
+        return self.data["stage"]
+    
+    def save(self) -> None:
+        """Persist the manifest atomically."""
+        with self._lock:
+            self._save_locked()
+    
+    def _save_locked(self) -> None:
+        self.data["updated"] = datetime.now().isoformat(timespec="seconds")
+        tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.data, f, indent=2)
+        os.replace(tmp_path, self.path)
+    
+    def update(self, **fields) -> None:
+        """Set top-level fields (analysis, script, stage, ...) and persist."""
+        with self._lock:
+            self.data.update(fields)
+            self._save_locked()
+    
+    def add_segment(self, i: int, segment: tuple) -> None:
+        """
+        Record parsed voice segment i while the script is still being generated.
+        
+        A recorded segment with the same text, host and timing keeps its status (so
+        its audio can be reused); anything else from i onwards is discarded.
+        """
+        with self._lock:
+            self._add_segment_locked(i, segment)
+            self._save_locked()
+    
+    def set_segments(self, segments: List[tuple]) -> None:
+        """Record the complete list of parsed voice segments; new ones start out pending."""
+        with self._lock:
+            for i, segment in enumerate(segments):
+                self._add_segment_locked(i, segment)
+            del self.data["segments"][len(segments):]
+            self.data["stage"] = "audio"
+            self._save_locked()
+    
+    def _add_segment_locked(self, i: int, segment: tuple) -> None:
+        text, host, timing_info = segment
+        records = self.data.get("segments")
+        if records is None:
+            records = self.data["segments"] = []
+        if i < len(records):
+            record = records[i]
+            if (record["text"], record["host"], record["timing"]) == (text, host, timing_info):
+                return
+            del records[i:]
+        records.append({"index": i, "text": text, "host": host, "timing": timing_info,
+                        "status": "pending", "file": None, "sha256": None})
+    
+    def voice_segments(self) -> Optional[List[tuple]]:
+        """The recorded segments as (text, host, timing_info) tuples, or None."""
+        if self.data.get("segments") is None:
+            return None
+        return [(s["text"], s["host"], s["timing"]) for s in self.data["segments"]]
+    
+    def completed_file(self, i: int) -> Optional[str]:
+        """
+        Path of segment i's audio if a previous run finished it and the file is intact.
+        """
+        records = self.data.get("segments") or []
+        if i >= len(records) or records[i]["status"] != "done" or not records[i]["file"]:
+            return None
+        filename = os.path.join(self.directory, records[i]["file"])
+        try:
+            with open(filename, "rb") as f:
+                intact = hashlib.sha256(f.read()).hexdigest() == records[i]["sha256"]
+        except OSError:
+            return None
+        return filename if intact else None
+    
+    def mark_segment(self, i: int, status: str, filename: Optional[str] = None) -> None:
+        """
+        Record the outcome of segment i.
+        
+        Args:
+            i: Segment index
+            status: "done" or "failed"
+            filename: Audio file of a finished segment (hashed for later verification)
+        """
+        sha256 = None
+        if filename is not None:
+            with open(filename, "rb") as f:
+                sha256 = hashlib.sha256(f.read()).hexdigest()
+        with self._lock:
+            record = self.data["segments"][i]
+            record.update(status=status, sha256=sha256,
+                          file=os.path.basename(filename) if filename else None)
+            self._save_locked()
+
+
+class ScriptSegment(NamedTuple):
+    """One voice segment parsed from a script."""
+    text: str
+    host: int  # 1-based host number from the [... Host N] marker
+    timing: str  # "normal" or "overlap"
+    section: Optional[str]  # Latest section label (INTRO, MAIN DISCUSSION, ...), if any
+
+
+class ScriptSegmentParser:
+    """
+    Single-pass, incremental parser turning script lines into ScriptSegment records.
+    
+    Each line is matched once against a compiled pattern that recognizes speaker
+    markers for any number of hosts with optional section labels ([Host 3],
+    [INTRO - Host 1], [RECAP - Host 2], ...), [OVERLAP - Host N] lines and legacy
+    simultaneous markers. A segment is yielded as soon as it is final: an overlap
+    line right away, a normal segment once the next marker starts (or the script
+    ends). Text can be fed line by line (iter_segments) or in arbitrary chunks such
+    as streamed completion tokens (feed/close).
+    """
+    
+    LINE_PATTERN = re.compile(r"""
+        \[(?:
+            (?P<skip>SIMULTANEOUS|Both\ -)                  # legacy simultaneous markers
+          | (?:(?P<label>[^\[\]]+?)\s+-\s+)?Host\s+(?P<host>\d+)\]   # [LABEL - Host N] / [Host N]
+        )""", re.VERBOSE)
+    
+    def __init__(self):
+        self.buffer = ""
+        self.parts = []  # Lines of the segment being accumulated
+        self.host = 1
+        self.section = None
+    
+    def iter_segments(self, lines):
+        """
+        Parse a stream of lines.
+        
+        Yields:
+            ScriptSegment records in script order, each as soon as it is final
+        """
+        yield from self._parse(lines)
+        yield from self.close()
+    
+    def feed(self, text: str) -> List[ScriptSegment]:
+        """
+        Add script text.
+        
+        Returns:
+            Segments completed by this text, in script order
+        """
+        self.buffer += text
+        *lines, self.buffer = self.buffer.split('\n')
+        return list(self._parse(lines))
+    
+    def close(self) -> List[ScriptSegment]:
+        """
+        Finish the script.
+        
+        Returns:
+            The segments still pending at the end of the script
+        """
+        ready = list(self._parse([self.buffer]))
+        self.buffer = ""
+        if self.parts:
+            ready.append(ScriptSegment(" ".join(self.parts), self.host, "normal", self.section))
+            self.parts = []
+        return ready
+    
+    def _parse(self, lines):
+        search = self.LINE_PATTERN.search
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            
+            match = search(line)
+            if match is None:
+                # Skip stage directions like [laughing], [also laughing], etc.
+                if line[0] != "[" or line[-1] != "]":
+                    self.parts.append(line)
+                continue
+            if match.group("skip"):
+                continue
+            
+            # A speaker marker finishes the segment in progress
+            if self.parts:
+                yield ScriptSegment(" ".join(self.parts), self.host, "normal", self.section)
+                self.parts = []
+            
+            self.host = int(match.group("host"))
+            label = match.group("label")
+            if label is not None and label.upper() == "OVERLAP":
+                text = line[match.end():].strip()
+                if text:
+                    yield ScriptSegment(text, self.host, "overlap", self.section)
+                continue
+            
+            if label is not None:
+                self.section = label
+            text = (line[:match.start()] + line[match.end():]).strip()
+            if text:
+                self.parts.append(text)
+
+
+class SegmentPacker:
+    """
+    Incremental packing of parsed script segments into TTS requests of a sensible size.
+    
+    Consecutive normal segments in the same voice and section are merged (joined
+    with a space) while they fit in max_chars, so a run of short turns costs one
+    round-trip instead of several. A segment longer than max_chars is split at
+    sentence boundaries (word boundaries for a single overlong sentence); its first
+    piece keeps the segment's timing and the rest are marked "continue", which the
+    mixer joins with a short sentence pause instead of a turn pause. Overlap
+    segments are never merged, so each one still lands on the end of the speech
+    it interrupts.
+    
+    Like ScriptSegmentParser, segments can be fed as they are parsed (feed/close);
+    a normal segment is held back until the next one shows whether it can grow.
+    
+    Packed segments carry the host number (of their first turn) rather than a
+    voice ID, so they stay valid when they are resumed with another provider's
+    voices; _synthesize_segments resolves the voice.
+    """
+    
+    # Whitespace after sentence-ending punctuation, optionally followed by up to two closing
+    # quotes or brackets
+    SENTENCE_BREAK = re.compile(r"""(?<=[.!?…])\s+|(?<=[.!?…]["')\]])\s+|(?<=[.!?…]["')\]]{2})\s+""")
+    
+    def __init__(self, voice_for, max_chars: Optional[int] = 2000):
+        """
+        Args:
+            voice_for: Callable mapping a 1-based host number to its voice ID (turns
+                of hosts sharing a voice can be merged)
+            max_chars: Character budget per TTS request (None or 0 disables packing)
+        """
+        self.voice_for = voice_for
+        self.max_chars = max_chars or None
+        self.pending = None  # [text, host, voice_id, section] of the normal segment being grown
+        self.parsed = 0
+        self.packed = 0
+    
+    def feed(self, segments: List[ScriptSegment]) -> List[tuple]:
+        """
+        Add parsed segments.
+        
+        Returns:
+            (text, host, timing_info) tuples that are final, in script order
+        """
+        ready = []
+        for segment in segments:
+            self.parsed += 1
+            if self.max_chars is None:
+                ready.append((segment.text, segment.host, segment.timing))
+                continue
+            
+            voice_id = self.voice_for(segment.host)
+            pending = self.pending
+            if (segment.timing == "normal" and pending is not None and pending[2] == voice_id
+                    and pending[3] == segment.section
+                    and len(pending[0]) + 1 + len(segment.text) <= self.max_chars):
+                pending[0] = f"{pending[0]} {segment.text}"
+                continue
+            
+            ready.extend(self._flush())
+            if segment.timing == "normal" and len(segment.text) <= self.max_chars:
+                self.pending = [segment.text, segment.host, voice_id, segment.section]
+            else:
+                ready.extend(self._split(segment.text, segment.host, segment.timing))
+        self.packed += len(ready)
+        return ready
+    
+    def close(self) -> List[tuple]:
+        """
+        Finish the script.
+        
+        Returns:
+            The segment still held back, if any
+        """
+        ready = self._flush()
+        self.packed += len(ready)
+        return ready
+    
+    def describe(self) -> str:
+        """One-line summary of the request count before and after packing."""
+        saved = self.parsed - self.packed
+        if self.parsed == 0 or saved == 0:
+            return f"{self.packed} TTS requests for {self.parsed} script segments"
+        change = "fewer" if saved > 0 else "more"
+        return (f"{self.packed} TTS requests for {self.parsed} script segments "
+                f"({abs(saved)} {change}, {abs(saved) / self.parsed:.0%})")
+    
+    def _flush(self) -> List[tuple]:
+        if self.pending is None:
+            return []
+        text, host, _, _ = self.pending
+        self.pending = None
+        return [(text, host, "normal")]
+    
+    def _split(self, text: str, host: int, timing_info: str) -> List[tuple]:
+        """Cut text into pieces of at most max_chars, preferring sentence boundaries."""
+        pieces = []
+        current = ""
+        for sentence in self.SENTENCE_BREAK.split(text):
+            while len(sentence) > self.max_chars:
+                # A single sentence over budget is cut at the last word boundary that fits
+                cut = sentence.rfind(" ", 0, self.max_chars + 1)
+                if cut <= 0:
+                    cut = self.max_chars
+                if current:
+                    pieces.append(current)
+                    current = ""
+                pieces.append(sentence[:cut].rstrip())
+                sentence = sentence[cut:].lstrip()
+            if not sentence:
+                continue
+            if current and len(current) + 1 + len(sentence) > self.max_chars:
+                pieces.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}" if current else sentence
+        if current:
+            pieces.append(current)
+        return [(piece, host, timing_info if n == 0 else "continue") for n, piece in enumerate(pieces)]
+
+
+class TTSProvider:
+    """
+    A text-to-speech backend the generator can synthesize segments with.
+    
+    Subclasses wrap one provider's synthesis call and name its two host voices, so
+    a segment written for one provider's voice can be sent to another provider
+    (see map_voice). Register extra backends in AIPodcastGenerator.tts_backends.
+    """
+    
+    name = ""
+    label = ""
+    
+    def __init__(self, generator: 'AIPodcastGenerator'):
+        self.generator = generator
+    
+    def host_voices(self) -> tuple:
+        """Voice IDs of host 1 and host 2."""
+        raise NotImplementedError
+    
+    def max_outstanding(self) -> Optional[int]:
+        """Segments that may be in flight at once, if more than tts_concurrency."""
+        return None
+    
+    def synthesize(self, text: str, voice_id: str,
+                   cancel_event: Optional[threading.Event] = None) -> Optional[bytes]:
+        """Audio bytes in the generator's audio format, or None on failure."""
+        raise NotImplementedError
+    
+    def map_voice(self, voice_id: str, source: 'TTSProvider') -> str:
+        """This provider's voice for the host that voice_id (one of source's voices) belongs to."""
+        source_voices = source.host_voices()
+        host = source_voices.index(voice_id) if voice_id in source_voices else 1
+        return self.host_voices()[host]
+
+
+class ElevenLabsProvider(TTSProvider):
+    name = "elevenlabs"
+    label = "ElevenLabs"
+    
+    def host_voices(self) -> tuple:
+        return self.generator.elevenlabs_host_1, self.generator.elevenlabs_host_2
+    
+    def synthesize(self, text: str, voice_id: str,
+                   cancel_event: Optional[threading.Event] = None) -> Optional[bytes]:
+        return self.generator.synthesize_elevenlabs(text, voice_id, cancel_event=cancel_event)
+
+
+class PlayhtProvider(TTSProvider):
+    name = "playht"
+    label = "Play.ht"
+    
+    def host_voices(self) -> tuple:
+        return self.generator.playht_host_1, self.generator.playht_host_2
+    
+    def max_outstanding(self) -> Optional[int]:
+        # A worker waiting on a Play.ht job isn't using the API (its governor still limits requests)
+        return self.generator.playht_max_outstanding
+    
+    def synthesize(self, text: str, voice_id: str,
+                   cancel_event: Optional[threading.Event] = None) -> Optional[bytes]:
+        return self.generator.synthesize_playht(text, voice_id, cancel_event=cancel_event)
+
+
+class HedgePolicy:
+    """
+    When to send a duplicate (hedge) request to the secondary TTS provider.
+    
+    The deadline is a percentile of the primary provider's recent latencies, so only
+    the slowest requests are duplicated. Until enough latencies have been observed,
+    initial_delay is used.
+    """
+    
+    def __init__(self, percentile: float = 90.0, initial_delay: float = 5.0, min_delay: float = 0.5,
+                 max_delay: float = 20.0, window: int = 100, min_samples: int = 5):
+        """
+        Args:
+            percentile: Percentile of primary latencies after which a request is hedged
+            initial_delay: Deadline in seconds before min_samples latencies are known
+            min_delay: Lower bound for the deadline
+            max_delay: Upper bound for the deadline
+            window: Number of recent latencies the percentile is taken over
+            min_samples: Latencies needed before the percentile is used
+        """
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+    
+    def record(self, seconds: float) -> None:
+        """Record how long a primary request took."""
+        with self._lock:
+            self._latencies.append(seconds)
+    
+    def delay(self) -> float:
+        """Seconds to wait for the primary before hedging."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if len(latencies) < self.min_samples:
+            return self.initial_delay
+        index = min(len(latencies) - 1, int(len(latencies) * self.percentile / 100))
+        return min(self.max_delay, max(self.min_delay, latencies[index]))
+
 
 class AIPodcastGenerator:
-    def __init__(self, elevenlabs_api_key: str, playht_api_key: str = None, playht_user_id: str = None, openai_api_key: str = None):
+    def __init__(self, elevenlabs_api_key: str, playht_api_key: str = None, playht_user_id: str = None, openai_api_key: str = None,
+                 tts_concurrency: int = 4, cache_dir: Optional[str] = None,
+                 cache_max_bytes: int = 500 * 1024 * 1024, use_cache: bool = True):
         """
         Initialize the AI Podcast Generator with API keys.
         
@@ -34,19 +1812,88 @@ class AIPodcastGenerator:
             playht_api_key: Play.ht API key (optional, for future use)
             playht_user_id: Play.ht user ID (optional, for future use)
             openai_api_key: OpenAI API key for script generation
+            tts_concurrency: Number of segments to synthesize in parallel
+            cache_dir: Root directory for persistent caches (defaults to ~/.cache/calmi)
+            cache_max_bytes: Size budget for the TTS audio cache
+            use_cache: Whether to reuse previously synthesized audio and OpenAI responses
         """
         self.elevenlabs_api_key = elevenlabs_api_key
         self.playht_api_key = playht_api_key
         self.playht_user_id = playht_user_id
+        self.tts_concurrency = max(1, tts_concurrency)
+        
+        # OpenAI client, created on first use (see openai_client)
+        self.openai_api_key = openai_api_key
+        self._openai_client = None
+        self._openai_lock = threading.Lock()
+        self.openai_model = "gpt-3.5-turbo"
+        self.openai_temperature = 0.7
         
-        # Initialize OpenAI client
-        self.openai_client = None
-        if openai_api_key:
-            self.openai_client = OpenAI(api_key=openai_api_key)
-            print("✅ OpenAI client initialized")
+        # Transcripts estimated above analysis_max_tokens are analyzed map-reduce style,
+        # in chunks of about analysis_chunk_tokens with analysis_concurrency parallel calls
+        self.analysis_max_tokens = 6000
+        self.analysis_chunk_tokens = 3000
+        self.analysis_concurrency = 4
+        
+        # Example scripts are loaded once and cut into excerpts; each script prompt gets
+        # the excerpts most relevant to the episode's themes within example_token_budget
+        self.example_token_budget = 1200
+        self.example_excerpt_turns = 3
+        self.prompt_tokens_saved = 0  # Running total across episodes
+        self._example_scripts = None
+        self._example_excerpts = None
+        self._examples_lock = threading.Lock()
         
         # ElevenLabs API endpoints
         self.elevenlabs_base_url = "https://api.elevenlabs.io/v1"
+        self.playht_base_url = "https://api.play.ht/api/v2"
+        
+        # Stage and provider-request spans (recorded only when enabled, e.g. by --metrics-out)
+        self.metrics = Metrics()
+        
+        # Shared keep-alive session (with timeouts and retry/backoff) for all provider calls;
+        # sized by _http_pool_size once the Play.ht settings below are known
+        self.http = ProviderSession(pool_size=self.tts_concurrency + 4, metrics=self.metrics)
+        self.elevenlabs_model_id = "eleven_monolingual_v1"
+        
+        # Enhanced voice settings for more natural inflections
+        self.elevenlabs_voice_settings = {
+            "stability": 0.3,  # Lower stability for more variation
+            "similarity_boost": 0.7,  # Higher similarity for consistent voice
+            "style": 0.8,  # Add style for more expressive speech
+            "use_speaker_boost": True  # Enhance speaker clarity
+        }
+        
+        # Play.ht synthesis settings
+        self.playht_quality = "premium"
+        self.playht_voice_settings = {
+            "output_format": "mp3",
+            "speed": 1.0,
+            "sample_rate": 24000
+        }
+        
+        # Play.ht jobs for every segment are submitted up front (up to playht_max_outstanding)
+        # and all polled by one shared poller
+        self.playht_max_outstanding = 32
+        self.playht_poller = PlayhtJobPoller(self.http)
+        self.http.resize(self._http_pool_size())
+        
+        # Per-provider admission control (quotas, adaptive concurrency, character accounting).
+        # Play.ht runs more workers than tts_concurrency, but its requests still go through here
+        self.governors = {name: ProviderGovernor(name, max_concurrency=self.tts_concurrency)
+                          for name in ("elevenlabs", "playht")}
+        self.http.on_throttle = self._on_throttle
+        
+        # Persistent cache of synthesized audio, keyed on provider/voice/settings/text
+        self.tts_cache = None
+        if use_cache:
+            self.tts_cache = DiskCache(os.path.join(cache_dir or DEFAULT_CACHE_DIR, "tts"), cache_max_bytes)
+        
+        # Persistent cache of OpenAI responses, keyed on transcript/model/temperature/prompt version
+        self.llm_cache = None
+        if use_cache:
+            self.llm_cache = DiskCache(os.path.join(cache_dir or DEFAULT_CACHE_DIR, "llm"), LLM_CACHE_MAX_BYTES)
+        self.refresh_llm_cache = False  # Ignore cached responses (fresh ones are still stored)
         
         # Voice IDs for podcast hosts (you can change these)
         # ElevenLabs voices
@@ -60,9 +1907,49 @@ class AIPodcastGenerator:
         # Default to ElevenLabs (more reliable)
         self.host_1_voice_id = self.elevenlabs_host_1
         self.host_2_voice_id = self.elevenlabs_host_2
+        self.host_voice_ids = {}  # Extra voices by host number (e.g. {3: voice_id}) for multi-host scripts
         
         # TTS provider preference - default to ElevenLabs
         self.tts_provider = "elevenlabs"
+        self.tts_backends = {"elevenlabs": ElevenLabsProvider(self), "playht": PlayhtProvider(self)}
+        
+        # Provider tried when the primary fails (default: ElevenLabs behind Play.ht). With a
+        # hedge_policy, it also gets a duplicate request once the primary is slower than the
+        # policy's deadline; the first result wins
+        self.secondary_tts_provider = None
+        self.hedge_policy = None
+        
+        # Audio pipeline: "mp3" downloads MP3 files into the job's segments dir, "pcm"
+        # keeps raw PCM segments in memory and skips the per-segment ffmpeg decode
+        self.audio_format = "mp3"
+        self.pcm_sample_rate = 24000
+        self.keep_segment_files = False  # Keep segment files (PCM as WAV) after the job
+        self.checkpoint_pcm_segments = False  # Write PCM segments as WAV so synthesis can resume
+        
+        # Before mixing, segments are decoded, trimmed and measured in a pool of mix_workers
+        # processes (started on first use) once an episode has mix_pool_min_segments
+        self.mix_workers = os.cpu_count() or 1
+        self.mix_pool_min_segments = 8
+        self._mix_pool = None
+        self._mix_pool_lock = threading.Lock()
+        
+        # Each job synthesizes into its own Workspace under this directory
+        self.work_dir = DEFAULT_WORK_DIR
+        self.resume = True  # Pick up an interrupted episode from its manifest checkpoints
+        
+        # Stream the script from OpenAI and start TTS on each segment as soon as it is parsed
+        self.pipeline_script = False
+        
+        # Character budget per TTS request: short same-voice turns are merged up to it and
+        # longer ones split at sentence boundaries (None or 0 sends every turn as parsed)
+        self.segment_char_budget = 2000
+        
+        # Get the analysis and the script from one combined request (two requests as fallback)
+        self.single_request = False
+        
+        # Progressive output: encode each final prefix of the episode while synthesis continues
+        self.stream_output = False
+        self.stream_format = None  # "mp3" or "opus"; defaults to the output file extension
         
         # Only use Play.ht if explicitly requested and credentials available
         if playht_api_key and playht_user_id:
@@ -77,6 +1964,52 @@ class AIPodcastGenerator:
             "total_target_duration": 540  # 9 minutes total
         }
     
+    def _http_pool_size(self, episodes: int = 1) -> int:
+        """
+        Pooled connections per host needed so no request waits for (or discards) a connection.
+        
+        Every TTS worker may hold one: with Play.ht that is up to playht_max_outstanding
+        job creations and CDN downloads per episode, plus the poller's status requests.
+        Connections are only opened on demand, so a generous pool costs nothing.
+        
+        Args:
+            episodes: Episodes synthesized concurrently through the shared session
+        """
+        workers = max(self.tts_concurrency, self.playht_max_outstanding)
+        return workers * episodes + self.playht_poller.poll_workers
+    
+    @property
+    def openai_client(self):
+        """
+        The OpenAI client, created on first use.
+        
+        The SDK is only imported when a request is actually made, so runs served from
+        the response cache (or that never call OpenAI) skip its import cost.
+        
+        Returns:
+            The client, or None without an OpenAI API key
+        """
+        if self._openai_client is None and self.openai_api_key:
+            with self._openai_lock:
+                if self._openai_client is None:
+                    try:
+                        from openai import OpenAI
+                    except ImportError:
+                        raise ImportError("The openai package is required for analysis and script "
+                                          "generation: pip install -r requirements.txt")
+                    self._openai_client = OpenAI(api_key=self.openai_api_key)
+                    print("✅ OpenAI client initialized")
+        return self._openai_client
+    
+    @openai_client.setter
+    def openai_client(self, client) -> None:
+        self._openai_client = client
+    
+    @property
+    def has_openai(self) -> bool:
+        """Whether OpenAI requests are available (checked without importing the SDK)."""
+        return self._openai_client is not None or bool(self.openai_api_key)
+    
     def analyze_conversation(self, transcript: str) -> Dict:
         """
         Analyze the conversation transcript using OpenAI to extract deep insights.
@@ -94,56 +2027,124 @@ class AIPodcastGenerator:
         """
         Use OpenAI to analyze the conversation transcript.
         
+        Transcripts that fit the single-shot token budget are analyzed in one call.
+        Longer ones are split into chunks that are analyzed concurrently (map) and
+        then merged into one analysis with the same fields (reduce).
+        
         Args:
             transcript: The conversation transcript text
             
         Returns:
             Dictionary containing analysis results
         """
-        analysis_prompt = f"""
+        cache_key = self._llm_cache_key("analysis", transcript)
+        cached = self._load_cached_response(cache_key)
+        if cached is not None:
+            print("♻️  Reused cached conversation analysis")
+            return json.loads(cached)
+        
+        transcript_tokens = estimate_tokens(transcript)
+        if transcript_tokens <= self.analysis_max_tokens:
+            analysis = self._request_analysis(self._analysis_prompt(transcript))
+        else:
+            analysis = self._map_reduce_analysis(transcript, transcript_tokens)
+        
+        self._store_response(cache_key, json.dumps(analysis))
+        print("✅ OpenAI conversation analysis complete")
+        return analysis
+    
+    def _analysis_prompt(self, transcript: str, part: Optional[tuple] = None) -> str:
+        """
+        Build the analysis prompt for a transcript, or for part (i, n) of a long one.
+        """
+        heading = "Transcript:" if part is None else (
+            f"Transcript (part {part[0]} of {part[1]} of a longer conversation; analyze this part):")
+        return f"""
 Analyze this personal conversation transcript and provide therapeutic insights. Be deeply empathetic and therapeutically informed.
 
-Transcript:
+{heading}
 {transcript}
 
-Please provide a JSON response with these exact fields:
-- "core_themes": List of 2-3 main psychological/emotional themes
-- "emotional_patterns": Key emotional patterns you notice
-- "therapeutic_insights": 3-4 specific therapeutic observations
-- "philosophical_angles": 2-3 deeper life questions or philosophical themes
-- "reframing_opportunities": Specific ways to reframe challenges positively
-- "growth_indicators": Signs of resilience, self-awareness, or growth
-- "support_suggestions": Practical support or coping strategies
-
+{ANALYSIS_FIELDS_PROMPT}
 Focus on being compassionate, insightful, and therapeutically informed. Return ONLY valid JSON.
 """
-            
-        response = self.openai_client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "You are a compassionate therapist and philosopher analyzing conversations to provide deep insights. Always respond with valid JSON only."},
-                {"role": "user", "content": analysis_prompt}
-            ],
-            temperature=0.7,
-            max_tokens=1000
-        )
+    
+    def _request_analysis(self, prompt: str) -> Dict:
+        """
+        Run one analysis chat completion and parse it into the analysis schema.
         
-        analysis_text = response.choices[0].message.content.strip()
+        Returns:
+            Dictionary containing every field in ANALYSIS_FIELDS
+        """
+        with self.metrics.span("openai.analysis", prompt_chars=len(prompt)) as span:
+            response = self.openai_client.chat.completions.create(
+                model=self.openai_model,
+                messages=[
+                    {"role": "system", "content": "You are a compassionate therapist and philosopher analyzing conversations to provide deep insights. Always respond with valid JSON only."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=self.openai_temperature,
+                max_tokens=1000
+            )
+            analysis_text = response.choices[0].message.content.strip()
+            span.add(completion_chars=len(analysis_text))
         
         # Parse JSON response
         analysis = json.loads(analysis_text)
         
         # Validate required fields
-        required_fields = ["core_themes", "emotional_patterns", "therapeutic_insights", 
-                            "philosophical_angles", "reframing_opportunities", "growth_indicators", "support_suggestions"]
-        
-        for field in required_fields:
+        for field in ANALYSIS_FIELDS:
             if field not in analysis:
                 analysis[field] = []
         
-        print("✅ OpenAI conversation analysis complete")
         return analysis
+    
+    def _map_reduce_analysis(self, transcript: str, transcript_tokens: int) -> Dict:
+        """
+        Analyze a long transcript chunk by chunk and merge the partial analyses.
+        
+        Chunk analyses are cached individually, so an interrupted run only repeats
+        the chunks that did not finish.
+        
+        Args:
+            transcript: The conversation transcript text
+            transcript_tokens: Estimated token count of the transcript
+            
+        Returns:
+            Dictionary containing analysis results
+        """
+        chunks = split_transcript(transcript, self.analysis_chunk_tokens)
+        print(f"   Long transcript (~{transcript_tokens} tokens): analyzing {len(chunks)} chunks in parallel")
+        
+        def analyze_chunk(i: int) -> Dict:
+            cache_key = self._llm_cache_key("analysis_chunk", chunks[i], i, len(chunks))
+            cached = self._load_cached_response(cache_key)
+            if cached is not None:
+                return json.loads(cached)
+            partial = self._request_analysis(self._analysis_prompt(chunks[i], (i + 1, len(chunks))))
+            self._store_response(cache_key, json.dumps(partial))
+            return partial
+        
+        workers = max(1, min(self.analysis_concurrency, len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="analysis") as executor:
+            partials = list(executor.map(analyze_chunk, range(len(chunks))))
+        
+        # Reduce: let the model consolidate the partial analyses, or merge them locally
+        reduce_prompt = f"""
+These are analyses of consecutive parts of one long personal conversation. Merge them into a single analysis of the whole conversation: consolidate overlapping points, keep what matters most, and keep the same fields.
 
+Partial analyses:
+{json.dumps(partials, indent=1)}
+
+{ANALYSIS_FIELDS_PROMPT}
+Return ONLY valid JSON.
+"""
+        try:
+            return self._request_analysis(reduce_prompt)
+        except Exception as e:
+            print(f"⚠️ Analysis reduce step failed ({str(e)}); merging chunk analyses locally")
+            return merge_analyses(partials)
+    
     def generate_podcast_script(self, transcript: str, analysis: Dict) -> str:
         """
         Generate a dynamic, conversational podcast script with overlapping dialogue.
@@ -186,20 +2187,100 @@ Focus on being compassionate, insightful, and therapeutically informed. Return O
         """
         return self._openai_script_generation(transcript, analysis)
     
-    def _load_example_scripts(self) -> str:
-        """Load example scripts from the scripts/ directory to provide context."""
-        example_scripts = []
-        script_files = ["fear_of_success_script.txt", "relationship_patterns_script.txt", "crisis_support_script.txt"]
+    def _load_example_scripts(self) -> List[tuple]:
+        """
+        Load example scripts from the package's scripts/ directory to provide context.
         
-        for script_file in script_files:
-            try:
-                with open(f"scripts/{script_file}", 'r') as f:
-                    content = f.read()
-                    example_scripts.append(f"=== {script_file.replace('_', ' ').replace('.txt', '').title()} ===\n{content}")
-            except FileNotFoundError:
+        The files are read once per generator.
+        
+        Returns:
+            List of (title, content) tuples
+        """
+        with self._examples_lock:
+            if self._example_scripts is None:
+                example_scripts = []
+                script_files = ["fear_of_success_script.txt", "relationship_patterns_script.txt", "crisis_support_script.txt"]
+                
+                for script_file in script_files:
+                    try:
+                        with open(os.path.join(SCRIPTS_DIR, script_file), 'r') as f:
+                            content = f.read()
+                            example_scripts.append((script_file.replace('_', ' ').replace('.txt', '').title(), content))
+                    except FileNotFoundError:
+                        continue
+                
+                self._example_scripts = example_scripts
+                self._example_excerpts = self._split_example_excerpts(example_scripts)
+        return self._example_scripts
+    
+    def _split_example_excerpts(self, example_scripts: List[tuple]) -> List[Dict]:
+        """
+        Cut the example scripts into excerpts of a few consecutive speaker turns.
+        
+        Returns:
+            List of excerpt dictionaries (script, position, kind, text, tokens, words)
+        """
+        excerpts = []
+        for script_index, (title, content) in enumerate(example_scripts):
+            turns = [turn.strip() for turn in re.split(r'\n(?=\[)', content.strip()) if turn.strip()]
+            for position in range(0, len(turns), self.example_excerpt_turns):
+                text = "\n\n".join(turns[position:position + self.example_excerpt_turns])
+                kind = "intro" if "[INTRO" in text else "outro" if "[OUTRO" in text else "body"
+                excerpts.append({
+                    "script": script_index,
+                    "title": title,
+                    "position": position,
+                    "kind": kind,
+                    "text": text,
+                    "tokens": estimate_tokens(text),
+                    "words": set(re.findall(r"[a-z]{4,}", text.lower()))
+                })
+        return excerpts
+    
+    def _select_example_context(self, themes: List[str]) -> tuple:
+        """
+        Pick the example excerpts most relevant to the episode's themes within the token budget.
+        
+        One intro and one outro excerpt are always included so the model sees how an
+        episode opens and closes; the rest of the budget goes to the excerpts sharing
+        the most words with the core themes.
+        
+        Args:
+            themes: core_themes from the analysis
+        
+        Returns:
+            (context, full_tokens) tuple: the example context for the prompt and the
+            estimated size of the full, unabridged example scripts
+        """
+        example_scripts = self._load_example_scripts()
+        full_tokens = estimate_tokens("\n\n".join(f"=== {title} ===\n{content}" for title, content in example_scripts))
+        
+        # Compare word stems so "anxiety" matches "anxious", "relationship" matches "relationships"
+        theme_stems = {word[:5] for theme in themes for word in re.findall(r"[a-z]{4,}", str(theme).lower())}
+        
+        def relevance(excerpt: Dict) -> float:
+            hits = sum(1 for word in excerpt["words"] if word[:5] in theme_stems)
+            return hits + (0.5 if "[OVERLAP" in excerpt["text"] else 0.0)
+        
+        ranked = sorted(self._example_excerpts, key=relevance, reverse=True)
+        chosen = [next((e for e in ranked if e["kind"] == kind), None) for kind in ("intro", "outro")]
+        chosen = [excerpt for excerpt in chosen if excerpt is not None]
+        used_tokens = sum(excerpt["tokens"] for excerpt in chosen)
+        for excerpt in ranked:
+            if excerpt in chosen or used_tokens + excerpt["tokens"] > self.example_token_budget:
                 continue
+            chosen.append(excerpt)
+            used_tokens += excerpt["tokens"]
         
-        return "\n\n".join(example_scripts)
+        # Present the excerpts in script order, grouped under their script's title
+        chosen.sort(key=lambda excerpt: (excerpt["script"], excerpt["position"]))
+        sections = []
+        for excerpt in chosen:
+            if not sections or sections[-1][0] != excerpt["script"]:
+                sections.append((excerpt["script"], f"=== {excerpt['title']} (excerpts) ===", []))
+            sections[-1][2].append(excerpt["text"])
+        context = "\n\n".join(f"{heading}\n" + "\n\n[...]\n\n".join(texts) for _, heading, texts in sections)
+        return context, full_tokens
 
     def _openai_script_generation(self, transcript: str, analysis: Dict) -> str:
         """
@@ -212,9 +2293,88 @@ Focus on being compassionate, insightful, and therapeutically informed. Return O
         Returns:
             Generated podcast script
         """
-        # Load example scripts for context
-        example_scripts = self._load_example_scripts()
+        cache_key, messages, prompt_stats = self._script_request(transcript, analysis)
+        cached = self._load_cached_response(cache_key)
+        if cached is not None:
+            print("♻️  Reused cached podcast script")
+            return cached
+        self._report_prompt_stats(prompt_stats)
+        
+        with self.metrics.span("openai.script", prompt_tokens=prompt_stats["prompt_tokens"]) as span:
+            response = self.openai_client.chat.completions.create(
+                model=self.openai_model,
+                messages=messages,
+                temperature=self.openai_temperature,
+                max_tokens=2500
+            )
+            script = response.choices[0].message.content.strip()
+            span.add(completion_chars=len(script))
+        self._store_response(cache_key, script)
+        print("✅ OpenAI script generation complete (with example context)")
+        return script
+    
+    def _stream_script_generation(self, transcript: str, analysis: Dict):
+        """
+        Generate the podcast script as a streamed chat completion.
+        
+        Args:
+            transcript: The original conversation transcript
+            analysis: Analysis results from analyze_conversation
+            
+        Yields:
+            Script text chunks as they arrive (a cached script arrives as one chunk)
+        """
+        cache_key, messages, prompt_stats = self._script_request(transcript, analysis)
+        cached = self._load_cached_response(cache_key)
+        if cached is not None:
+            print("♻️  Reused cached podcast script")
+            yield cached
+            return
+        self._report_prompt_stats(prompt_stats)
+        
+        # Recorded by hand rather than as an open span: the consumer runs its own
+        # spans on this thread between chunks
+        span = self.metrics.span("openai.script_stream", prompt_tokens=prompt_stats["prompt_tokens"])
+        started = time.perf_counter()
+        stream = self.openai_client.chat.completions.create(
+            model=self.openai_model,
+            messages=messages,
+            temperature=self.openai_temperature,
+            max_tokens=2500,
+            stream=True
+        )
+        
+        parts = []
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            text = chunk.choices[0].delta.content
+            if text:
+                if not parts:
+                    span.set(first_token_s=round(time.perf_counter() - started, 6))
+                parts.append(text)
+                yield text
+        
+        span.add(completion_chars=sum(len(part) for part in parts))
+        self.metrics.record(span, started)
+        self._store_response(cache_key, "".join(parts).strip())
+        print("✅ OpenAI script generation complete (streamed, with example context)")
+    
+    def _report_prompt_stats(self, prompt_stats: Dict) -> None:
+        """Print the script prompt's size and what excerpting the examples saved."""
+        with self._examples_lock:
+            self.prompt_tokens_saved += prompt_stats["example_tokens_saved"]
+        print(f"   Script prompt: ~{prompt_stats['prompt_tokens']} tokens "
+              f"(examples ~{prompt_stats['example_tokens']}, ~{prompt_stats['example_tokens_saved']} saved by excerpting)")
+    
+    def _script_request(self, transcript: str, analysis: Dict) -> tuple:
+        """
+        Build the script-generation chat messages and their response cache key.
         
+        Returns:
+            (cache_key, messages, prompt_stats) tuple; prompt_stats holds estimated
+            prompt and example-context tokens and the tokens saved by excerpting
+        """
         # Prepare context from analysis
         themes = analysis.get('core_themes', [])
         insights = analysis.get('therapeutic_insights', [])
@@ -222,10 +2382,17 @@ Focus on being compassionate, insightful, and therapeutically informed. Return O
         reframes = analysis.get('reframing_opportunities', [])
         growth = analysis.get('growth_indicators', [])
         
+        # Only the example excerpts most relevant to this episode, within a token budget
+        example_scripts, full_tokens = self._select_example_context(themes)
+        example_tokens = estimate_tokens(example_scripts)
+        
+        # The script depends on the analysis and the examples as well as the transcript
+        cache_key = self._llm_cache_key("script", transcript, analysis, example_scripts)
+        
         script_prompt = f"""
 Create a warm, empathetic podcast script for "Deep Reflections" hosted by Sarah and Rachel, following the style and format of the examples below.
 
-EXAMPLE SCRIPTS (for style reference):
+EXAMPLE SCRIPT EXCERPTS (for style reference):
 {example_scripts}
 
 ORIGINAL CONVERSATION TO ANALYZE:
@@ -237,52 +2404,214 @@ ANALYSIS INSIGHTS:
 - Philosophical angles: {'; '.join(philosophical) if philosophical else 'the journey of becoming'}
 - Growth signs: {'; '.join(growth) if growth else 'vulnerability and self-reflection'}
 
-REQUIREMENTS:
-1. Use the EXACT same format markers as the examples: [INTRO - Host 1], [Host 2], [OVERLAP - Host 1], [OUTRO - Host 2], etc.
-2. Make it deeply personal and specific to THIS conversation - reference actual quotes and moments
-3. Include therapeutic reframes and philosophical insights like the examples
-4. Feel warm, conversational, and sometimes overlapping like real friends talking
-5. Sarah (Host 1) tends to be more philosophical, Rachel (Host 2) more therapeutic
-6. Address the specific struggles and growth signs from this person's sharing
-7. End with genuine encouragement and wisdom
-8. Match the natural flow and conversational style of the examples
-
+{SCRIPT_REQUIREMENTS_PROMPT}
 Create a script that feels like it was written by the same caring hosts who wrote the examples.
 """
             
-        response = self.openai_client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "You are a script writer for the therapeutic podcast 'Deep Reflections.' Study the example scripts carefully and create a new script that matches their warmth, insight, and conversational flow exactly. Always use the same format markers and maintain the caring, therapeutic tone."},
-                {"role": "user", "content": script_prompt}
-            ],
-            temperature=0.7,
-            max_tokens=2500
-        )
+        messages = [
+            {"role": "system", "content": "You are a script writer for the therapeutic podcast 'Deep Reflections.' Study the example scripts carefully and create a new script that matches their warmth, insight, and conversational flow exactly. Always use the same format markers and maintain the caring, therapeutic tone."},
+            {"role": "user", "content": script_prompt}
+        ]
+        prompt_stats = {
+            "prompt_tokens": estimate_tokens(script_prompt),
+            "example_tokens": example_tokens,
+            "example_tokens_saved": max(0, full_tokens - example_tokens)
+        }
+        return cache_key, messages, prompt_stats
+    
+    def generate_analysis_and_script(self, transcript: str) -> Optional[tuple]:
+        """
+        Analyze the conversation and write the podcast script in a single request.
         
-        script = response.choices[0].message.content.strip()
-        print("✅ OpenAI script generation complete (with example context)")
-        return script
+        One JSON-mode chat completion returns both the analysis object and the
+        script, so the transcript is sent (and waited on) once instead of twice.
+        
+        Args:
+            transcript: The conversation transcript text
+            
+        Returns:
+            (analysis, script) tuple, or None if the combined response is malformed
+            (callers then fall back to analyze_conversation + generate_podcast_script)
+        """
+        # Themes aren't known yet, so pick example excerpts by overlap with the transcript
+        example_scripts, full_tokens = self._select_example_context([transcript])
+        cache_key = self._llm_cache_key("analysis_and_script", transcript, example_scripts)
+        
+        combined_text = self._load_cached_response(cache_key)
+        if combined_text is not None:
+            print("♻️  Reused cached analysis and script")
+        else:
+            combined_prompt = f"""
+Analyze this personal conversation transcript, then write a podcast episode about it. Be deeply empathetic and therapeutically informed.
+
+Transcript:
+{transcript}
+
+Return a JSON object with exactly two keys:
+- "analysis": an object with the fields below
+- "script": the complete podcast script as a single string
+
+For "analysis": {ANALYSIS_FIELDS_PROMPT}
+For "script": Create a warm, empathetic podcast script for "Deep Reflections" hosted by Sarah and Rachel, grounded in your analysis and following the style and format of the examples below.
+
+EXAMPLE SCRIPT EXCERPTS (for style reference):
+{example_scripts}
+
+{SCRIPT_REQUIREMENTS_PROMPT}
+Return ONLY valid JSON.
+"""
+            self._report_prompt_stats({
+                "prompt_tokens": estimate_tokens(combined_prompt),
+                "example_tokens": estimate_tokens(example_scripts),
+                "example_tokens_saved": max(0, full_tokens - estimate_tokens(example_scripts))
+            })
+            try:
+                with self.metrics.span("openai.analysis_and_script", prompt_chars=len(combined_prompt)) as span:
+                    response = self.openai_client.chat.completions.create(
+                        model=self.openai_model,
+                        messages=[
+                            {"role": "system", "content": "You are a compassionate therapist and philosopher, and the script writer for the therapeutic podcast 'Deep Reflections.' Match the warmth, format markers and conversational flow of the example scripts exactly. Always respond with valid JSON only."},
+                            {"role": "user", "content": combined_prompt}
+                        ],
+                        temperature=self.openai_temperature,
+                        max_tokens=3500,
+                        response_format={"type": "json_object"}
+                    )
+                    combined_text = response.choices[0].message.content.strip()
+                    span.add(completion_chars=len(combined_text))
+            except Exception as e:
+                # e.g. a model without JSON mode; the two-request path still works
+                print(f"⚠️ Combined analysis/script request failed ({str(e)}); using two requests")
+                return None
+        
+        # Validate: both parts present and the script actually parses into voice segments
+        try:
+            combined = json.loads(combined_text)
+            analysis = combined["analysis"]
+            script = combined["script"].strip()
+            if not isinstance(analysis, dict) or not self.split_script_for_voices(script):
+                raise ValueError("empty analysis or script")
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            print(f"⚠️ Combined analysis/script response was malformed ({str(e)}); using two requests")
+            return None
+        
+        for field in ANALYSIS_FIELDS:
+            if field not in analysis:
+                analysis[field] = []
+        self._store_response(cache_key, combined_text)
+        print("✅ OpenAI analysis and script complete (single request)")
+        return analysis, script
+    
+    def _llm_cache_key(self, kind: str, transcript: str, *context) -> str:
+        """
+        Build the cache key for an OpenAI response.
+        
+        Args:
+            kind: Which call the response belongs to ("analysis", "script", ...)
+            transcript: The conversation transcript (hashed)
+            context: Any further prompt inputs the response depends on
+        """
+        transcript_sha256 = hashlib.sha256(transcript.encode("utf-8")).hexdigest()
+        return DiskCache.make_key("openai", kind, PROMPT_VERSION, self.openai_model,
+                                  self.openai_temperature, transcript_sha256, context)
+    
+    def _load_cached_response(self, cache_key: str) -> Optional[str]:
+        """
+        Look up a previously generated OpenAI response.
+        
+        Returns:
+            The cached response text, or None on a miss (or with caching disabled or refreshing)
+        """
+        if self.llm_cache is None or self.refresh_llm_cache:
+            return None
+        response = self.llm_cache.get(cache_key)
+        if response is None:
+            return None
+        self.metrics.add(llm_cache_hits=1)
+        return response.decode("utf-8")
+    
+    def _store_response(self, cache_key: str, response: str) -> None:
+        """Remember an OpenAI response for identical future requests."""
+        if self.llm_cache is not None:
+            self.llm_cache.put(cache_key, response.encode("utf-8"))
+    
+    
+    def _tts_cache_key(self, provider: str, voice_id: str, model_id: str, voice_settings: Dict, text: str) -> str:
+        """
+        Build the TTS cache key for a synthesis request.
+        
+        Whitespace is collapsed so cosmetic script edits still hit the cache.
+        """
+        normalized_text = " ".join(text.split())
+        return DiskCache.make_key(provider, voice_id, model_id, voice_settings, self.audio_format, normalized_text)
+    
+    def _load_cached_audio(self, cache_key: str) -> Optional[bytes]:
+        """
+        Look up previously synthesized audio.
+        
+        Returns:
+            The cached audio bytes, or None on a miss (or with caching disabled)
+        """
+        if self.tts_cache is None:
+            return None
+        
+        audio = self.tts_cache.get(cache_key)
+        if audio is not None:
+            self.metrics.add(cache_hits=1)
+            print(f"♻️  Reused cached audio ({len(audio)} bytes)")
+        return audio
     
+    def _write_audio(self, audio: bytes, filename: str) -> None:
+        """Write synthesized audio to disk (as WAV when running in PCM mode)."""
+        with self.metrics.span("write_segment", bytes=len(audio)):
+            if self.audio_format == "pcm":
+                self._decode_audio(audio).export(filename, format="wav")
+            else:
+                with open(filename, "wb") as f:
+                    f.write(audio)
     
+    def _decode_audio(self, audio: bytes) -> 'AudioSegment':
+        """
+        Turn synthesized audio bytes into an AudioSegment.
+        
+        PCM audio is wrapped directly; only MP3 needs an ffmpeg decode.
+        """
+        from pydub import AudioSegment
+        
+        if self.audio_format == "pcm":
+            return AudioSegment(data=audio, sample_width=2, frame_rate=self.pcm_sample_rate, channels=1)
+        with self.metrics.span("decode", bytes=len(audio)):
+            return AudioSegment.from_mp3(io.BytesIO(audio))
     
-    def text_to_speech_playht(self, text: str, voice_id: str, filename: str) -> bool:
+    def synthesize_playht(self, text: str, voice_id: str,
+                          cancel_event: Optional[threading.Event] = None) -> Optional[bytes]:
         """
         Convert text to speech using Play.ht API.
         
         Args:
             text: Text to convert to speech
             voice_id: Play.ht voice ID
-            filename: Output filename
+            cancel_event: Optional event that aborts polling once set
             
         Returns:
-            True if successful, False otherwise
+            Audio bytes (MP3, or raw 16-bit mono PCM in PCM mode), or None on failure
         """
         try:
-            import time
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            
+            # Play.ht has no raw PCM output, so PCM mode asks for WAV and unwraps it
+            voice_settings = dict(self.playht_voice_settings)
+            if self.audio_format == "pcm":
+                voice_settings.update(output_format="wav", sample_rate=self.pcm_sample_rate)
+            
+            cache_key = self._tts_cache_key("playht", voice_id, self.playht_quality, voice_settings, text)
+            audio = self._load_cached_audio(cache_key)
+            if audio is not None:
+                return audio
             
             # Step 1: Create the TTS job
-            create_url = "https://api.play.ht/api/v2/tts"
+            create_url = f"{self.playht_base_url}/tts"
             
             headers = {
                 "Authorization": f"Bearer {self.playht_api_key}",
@@ -293,63 +2622,227 @@ Create a script that feels like it was written by the same caring hosts who wrot
             data = {
                 "text": text,
                 "voice": voice_id,
-                "quality": "premium",
-                "output_format": "mp3",
-                "speed": 1.0,
-                "sample_rate": 24000
+                "quality": self.playht_quality,
+                **voice_settings
             }
             
-            response = requests.post(create_url, json=data, headers=headers)
+            governor = self.governors["playht"]
+            if not governor.acquire(len(text), cancel_event):
+                return None
+            response = None
+            try:
+                response = self.http.post(create_url, json=data, headers=headers, cancel_event=cancel_event)
+            finally:
+                created = response is not None and response.status_code == 201
+                governor.release(response.attempt_seconds if created else None, len(text), billed=created)
             
             if response.status_code != 201:
                 print(f"❌ Error creating Play.ht job: {response.status_code} - {response.text}")
-                return False
+                return None
             
             job_data = response.json()
             job_id = job_data.get("id")
             
             if not job_id:
                 print("❌ No job ID returned from Play.ht")
-                return False
+                return None
             
-            # Step 2: Poll for completion
-            status_url = f"https://api.play.ht/api/v2/tts/{job_id}"
-            max_attempts = 30  # 30 seconds max wait
+            # Step 2: Wait for the shared poller to see the job complete
+            job = self.playht_poller.watch(job_id, f"{self.playht_base_url}/tts/{job_id}", headers)
+            audio_url = self.playht_poller.wait(job, cancel_event)
+            self.metrics.add(polls=job.polls)
             
-            for attempt in range(max_attempts):
-                status_response = requests.get(status_url, headers=headers)
-                
-                if status_response.status_code == 200:
-                    status_data = status_response.json()
-                    
-                    if status_data.get("output") and status_data["output"].get("url"):
-                        # Step 3: Download the audio
-                        audio_url = status_data["output"]["url"]
-                        audio_response = requests.get(audio_url)
-                        
-                        if audio_response.status_code == 200:
-                            with open(filename, "wb") as f:
-                                f.write(audio_response.content)
-                            print(f"✅ Generated Play.ht audio: {filename}")
-                            return True
-                        else:
-                            print(f"❌ Error downloading audio: {audio_response.status_code}")
-                            return False
-                    
-                    elif status_data.get("status") == "error":
-                        print(f"❌ Play.ht job failed: {status_data.get('error', 'Unknown error')}")
-                        return False
-                
-                time.sleep(1)  # Wait 1 second before polling again
+            if audio_url is None:
+                if job.error == "cancelled":
+                    print(f"⚠️  Play.ht job {job_id} cancelled")
+                elif job.error == "timed out":
+                    print("❌ Play.ht job timed out")
+                else:
+                    print(f"❌ Play.ht job failed: {job.error}")
+                return None
             
-            print("❌ Play.ht job timed out")
-            return False
+            # Step 3: Download the audio
+            # (a file download, outside the provider's API quota)
+            audio_response = self.http.get(audio_url, cancel_event=cancel_event)
+            
+            if audio_response.status_code != 200:
+                print(f"❌ Error downloading audio: {audio_response.status_code}")
+                return None
+            
+            audio = audio_response.content
+            if self.audio_format == "pcm":
+                audio = self._wav_to_pcm(audio)
+            if self.tts_cache is not None:
+                self.tts_cache.put(cache_key, audio)
+            print(f"✅ Generated Play.ht audio: {len(text)} chars ({job.polls} polls)")
+            return audio
                 
         except Exception as e:
             print(f"❌ Error in Play.ht text_to_speech: {str(e)}")
+            return None
+    
+    def _wav_to_pcm(self, wav_audio: bytes) -> bytes:
+        """Unwrap a WAV download into raw 16-bit mono PCM at pcm_sample_rate."""
+        from pydub import AudioSegment
+        
+        segment = AudioSegment.from_wav(io.BytesIO(wav_audio))
+        segment = segment.set_frame_rate(self.pcm_sample_rate).set_channels(1).set_sample_width(2)
+        return segment.raw_data
+    
+    def text_to_speech_playht(self, text: str, voice_id: str, filename: str,
+                              cancel_event: Optional[threading.Event] = None) -> bool:
+        """
+        Convert text to speech using Play.ht API and save it to a file.
+        
+        Args:
+            text: Text to convert to speech
+            voice_id: Play.ht voice ID
+            filename: Output filename
+            cancel_event: Optional event that aborts polling once set
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        audio = self.synthesize_playht(text, voice_id, cancel_event=cancel_event)
+        if audio is None:
             return False
+        self._write_audio(audio, filename)
+        return True
+    
+    def synthesize_speech(self, text: str, voice_id: str,
+                          cancel_event: Optional[threading.Event] = None) -> Optional[bytes]:
+        """
+        Convert text to speech using the configured TTS provider with fallback.
+        
+        With a hedge_policy, slow requests are also sent to the secondary provider
+        and whichever answers first is used.
+        
+        Args:
+            text: Text to convert to speech
+            voice_id: Voice ID for the configured provider
+            cancel_event: Optional event signalling that the episode was aborted
+            
+        Returns:
+            Audio bytes in the configured audio format, or None on failure
+        """
+        primary = self.tts_backends[self.tts_provider]
+        secondary = self._secondary_backend()
+        with self.metrics.span(f"tts.{primary.name}", chars=len(text)) as span:
+            if secondary is not None and self.hedge_policy is not None:
+                audio, backend = self._hedged_synthesis(primary, secondary, text, voice_id, cancel_event, span)
+            else:
+                audio, backend = primary.synthesize(text, voice_id, cancel_event=cancel_event), primary
+                if audio is None and secondary is not None and not (cancel_event is not None and cancel_event.is_set()):
+                    print(f"⚠️  {primary.label} failed, falling back to {secondary.label}...")
+                    audio, backend = self._run_backend(secondary, primary, text, voice_id, cancel_event), secondary
+            if backend is not primary:
+                span.set(provider=backend.name)
+            span.add(bytes=len(audio) if audio else 0)
+            if audio is None:
+                span.set(failed=True)
+            return audio
+    
+    def _on_throttle(self, url: str) -> None:
+        """Tell the governor of the provider that answered 429 to back off."""
+        if url.startswith(self.elevenlabs_base_url):
+            self.governors["elevenlabs"].throttle()
+        elif url.startswith(self.playht_base_url):
+            self.governors["playht"].throttle()
+    
+    def _secondary_backend(self) -> Optional[TTSProvider]:
+        """The provider to fall back to (and hedge with), if any."""
+        name = self.secondary_tts_provider
+        if name is None and self.tts_provider == "playht":
+            name = "elevenlabs"
+        if name is None or name == self.tts_provider:
+            return None
+        return self.tts_backends[name]
+    
+    def _run_backend(self, backend: TTSProvider, primary: TTSProvider, text: str, voice_id: str,
+                     cancel_event: Optional[threading.Event] = None) -> Optional[bytes]:
+        """Synthesize with a secondary backend, mapping the primary's voice to the same host."""
+        return backend.synthesize(text, backend.map_voice(voice_id, primary), cancel_event=cancel_event)
+    
+    def _hedged_synthesis(self, primary: TTSProvider, secondary: TTSProvider, text: str, voice_id: str,
+                          cancel_event: Optional[threading.Event], span) -> tuple:
+        """
+        Race the primary provider against a delayed duplicate request to the secondary.
+        
+        The secondary request starts once the primary has taken longer than the hedge
+        policy's deadline (or right away if the primary fails). The first audio to
+        arrive wins and the other request is told to stop.
+        
+        Every primary latency is recorded in the policy, including primaries that lose
+        the race; one that is stopped first contributes its elapsed time as a lower
+        bound. Recording only winners would leave out exactly the slow requests and
+        pull the deadline down.
+        
+        Returns:
+            (audio bytes or None, the backend that produced them)
+        """
+        results = queue.Queue()
+        stops = []
+        
+        def start(backend: TTSProvider) -> None:
+            stop = threading.Event()
+            stops.append(stop)
+            
+            def run():
+                started = time.perf_counter()
+                try:
+                    if backend is primary:
+                        audio = primary.synthesize(text, voice_id, cancel_event=stop)
+                    else:
+                        audio = self._run_backend(secondary, primary, text, voice_id, stop)
+                except Exception as e:
+                    print(f"❌ {backend.label} request failed: {str(e)}")
+                    audio = None
+                seconds = time.perf_counter() - started
+                if backend is primary and (audio is not None or stop.is_set()):
+                    self.hedge_policy.record(seconds)
+                results.put((backend, audio))
+            
+            # Copy the context so the episode's character ledger sees hedged requests too
+            threading.Thread(target=contextvars.copy_context().run, args=(run,), name=f"tts-{backend.name}",
+                             daemon=True).start()
+        
+        delay = self.hedge_policy.delay()
+        deadline = time.monotonic() + delay
+        start(primary)
+        running, hedged = 1, False
+        
+        while running:
+            try:
+                backend, audio = results.get(timeout=0.05)
+            except queue.Empty:
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+                if not hedged and time.monotonic() >= deadline:
+                    print(f"   ⏱️  {primary.label} slower than {delay:.1f}s, hedging with {secondary.label}")
+                    span.add(hedges=1)
+                    start(secondary)
+                    running, hedged = running + 1, True
+                continue
+            
+            running -= 1
+            if audio is not None:
+                if backend is not primary:
+                    span.add(hedge_wins=1)
+                for stop in stops:
+                    stop.set()
+                return audio, backend
+            
+            if not hedged and not (cancel_event is not None and cancel_event.is_set()):
+                print(f"⚠️  {primary.label} failed, falling back to {secondary.label}...")
+                start(secondary)
+                running, hedged = running + 1, True
         
-    def text_to_speech(self, text: str, voice_id: str, filename: str) -> bool:
+        for stop in stops:
+            stop.set()
+        return None, primary
+    
+    def text_to_speech(self, text: str, voice_id: str, filename: str,
+                       cancel_event: Optional[threading.Event] = None) -> bool:
         """
         Convert text to speech using the configured TTS provider with fallback.
         
@@ -357,34 +2850,40 @@ Create a script that feels like it was written by the same caring hosts who wrot
             text: Text to convert to speech
             voice_id: Voice ID for the configured provider
             filename: Output filename
+            cancel_event: Optional event signalling that the episode was aborted
             
         Returns:
             True if successful, False otherwise
         """
-        if self.tts_provider == "playht":
-            success = self.text_to_speech_playht(text, voice_id, filename)
-            if not success:
-                print("⚠️  Play.ht failed, falling back to ElevenLabs...")
-                # Switch to ElevenLabs voice IDs and try again
-                fallback_voice = self.elevenlabs_host_1 if voice_id == self.playht_host_1 else self.elevenlabs_host_2
-                return self.text_to_speech_elevenlabs(text, fallback_voice, filename)
-            return success
-        else:
-            return self.text_to_speech_elevenlabs(text, voice_id, filename)
+        audio = self.synthesize_speech(text, voice_id, cancel_event=cancel_event)
+        if audio is None:
+            return False
+        self._write_audio(audio, filename)
+        return True
     
-    def text_to_speech_elevenlabs(self, text: str, voice_id: str, filename: str) -> bool:
+    def synthesize_elevenlabs(self, text: str, voice_id: str,
+                              cancel_event: Optional[threading.Event] = None) -> Optional[bytes]:
         """
         Convert text to speech using ElevenLabs API with enhanced inflections.
         
         Args:
             text: Text to convert to speech
             voice_id: ElevenLabs voice ID
-            filename: Output filename
+            cancel_event: Optional event that skips the request once set
             
         Returns:
-            True if successful, False otherwise
+            Audio bytes (MP3, or raw 16-bit mono PCM in PCM mode), or None on failure
         """
         try:
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            
+            cache_key = self._tts_cache_key("elevenlabs", voice_id, self.elevenlabs_model_id,
+                                            self.elevenlabs_voice_settings, text)
+            audio = self._load_cached_audio(cache_key)
+            if audio is not None:
+                return audio
+            
             url = f"{self.elevenlabs_base_url}/text-to-speech/{voice_id}"
             
             headers = {
@@ -393,115 +2892,130 @@ Create a script that feels like it was written by the same caring hosts who wrot
                 "xi-api-key": self.elevenlabs_api_key
             }
             
-            # Enhanced voice settings for more natural inflections
+            # PCM mode asks ElevenLabs for raw samples instead of MP3
+            params = None
+            if self.audio_format == "pcm":
+                headers["Accept"] = "audio/pcm"
+                params = {"output_format": f"pcm_{self.pcm_sample_rate}"}
+            
             data = {
                 "text": text,
-                "model_id": "eleven_monolingual_v1",
-                "voice_settings": {
-                    "stability": 0.3,  # Lower stability for more variation
-                    "similarity_boost": 0.7,  # Higher similarity for consistent voice
-                    "style": 0.8,  # Add style for more expressive speech
-                    "use_speaker_boost": True  # Enhance speaker clarity
-                }
+                "model_id": self.elevenlabs_model_id,
+                "voice_settings": self.elevenlabs_voice_settings
             }
             
-            response = requests.post(url, json=data, headers=headers)
+            governor = self.governors["elevenlabs"]
+            if not governor.acquire(len(text), cancel_event):
+                return None
+            response = None
+            try:
+                response = self.http.post(url, json=data, headers=headers, params=params, cancel_event=cancel_event)
+            finally:
+                ok = response is not None and response.status_code == 200
+                governor.release(response.attempt_seconds if ok else None, len(text), billed=ok)
             
             if response.status_code == 200:
-                with open(filename, "wb") as f:
-                    f.write(response.content)
-                print(f"✅ Generated audio: {filename}")
-                return True
+                if self.tts_cache is not None:
+                    self.tts_cache.put(cache_key, response.content)
+                print(f"✅ Generated audio: {len(text)} chars")
+                return response.content
             else:
                 print(f"❌ Error generating audio: {response.status_code} - {response.text}")
-                return False
+                return None
                 
         except Exception as e:
             print(f"❌ Error in text_to_speech: {str(e)}")
+            return None
+    
+    def text_to_speech_elevenlabs(self, text: str, voice_id: str, filename: str,
+                                  cancel_event: Optional[threading.Event] = None) -> bool:
+        """
+        Convert text to speech using ElevenLabs API and save it to a file.
+        
+        Args:
+            text: Text to convert to speech
+            voice_id: ElevenLabs voice ID
+            filename: Output filename
+            cancel_event: Optional event that skips the request once set
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        audio = self.synthesize_elevenlabs(text, voice_id, cancel_event=cancel_event)
+        if audio is None:
             return False
+        self._write_audio(audio, filename)
+        return True
     
-    def generate_podcast(self, transcript: str, output_filename: str = "ai_podcast.mp3") -> bool:
+    def generate_podcast(self, transcript: str, output_filename: str = "ai_podcast.mp3",
+                         segments_dir: Optional[str] = None) -> bool:
         """
         Generate a complete AI podcast episode from a transcript.
         
+        Every stage is checkpointed in the episode's manifest, so rerunning a failed
+        episode resumes from the first incomplete stage.
+        
         Args:
             transcript: The conversation transcript
             output_filename: Name of the output MP3 file
+            segments_dir: Directory for segment files (default: the episode's Workspace)
             
         Returns:
             True if successful, False otherwise
         """
         print("🎙️ Starting AI Podcast Generation...")
         
-        # Step 1: Analyze the conversation
-        print("📊 Analyzing conversation...")
-        analysis = self.analyze_conversation(transcript)
-        themes = analysis.get('core_themes', analysis.get('themes', ['personal growth']))
-        print(f"   Detected themes: {', '.join(themes)}")
-        
-        # Step 2: Generate the podcast script
-        print("✍️ Generating podcast script...")
-        script = self.generate_podcast_script(transcript, analysis)
-        
-        # Save the script for reference
-        script_filename = output_filename.replace('.mp3', '_script.txt')
-        with open(script_filename, 'w') as f:
-            f.write(script)
-        print(f"📝 Script saved to: {script_filename}")
-        
-        # Step 3: Split script into segments for different voices
-        segments = self.split_script_for_voices(script)
-        print(f"   Created {len(segments)} voice segments")
-        
-        # Step 4: Generate audio for each segment
-        print("🎵 Generating audio segments...")
-        audio_files = []
-        
-        for i, segment in enumerate(segments):
-            if len(segment) == 3:
-                segment_text, voice_id, timing_info = segment
-            else:
-                segment_text, voice_id = segment
-                timing_info = "normal"
-                
-            segment_filename = f"segments/segment_{i:02d}.mp3"
-            print(f"   Generating segment {i+1}/{len(segments)}: {len(segment_text)} chars ({timing_info})")
+        with self._episode_job(transcript, output_filename, segments_dir) as manifest:
+            # Fast mode: steps 1 and 2 in a single request
+            if (self.single_request and self.has_openai
+                    and manifest.data["analysis"] is None and manifest.data["script"] is None):
+                print("⚡ Analyzing conversation and generating script in one request...")
+                with self.metrics.span("stage.analysis_and_script"):
+                    combined = self.generate_analysis_and_script(transcript)
+                if combined is not None:
+                    analysis, script = combined
+                    manifest.update(analysis=analysis, script=script, stage="segments")
             
-            if self.text_to_speech(segment_text, voice_id, segment_filename):
-                audio_files.append((segment_filename, timing_info))
-            else:
-                print(f"❌ Failed to generate segment {i}")
-                return False
-        
-        print(f"   Successfully generated {len(audio_files)} audio segments")
-        
-        # Step 5: Combine audio files
-        print("🔗 Combining audio segments...")
-        if self.combine_audio_files_smart(audio_files, output_filename):
-            print(f"🎉 Podcast generated successfully: {output_filename}")
+            # Step 1: Analyze the conversation
+            analysis = manifest.data["analysis"]
+            if analysis is None:
+                print("📊 Analyzing conversation...")
+                with self.metrics.span("stage.analysis", transcript_chars=len(transcript)):
+                    analysis = self.analyze_conversation(transcript)
+                manifest.update(analysis=analysis, stage="script")
+            themes = analysis.get('core_themes', analysis.get('themes', ['personal growth']))
+            print(f"   Detected themes: {', '.join(themes)}")
             
-            # Clean up segment files
-            for segment_info in audio_files:
-                try:
-                    if isinstance(segment_info, tuple):
-                        segment_file, _ = segment_info
-                    else:
-                        segment_file = segment_info
-                    os.remove(segment_file)
-                except:
-                    pass
+            # Step 2: Generate the podcast script
+            script = manifest.data["script"]
+            if script is None and self.pipeline_script and self.has_openai:
+                # Steps 2-5 overlap: segments go to TTS while the script is still streaming in
+                print("✍️ Generating podcast script (pipelined into TTS)...")
+                segments = self._pipelined_segments(transcript, analysis, output_filename, manifest)
+                return self._render_episode(segments, output_filename, manifest)
+            if script is None:
+                print("✍️ Generating podcast script...")
+                with self.metrics.span("stage.script"):
+                    script = self.generate_podcast_script(transcript, analysis)
+                manifest.update(script=script, stage="segments")
             
-            return True
-        else:
-            print("❌ Failed to combine audio files")
-            return False
+            # Save the script for reference
+            script_filename = script_filename_for(output_filename)
+            with open(script_filename, 'w') as f:
+                f.write(script)
+            print(f"📝 Script saved to: {script_filename}")
+            
+            # Steps 3-5: Split the script into voice segments, generate audio for each and combine
+            return self._render_episode(self._episode_segments(script, manifest), output_filename, manifest)
     
-    def generate_podcast_from_script(self, script_file: str, output_filename: str = "ai_podcast.mp3") -> bool:
+    def generate_podcast_from_script(self, script_file: str, output_filename: str = "ai_podcast.mp3",
+                                     segments_dir: Optional[str] = None) -> bool:
         """
         Generate a podcast from a pre-written script file (bypassing transcript analysis).
         Args:
             script_file: Path to the script text file
             output_filename: Name of the output MP3 file
+            segments_dir: Directory for segment files (default: the episode's Workspace)
         Returns:
             True if successful, False otherwise
         """
@@ -514,51 +3028,332 @@ Create a script that feels like it was written by the same caring hosts who wrot
             return False
         
         # Save a copy of the script for reference
-        script_filename = output_filename.replace('.mp3', '_script.txt')
+        script_filename = script_filename_for(output_filename)
         with open(script_filename, 'w') as f:
             f.write(script)
         print(f"📝 Script saved to: {script_filename}")
         
-        # Split script into segments for different voices
-        segments = self.split_script_for_voices(script)
+        with self._episode_job(script, output_filename, segments_dir) as manifest:
+            if manifest.data["script"] is None:
+                manifest.update(script=script, stage="segments")
+            return self._render_episode(self._episode_segments(script, manifest), output_filename, manifest)
+    
+    @contextmanager
+    def _episode_job(self, source: str, output_filename: str, segments_dir: Optional[str] = None):
+        """
+        Yield the checkpoint manifest for one episode job.
+        
+        An explicit segments_dir belongs to the caller and is used as is. Otherwise
+        the job runs in a Workspace named after the output file, so concurrent jobs
+        never share files while a rerun of the same episode finds its checkpoints.
+        The workspace is removed once the episode is complete and kept for resuming
+        if it is not (or always, when keep_segment_files is set).
+        
+        Args:
+            source: Transcript or script text the episode is generated from
+            output_filename: Output file, or "-" for stdout (not resumable)
+            segments_dir: Directory for segment files (default: the episode's Workspace)
+        """
+        if segments_dir is not None:
+            os.makedirs(segments_dir, exist_ok=True)
+            with self.metrics.span("episode", output=output_filename), self._episode_usage():
+                yield self._open_manifest(segments_dir, source, self.resume)
+            return
+        
+        resumable = output_filename != "-"
+        job_id = episode_job_id(output_filename) if resumable else None
+        with self.metrics.span("episode", output=output_filename), self._episode_usage(), \
+                Workspace(self.work_dir, keep=self.keep_segment_files, job_id=job_id) as workspace:
+            manifest = self._open_manifest(workspace.segments_dir, source, resumable and self.resume)
+            try:
+                yield manifest
+            finally:
+                if resumable and manifest.stage != "complete":
+                    workspace.keep = True
+                    print("💾 Progress checkpointed; rerun the same command to resume")
+    
+    @contextmanager
+    def _episode_usage(self):
+        """
+        Count the episode's TTS requests and characters in a CharacterLedger.
+        
+        A caller that already set a ledger (e.g. a batch) keeps its own; the usage is
+        printed when the episode ends.
+        """
+        ledger = _TTS_LEDGER.get()
+        token = None
+        if ledger is None:
+            ledger = CharacterLedger()
+            token = _TTS_LEDGER.set(ledger)
+        try:
+            yield ledger
+        finally:
+            if ledger.usage:
+                print(f"💳 TTS usage: {ledger.describe()}")
+            if token is not None:
+                _TTS_LEDGER.reset(token)
+    
+    def _open_manifest(self, directory: str, source: str, resumable: bool) -> EpisodeManifest:
+        """Open an episode manifest and report where a resumed run picks up."""
+        manifest = EpisodeManifest(directory, source, resumable, identity=self._manifest_identity())
+        if manifest.stale:
+            print(f"🗑️  Discarding checkpoints from a run with different settings ({', '.join(manifest.stale)})")
+        if manifest.resumed and manifest.stage != "analysis":
+            segments = manifest.data.get("segments") or []
+            done = sum(1 for record in segments if record["status"] == "done")
+            print(f"♻️  Resuming episode at stage '{manifest.stage}' "
+                  f"({done}/{len(segments)} segments already synthesized)")
+        return manifest
+    
+    def _manifest_identity(self) -> Dict:
+        """Settings that checkpointed segments depend on; a manifest made with others is not resumed."""
+        return {
+            "provider": self.tts_provider,
+            "audio_format": self.audio_format,
+            "pcm_sample_rate": self.pcm_sample_rate,
+            "segment_char_budget": self.segment_char_budget or None,
+            "voices": {
+                "hosts": [self.host_1_voice_id, self.host_2_voice_id],
+                "extra_hosts": {str(host): voice for host, voice in sorted(self.host_voice_ids.items())},
+                # Fallback and hedge requests map segments onto the other providers' voices
+                "providers": {name: list(backend.host_voices()) for name, backend in self.tts_backends.items()}
+            }
+        }
+    
+    def _episode_segments(self, script: str, manifest: EpisodeManifest) -> List[tuple]:
+        """
+        Split the script into packed voice segments, or take them from the manifest when already recorded.
+        """
+        if manifest.stage in ("audio", "complete"):
+            segments = manifest.voice_segments()
+            print(f"   Created {len(segments)} voice segments")
+            return segments
+        
+        packer = self._segment_packer()
+        segments = packer.feed(ScriptSegmentParser().iter_segments(script.split('\n')))
+        segments += packer.close()
+        manifest.set_segments(segments)
         print(f"   Created {len(segments)} voice segments")
+        self._report_packing(packer)
+        return segments
+    
+    def _segment_packer(self) -> SegmentPacker:
+        return SegmentPacker(self._host_voice, self.segment_char_budget)
+    
+    def _report_packing(self, packer: SegmentPacker) -> None:
+        """Print (and record in the episode's metrics) how packing changed the request count."""
+        if packer.max_chars is not None:
+            print(f"📦 Packed into {packer.describe()}")
+        self.metrics.add(script_segments=packer.parsed, tts_requests=packer.packed)
+    
+    def _pipelined_segments(self, transcript: str, analysis: Dict, output_filename: str,
+                            manifest: EpisodeManifest):
+        """
+        Stream the script from OpenAI and yield each voice segment as soon as it is complete.
         
-        # Generate audio for each segment
-        print("🎵 Generating audio segments...")
-        audio_files = []
-        for i, segment in enumerate(segments):
-            if len(segment) == 3:
-                segment_text, voice_id, timing_info = segment
-            else:
-                segment_text, voice_id = segment
-                timing_info = "normal"
-            segment_filename = f"segments/segment_{i:02d}.mp3"
-            print(f"   Generating segment {i+1}/{len(segments)}: {len(segment_text)} chars ({timing_info})")
-            if self.text_to_speech(segment_text, voice_id, segment_filename):
-                audio_files.append((segment_filename, timing_info))
+        Parsed segments go through the same SegmentPacker as a complete script and
+        are recorded in the manifest once packed; the full script is saved (to the
+        manifest and the script file) once the stream ends.
+        
+        Yields:
+            (text, host, timing_info) tuples in script order
+        """
+        parser = ScriptSegmentParser()
+        packer = self._segment_packer()
+        chunks = []
+        segments = []
+        
+        def record(ready: List[tuple]):
+            for segment in ready:
+                manifest.add_segment(len(segments), segment)
+                segments.append(segment)
+                yield segment
+        
+        for chunk in self._stream_script_generation(transcript, analysis):
+            chunks.append(chunk)
+            yield from record(packer.feed(parser.feed(chunk)))
+        yield from record(packer.feed(parser.close()) + packer.close())
+        
+        script = "".join(chunks).strip()
+        manifest.update(script=script)
+        manifest.set_segments(segments)
+        script_filename = script_filename_for(output_filename)
+        with open(script_filename, 'w') as f:
+            f.write(script)
+        print(f"📝 Script saved to: {script_filename} ({len(segments)} voice segments)")
+        self._report_packing(packer)
+    
+    def _render_episode(self, segments, output_filename: str, manifest: EpisodeManifest) -> bool:
+        """
+        Synthesize the voice segments and combine them into the episode.
+        
+        Args:
+            segments: List or iterator of (text, host or voice_id, timing_info) tuples
+            output_filename: Output file, or "-" for stdout when streaming
+            manifest: Checkpoints for this episode; segment files go to its directory
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        if self.stream_output:
+            # Mixing and encoding overlap with synthesis
+            print(f"🎵 Generating and streaming audio segments ({self.tts_concurrency} workers)...")
+            with self.metrics.span("stage.stream", workers=self.tts_concurrency):
+                success = self._stream_podcast(segments, output_filename, segments_dir=manifest.directory,
+                                               manifest=manifest)
+        else:
+            print(f"🎵 Generating audio segments ({self.tts_concurrency} workers)...")
+            with self.metrics.span("stage.tts", workers=self.tts_concurrency) as span:
+                audio_files = self._synthesize_segments(segments, segments_dir=manifest.directory,
+                                                        manifest=manifest)
+                span.add(segments=len(audio_files or []))
+            if audio_files is None:
+                return False
+            print(f"   Successfully generated {len(audio_files)} audio segments")
+            
+            print("🔗 Combining audio segments...")
+            with self.metrics.span("stage.combine"):
+                success = self.combine_audio_files_smart(audio_files, output_filename)
+            if success:
+                print(f"🎉 Podcast generated successfully: {output_filename}")
             else:
+                print("❌ Failed to combine audio files")
+        
+        if success:
+            manifest.update(stage="complete")
+        return success
+    
+    def _synthesize_segments(self, segments: List[tuple], on_ready=None, segments_dir: str = "segments",
+                             manifest: Optional[EpisodeManifest] = None) -> Optional[List[tuple]]:
+        """
+        Generate audio for all script segments using a pool of TTS workers.
+        
+        Segments are synthesized concurrently (up to tts_concurrency at a time) but
+        returned in script order. The first hard failure cancels queued segments and
+        signals in-flight ones to stop.
+        
+        segments may also be an iterator that produces segments over time (e.g. parsed
+        from a streamed script); each one is dispatched as soon as it arrives.
+        
+        In PCM mode segments stay in memory as AudioSegments and go straight to the
+        mixer; files in segments_dir are only written when keep_segment_files or
+        checkpoint_pcm_segments (with a resumable manifest) asks for them.
+        
+        With a manifest, segments a previous run already finished (file present and
+        hash intact) are reused instead of synthesized, and each outcome is recorded.
+        
+        Args:
+            segments: List or iterator of (text, host or voice_id, timing_info) tuples
+                from SegmentPacker (host numbers are resolved with _host_voice),
+                split_script_for_voices or ScriptSegmentParser
+            on_ready: Optional callback(i, audio, timing_info), called in script order as
+                soon as each segment and every segment before it is available
+            segments_dir: Directory for segment files
+            manifest: Optional episode checkpoints to resume from and update
+            
+        Returns:
+            List of (filename or AudioSegment, timing_info) tuples in script order,
+            or None if a segment failed
+        """
+        in_memory = self.audio_format == "pcm"
+        extension = "wav" if in_memory else "mp3"
+        write_files = (not in_memory or self.keep_segment_files
+                       or (self.checkpoint_pcm_segments and manifest is not None and manifest.resumable))
+        if write_files:
+            os.makedirs(segments_dir, exist_ok=True)
+        
+        # The total is unknown while segments are still being produced
+        total = f"/{len(segments)}" if isinstance(segments, list) else ""
+        jobs = []
+        cancel_event = threading.Event()
+        
+        def synthesize(job: tuple) -> tuple:
+            i, segment_text, voice_id, timing_info, segment_filename = job
+            if cancel_event.is_set():
+                return i, None
+            
+            completed = manifest.completed_file(i) if manifest is not None else None
+            # Only reuse audio in this run's format (an MP3 checkpoint can't be read as WAV)
+            if completed is not None and completed.endswith(f".{extension}"):
+                print(f"   Reusing segment {i+1}{total} from previous run")
+                if in_memory:
+                    from pydub import AudioSegment
+                    return i, AudioSegment.from_wav(completed)
+                return i, completed
+            
+            print(f"   Generating segment {i+1}{total}: {len(segment_text)} chars ({timing_info})")
+            
+            if not in_memory:
+                if self.text_to_speech(segment_text, voice_id, segment_filename, cancel_event=cancel_event):
+                    return i, segment_filename
+                return i, None
+            
+            audio = self.synthesize_speech(segment_text, voice_id, cancel_event=cancel_event)
+            if audio is None:
+                return i, None
+            if write_files:
+                self._write_audio(audio, segment_filename)
+            return i, self._decode_audio(audio)
+        
+        audio_files = []
+        pending = set()
+        next_ready = 0
+        
+        def collect(future) -> bool:
+            nonlocal next_ready
+            i, audio = future.result()
+            if audio is None:
                 print(f"❌ Failed to generate segment {i}")
+                cancel_event.set()
+                if manifest is not None:
+                    manifest.mark_segment(i, "failed")
                 return False
-        print(f"   Successfully generated {len(audio_files)} audio segments")
-        
-        # Combine audio files
-        print("🔗 Combining audio segments...")
-        if self.combine_audio_files_smart(audio_files, output_filename):
-            print(f"🎉 Podcast generated successfully: {output_filename}")
-            # Clean up segment files
-            for segment_info in audio_files:
-                try:
-                    if isinstance(segment_info, tuple):
-                        segment_file, _ = segment_info
-                    else:
-                        segment_file = segment_info
-                    # os.remove(segment_file)
-                except:
-                    pass
+            audio_files[i] = (audio, jobs[i][3])
+            if manifest is not None and write_files:
+                manifest.mark_segment(i, "done", jobs[i][4])
+            
+            # Hand over the completed prefix in script order
+            while on_ready is not None and next_ready < len(jobs) and audio_files[next_ready] is not None:
+                on_ready(next_ready, *audio_files[next_ready])
+                next_ready += 1
             return True
-        else:
-            print("❌ Failed to combine audio files")
-            return False
+        
+        concurrency = max(self.tts_concurrency, self.tts_backends[self.tts_provider].max_outstanding() or 0)
+        workers = max(1, min(concurrency, len(segments))) if total else concurrency
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tts")
+        try:
+            for i, segment in enumerate(segments):
+                if len(segment) == 3:
+                    segment_text, voice_id, timing_info = segment
+                else:
+                    segment_text, voice_id = segment
+                    timing_info = "normal"
+                if isinstance(voice_id, int):
+                    voice_id = self._host_voice(voice_id)
+                job = (i, segment_text, voice_id, timing_info, os.path.join(segments_dir, f"segment_{i:02d}.{extension}"))
+                jobs.append(job)
+                audio_files.append(None)
+                # Run in a copy of this context so providers charge the episode's character ledger
+                pending.add(executor.submit(contextvars.copy_context().run, synthesize, job))
+                
+                # Collect whatever finished while later segments are still arriving
+                for future in [f for f in pending if f.done()]:
+                    pending.discard(future)
+                    if not collect(future):
+                        return None
+            
+            for future in as_completed(pending):
+                if not collect(future):
+                    return None
+        finally:
+            # Drop anything still queued and wait for in-flight requests to notice
+            cancel_event.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+        
+        if self.tts_cache is not None:
+            print(f"   TTS cache: {self.tts_cache.hits} hits, {self.tts_cache.misses} misses")
+        
+        return audio_files
     
     def split_script_for_voices(self, script: str) -> List[tuple]:
         """
@@ -568,81 +3363,17 @@ Create a script that feels like it was written by the same caring hosts who wrot
             script: The complete podcast script
             
         Returns:
-            List of (text, voice_id) tuples
+            List of (text, voice_id, timing_info) tuples
         """
-        segments = []
-        lines = script.split('\n')
-        current_segment = ""
-        current_voice = self.host_1_voice_id
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Handle overlap speech markers
-            if "[OVERLAP - Host" in line:
-                if current_segment:
-                    segments.append((current_segment, current_voice, "normal"))
-                
-                if "Host 1" in line:
-                    current_voice = self.host_1_voice_id
-                else:
-                    current_voice = self.host_2_voice_id
-                    
-                # Extract the text after the marker
-                text = line.split("]", 1)[1].strip() if "]" in line else ""
-                if text:
-                    segments.append((text, current_voice, "overlap"))
-                current_segment = ""
-                
-            # Skip any remaining simultaneous markers (legacy)
-            elif "[SIMULTANEOUS" in line or "[Both -" in line:
-                # Skip these lines entirely
-                pass
-                
-            # Check for regular voice indicators
-            elif any(marker in line for marker in ["[Host 1]", "[INTRO - Host 1]", "[MAIN DISCUSSION - Host 1]", "[OUTRO - Host 1]"]):
-                if current_segment:
-                    segments.append((current_segment, current_voice, "normal"))
-                # Remove ALL possible markers from the line
-                text = line
-                for marker in ["[Host 1]", "[INTRO - Host 1]", "[MAIN DISCUSSION - Host 1]", "[OUTRO - Host 1]"]:
-                    text = text.replace(marker, "")
-                current_segment = text.strip()
-                current_voice = self.host_1_voice_id
-            elif any(marker in line for marker in ["[Host 2]", "[INTRO - Host 2]", "[MAIN DISCUSSION - Host 2]", "[OUTRO - Host 2]"]):
-                if current_segment:
-                    segments.append((current_segment, current_voice, "normal"))
-                # Remove ALL possible markers from the line
-                text = line
-                for marker in ["[Host 2]", "[INTRO - Host 2]", "[MAIN DISCUSSION - Host 2]", "[OUTRO - Host 2]"]:
-                    text = text.replace(marker, "")
-                current_segment = text.strip()
-                current_voice = self.host_2_voice_id
-            # Skip stage directions like [laughing], [also laughing], etc.
-            elif line.startswith("[") and line.endswith("]"):
-                pass  # Skip stage directions
-            else:
-                current_segment += " " + line
-        
-        # Add the last segment
-        if current_segment:
-            segments.append((current_segment, current_voice, "normal"))
-        
-        # Ensure all segments have timing info
-        final_segments = []
-        for segment in segments:
-            if len(segment) == 2:
-                text, voice = segment
-                timing = "normal"
-            else:
-                text, voice, timing = segment
-            
-            if text.strip():
-                final_segments.append((text.strip(), voice, timing))
-        
-        return final_segments
+        return [(segment.text, self._host_voice(segment.host), segment.timing)
+                for segment in ScriptSegmentParser().iter_segments(script.split('\n'))]
+    
+    def _host_voice(self, host: int) -> str:
+        """Voice for a 1-based host number; hosts without their own voice alternate between the two defaults."""
+        if host in self.host_voice_ids:
+            return self.host_voice_ids[host]
+        voices = (self.host_1_voice_id, self.host_2_voice_id)
+        return voices[(host - 1) % len(voices)]
     
     def combine_audio_files(self, audio_files: List[str], output_filename: str, overlap_probability: float = 0.3) -> bool:
         """
@@ -657,24 +3388,25 @@ Create a script that feels like it was written by the same caring hosts who wrot
             True if successful, False otherwise
         """
         import random
+        # Rendered next to the output and moved into place only once complete
+        partial_filename = partial_output_for(output_filename)
         try:
             if not audio_files:
                 print("❌ No audio files to combine")
                 return False
-            try:
-                from pydub import AudioSegment
-            except ImportError:
-                print("⚠️  pydub not available, installing...")
-                import subprocess
-                subprocess.check_call([sys.executable, "-m", "pip", "install", "pydub"])
-                from pydub import AudioSegment
+            # Without pydub this raises ImportError and falls through to the ffmpeg concat below
+            from pydub import AudioSegment
+
+            def load(audio_file):
+                # In-memory PCM segments arrive already decoded
+                return audio_file if isinstance(audio_file, AudioSegment) else AudioSegment.from_file(audio_file)
 
             print(f"🔗 Combining {len(audio_files)} audio segments with overlap_probability={overlap_probability}")
-            combined = AudioSegment.from_mp3(audio_files[0])
+            combined = load(audio_files[0])
             silence = AudioSegment.silent(duration=500)  # 0.5 seconds
 
             for i, audio_file in enumerate(audio_files[1:], 1):
-                segment = AudioSegment.from_mp3(audio_file)
+                segment = load(audio_file)
                 # Decide whether to overlap
                 do_overlap = (random.random() < overlap_probability)
                 if do_overlap and len(combined) > 2000 and len(segment) > 1000:
@@ -690,7 +3422,8 @@ Create a script that feels like it was written by the same caring hosts who wrot
                     print(f"   Appending segment {i+1} (no overlap)")
                     combined = combined + silence + segment
 
-            combined.export(output_filename, format="mp3")
+            combined.export(partial_filename, format="mp3")
+            publish_output(partial_filename, output_filename, True)
             print(f"✅ Combined audio saved to: {output_filename}")
             return True
         except Exception as e:
@@ -698,18 +3431,19 @@ Create a script that feels like it was written by the same caring hosts who wrot
             # Fallback to ffmpeg concat
             try:
                 import subprocess
-                file_list = "file_list.txt"
-                with open(file_list, "w") as f:
+                # Private list file so concurrent jobs don't clobber each other's
+                with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+                    file_list = f.name
                     for audio_file in audio_files:
-                        f.write(f"file '{audio_file}'\n")
+                        f.write(f"file '{os.path.abspath(audio_file)}'\n")
                 cmd = [
                     "ffmpeg", "-f", "concat", "-safe", "0", 
-                    "-i", file_list, "-c", "copy", output_filename, "-y"
+                    "-i", file_list, "-c", "copy", partial_filename, "-y"
                 ]
                 result = subprocess.run(cmd, capture_output=True, text=True)
                 if os.path.exists(file_list):
                     os.remove(file_list)
-                if result.returncode == 0:
+                if publish_output(partial_filename, output_filename, result.returncode == 0):
                     print(f"✅ Combined audio saved to: {output_filename}")
                     return True
                 else:
@@ -720,35 +3454,144 @@ Create a script that feels like it was written by the same caring hosts who wrot
             try:
                 if audio_files:
                     import shutil
-                    shutil.copy(audio_files[0], output_filename)
+                    shutil.copy(audio_files[0], partial_filename)
+                    publish_output(partial_filename, output_filename, True)
                     print(f"⚠️  Fallback: copied first segment only to {output_filename}")
                     return True
             except:
                 pass
-            return False
+            return publish_output(partial_filename, output_filename, False)
     
-    def combine_segments_only(self, output_filename: str = "combined_podcast.mp3") -> bool:
+    def combine_segments_only(self, output_filename: str = "combined_podcast.mp3",
+                              segments_dir: Optional[str] = None) -> bool:
         """
         Just combine existing segment files with smart timing.
+        
+        Timing comes from the episode manifest when the directory has one; plain
+        segment files without a manifest are combined with normal timing.
+        
+        Args:
+            output_filename: Output filename
+            segments_dir: Directory holding a job's segment files (default: the kept
+                Workspace of the episode rendered to output_filename)
         """
         import glob
-        import os
         
-        # Find all segment files
-        segment_files = sorted(glob.glob("segments/segment_*.mp3"))
+        if segments_dir is None:
+            segments_dir = os.path.join(self.work_dir, episode_job_id(output_filename), "segments")
+            if not os.path.isdir(segments_dir):
+                print(f"❌ No kept workspace for {output_filename} in {self.work_dir}; "
+                      f"pass --segments-dir (or generate with --keep-segments)")
+                return False
+            print(f"📂 Using the episode's workspace: {segments_dir}")
+        
+        manifest = EpisodeManifest.read(segments_dir)
+        if manifest and manifest.get("segments"):
+            audio_files = []
+            for record in manifest["segments"]:
+                if record["status"] != "done":
+                    print(f"❌ Segment {record['index']} is {record['status']}; rerun the episode to resume it")
+                    return False
+                audio_files.append((os.path.join(segments_dir, record["file"]), record["timing"]))
+            print(f"📋 Using timing from {EpisodeManifest.FILENAME} ({len(audio_files)} segments)")
+            return self.combine_audio_files_smart(audio_files, output_filename)
+        
+        # Find all segment files (MP3 downloads, or WAV dumps from PCM mode)
+        segment_files = sorted(glob.glob(os.path.join(segments_dir, "segment_*.mp3")) +
+                               glob.glob(os.path.join(segments_dir, "segment_*.wav")))
         if not segment_files:
-            print("❌ No segment files found in segments/ directory")
+            print(f"❌ No segment files found in {segments_dir}")
             return False
             
-        # Create audio_files list with timing info based on filenames
-        audio_files = []
-        for i, segment_file in enumerate(segment_files):
-            # Default to normal timing - you'd need to store timing info separately
-            # for a real implementation
-            audio_files.append((segment_file, "normal"))
+        # Without a manifest there is no timing info; default to normal
+        audio_files = [(segment_file, "normal") for segment_file in segment_files]
             
         return self.combine_audio_files_smart(audio_files, output_filename)
     
+    def _detect_nonsilent(self, audio_segment: 'AudioSegment', min_silence_len: int = 1000,
+                          silence_thresh: float = -16) -> List[list]:
+        """
+        Vectorized equivalent of pydub.silence.detect_nonsilent (seek_step=1).
+        
+        pydub computes the RMS of a min_silence_len window at every millisecond in a
+        Python loop. Here the squared samples are prefix-summed once over a NumPy view
+        of the raw data, so every window's RMS comes from a single subtraction. The
+        window boundaries, integer RMS, threshold and range merging follow pydub
+        exactly, so the returned ranges are identical.
+        
+        Args:
+            audio_segment: The audio segment to analyze
+            min_silence_len: Minimum length of a silent section in ms
+            silence_thresh: Upper bound for silence in dBFS
+        
+        Returns:
+            List of [start_ms, end_ms] non-silent ranges
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if np is None or audio_segment.sample_width not in (1, 2, 4):
+            from pydub.silence import detect_nonsilent
+            return detect_nonsilent(audio_segment, min_silence_len=min_silence_len,
+                                    silence_thresh=silence_thresh)
+        
+        seg_len = len(audio_segment)
+        
+        # You can't have a silent portion of a sound that is longer than the sound
+        if seg_len < min_silence_len:
+            return [[0, seg_len]]
+        
+        channels = audio_segment.channels
+        dtype = TimelineMixer.SAMPLE_DTYPES[audio_segment.sample_width]
+        samples = np.frombuffer(audio_segment.raw_data, dtype=dtype).reshape(-1, channels)
+        total_frames = len(samples)
+        
+        # Prefix sums of per-frame energy (exact integers unless samples are 32-bit)
+        energy_dtype = np.float64 if audio_segment.sample_width == 4 else np.int64
+        energy = np.square(samples, dtype=energy_dtype).sum(axis=1, dtype=energy_dtype)
+        prefix = np.zeros(total_frames + 1, dtype=energy_dtype)
+        np.cumsum(energy, out=prefix[1:])
+        
+        # Window i covers audio_segment[i:i + min_silence_len], with pydub's frame rounding
+        frames_per_ms = audio_segment.frame_rate / 1000.0
+        slice_starts = np.arange(seg_len - min_silence_len + 1)
+        start_frames = (slice_starts * frames_per_ms).astype(np.int64)
+        end_frames = ((slice_starts + min_silence_len) * frames_per_ms).astype(np.int64)
+        
+        # pydub pads windows that run past the data with silence, which still counts in the mean
+        expected = np.maximum(end_frames - start_frames, 1) * channels
+        window_energy = (prefix[np.minimum(end_frames, total_frames)] -
+                         prefix[np.minimum(start_frames, total_frames)])
+        rms = np.floor(np.sqrt(window_energy / expected))
+        
+        threshold = (10 ** (silence_thresh / 20.0)) * audio_segment.max_possible_amplitude
+        silence_starts = np.flatnonzero(rms <= threshold)
+        
+        if len(silence_starts) == 0:
+            return [[0, seg_len]]
+        
+        # Silent windows that overlap or touch merge into one range
+        breaks = np.flatnonzero(np.diff(silence_starts) > min_silence_len)
+        range_starts = np.concatenate(([silence_starts[0]], silence_starts[breaks + 1]))
+        range_ends = np.concatenate((silence_starts[breaks], [silence_starts[-1]])) + min_silence_len
+        
+        # Short circuit when the whole audio segment is silent
+        if range_starts[0] == 0 and range_ends[0] == seg_len:
+            return []
+        
+        nonsilent_ranges = []
+        prev_end = 0
+        for start, end in zip(range_starts.tolist(), range_ends.tolist()):
+            nonsilent_ranges.append([prev_end, start])
+            prev_end = end
+        if prev_end != seg_len:
+            nonsilent_ranges.append([prev_end, seg_len])
+        if nonsilent_ranges[0] == [0, 0]:
+            nonsilent_ranges.pop(0)
+        
+        return nonsilent_ranges
+    
     def _trim_silence(self, audio_segment: 'AudioSegment', silence_thresh: int = -40) -> 'AudioSegment':
         """
         Trim silence from the beginning and end of an audio segment.
@@ -761,10 +3604,8 @@ Create a script that feels like it was written by the same caring hosts who wrot
             Trimmed audio segment
         """
         try:
-            from pydub.silence import detect_nonsilent
-            
             # Detect non-silent chunks with gentler settings
-            nonsilent_chunks = detect_nonsilent(
+            nonsilent_chunks = self._detect_nonsilent(
                 audio_segment, 
                 min_silence_len=200,  # 200ms minimum silence (more conservative)
                 silence_thresh=silence_thresh
@@ -804,10 +3645,8 @@ Create a script that feels like it was written by the same caring hosts who wrot
             Gently trimmed audio segment
         """
         try:
-            from pydub.silence import detect_nonsilent
-            
             # Use very conservative settings
-            nonsilent_chunks = detect_nonsilent(
+            nonsilent_chunks = self._detect_nonsilent(
                 audio_segment, 
                 min_silence_len=300,  # 300ms minimum silence (very conservative)
                 silence_thresh=silence_thresh  # Less sensitive threshold
@@ -906,12 +3745,293 @@ Create a script that feels like it was written by the same caring hosts who wrot
             print(f"   ⚠️ Crossfade failed, using simple join: {str(e)}")
             return combined + pause + new_segment
     
+    def _normalization_gain(self, audio_segment: 'AudioSegment', target_dBFS: float = -20.0) -> float:
+        """
+        Gain in dB that _normalize_volume would apply to reach the target level.
+        
+        Returns:
+            Gain in dB (0.0 for silent segments, which can't be normalized)
+        """
+        change_in_dBFS = target_dBFS - audio_segment.dBFS
+        if change_in_dBFS == float("inf"):
+            return 0.0
+        return change_in_dBFS
+    
+    def _speech_bounds(self, audio_segment: 'AudioSegment', gain_db: float = 0.0, need_start: bool = True,
+                       silence_thresh: int = -40, min_silence_len: int = 200,
+                       window_ms: int = 1500) -> Optional[tuple]:
+        """
+        Locate speech in a segment the way _trim_silence would see it after normalization.
+        
+        Only the edges of the segment are analyzed: a window at the tail (and at the
+        head, if need_start) that doubles until it contains speech. The result matches
+        a full detect_nonsilent pass, but the cost no longer grows with segment length.
+        
+        Three details keep the match exact. Each window is leveled with apply_gain
+        rather than by shifting the threshold, since apply_gain rounds samples and a
+        slice sitting right at the threshold can land on either side of it. Windows
+        are cut on whole frames (pydub truncates ms positions to frames, so a window
+        starting mid-frame would see shifted analysis slices at rates like 22050 or
+        11025 Hz). And an edge found
+        within min_silence_len of the cut is not trusted, because a full pass could
+        merge the silence there with silence on the other side of the cut; the
+        window grows instead.
+        
+        Args:
+            audio_segment: The (un-normalized) audio segment
+            gain_db: Gain that will be applied when mixing
+            need_start: Whether to also locate where speech starts
+            silence_thresh: Silence threshold in dB at the normalized level
+            min_silence_len: Minimum silence length in ms
+            window_ms: Initial analysis window in ms
+        
+        Returns:
+            (start_ms, end_ms) of the first and last non-silent audio (start_ms is None
+            when not requested), or None if the segment is silent
+        """
+        length = len(audio_segment)
+        # Positions that are a multiple of step ms fall exactly on a frame
+        step = 1000 // math.gcd(int(audio_segment.frame_rate), 1000)
+        
+        def find_edge(from_end: bool) -> Optional[int]:
+            window = window_ms
+            while True:
+                if from_end:
+                    offset = max(0, length - window)
+                    offset -= offset % step
+                    window = length - offset
+                else:
+                    offset = 0
+                    window = min(length, -(-window // step) * step)
+                # Level the window the way _normalize_volume would (apply_gain rounds the
+                # samples, so merely shifting the threshold can flip windows right at it)
+                clip = audio_segment[offset:offset + window]
+                if gain_db:
+                    clip = clip.apply_gain(gain_db)
+                chunks = self._detect_nonsilent(clip, min_silence_len=min_silence_len, silence_thresh=silence_thresh)
+                if window >= length:
+                    if not chunks:
+                        return None
+                    return chunks[-1][1] if from_end else chunks[0][0]
+                if chunks:
+                    edge = chunks[-1][1] if from_end else chunks[0][0]
+                    if (edge >= min_silence_len) if from_end else (edge <= window - min_silence_len):
+                        return offset + edge
+                window *= 2
+        
+        try:
+            end = find_edge(from_end=True)
+            if end is None:
+                return None
+            start = find_edge(from_end=False) if need_start else None
+        except Exception:
+            return None
+        return start, end
+    
+    def _prepare_segment(self, i: int, segment, need_start: bool = True) -> PreparedSegment:
+        """
+        Decode, trim and measure one segment for the mixer.
+        
+        Runs in the segment preparation workers as well as in-process, so it only
+        depends on the segment itself.
+        
+        Args:
+            i: Segment index in script order (the first few get gentler trimming)
+            segment: Decoded AudioSegment, or path of a segment file
+            need_start: Whether to also locate where speech starts
+        
+        Returns:
+            The trimmed segment's PCM with its normalization gain and speech bounds
+        """
+        if not hasattr(segment, "raw_data"):
+            from pydub import AudioSegment
+            with self.metrics.span("decode", bytes=os.path.getsize(segment)):
+                segment = AudioSegment.from_file(segment)
+        
+        # Use gentler trimming for first few segments (intro is important)
+        with self.metrics.span("trim", index=i):
+            if i <= 3:  # First 4 segments get gentle treatment
+                segment = self._trim_silence_gentle(segment)
+            else:
+                segment = self._trim_silence(segment)
+        
+        # Normalize volume levels at render time; only the segment's edges are analyzed
+        with self.metrics.span("normalize", index=i):
+            gain_db = self._normalization_gain(segment)
+            speech = self._speech_bounds(segment, gain_db, need_start=need_start)
+        return PreparedSegment(segment.raw_data, segment.frame_rate, segment.channels, segment.sample_width,
+                               gain_db, speech)
+    
+    def _add_to_mixer(self, mixer: Optional[TimelineMixer], i: int, segment,
+                      timing_info: str) -> TimelineMixer:
+        """
+        Trim and level one segment (unless it is already prepared) and plan its placement.
+        
+        Args:
+            mixer: The episode's mixer, or None for the first segment
+            i: Segment index in script order
+            segment: Decoded segment audio, or a PreparedSegment
+            timing_info: "normal", "overlap", "simultaneous" or "continue"
+        
+        Returns:
+            The mixer (created from the first segment's audio format if needed)
+        """
+        if not isinstance(segment, PreparedSegment):
+            segment = self._prepare_segment(i, segment, need_start=mixer is None or mixer.needs_speech_start)
+        
+        if mixer is None:
+            mixer = TimelineMixer(segment.frame_rate, segment.channels,
+                                  4 if segment.sample_width == 3 else segment.sample_width)
+        
+        # Where speech starts only matters until the timeline has speech
+        speech = segment.speech
+        if speech is not None and not mixer.needs_speech_start:
+            speech = (None, speech[1])
+        gain_db = segment.gain_db
+        segment = segment.audio()
+        
+        # Natural conversation timing: 0.4s comfortable pause with a 100ms crossfade; a
+        # turn that packing split in two only gets a sentence pause between its pieces
+        pause_ms = 150 if timing_info == "continue" else 400
+        mixer.add(segment, timing_info, gain_db, speech, index=i, pause_ms=pause_ms, crossfade_ms=100)
+        return mixer
+    
+    def _mix_segments(self, segments) -> 'AudioSegment':
+        """
+        Trim, level and place segments on a timeline, then render the episode.
+        
+        Args:
+            segments: Iterable of (AudioSegment or PreparedSegment, timing_info) tuples
+                in script order
+        
+        Returns:
+            The mixed episode
+        """
+        mixer = None
+        for i, (segment, timing_info) in enumerate(segments):
+            mixer = self._add_to_mixer(mixer, i, segment, timing_info)
+        
+        # Pauses, overlaps and crossfades are all applied in this single pass
+        with self.metrics.span("render", segments=mixer.segment_count):
+            return mixer.render()
+    
+    def _stream_podcast(self, segments: List[tuple], output_filename: str, segments_dir: str = "segments",
+                        manifest: Optional[EpisodeManifest] = None) -> bool:
+        """
+        Synthesize, mix and encode the episode progressively.
+        
+        Segments are handed to the mixer in script order as soon as they (and all
+        segments before them) are synthesized. Every prefix of the timeline that
+        becomes final is piped straight into a long-lived ffmpeg encoder, so the
+        output grows while later segments are still being generated.
+        
+        Args:
+            segments: List of (text, host or voice_id, timing_info) tuples
+            output_filename: Output file, or "-" for stdout
+            segments_dir: Directory for this episode's segment files
+            manifest: Optional episode checkpoints to resume from and update
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        from pydub import AudioSegment
+        
+        started = time.time()
+        state = {"mixer": None, "encoder": None, "first_audio": None}
+        
+        def on_ready(i: int, audio, timing_info: str) -> None:
+            segment = audio if isinstance(audio, AudioSegment) else AudioSegment.from_file(audio)
+            mixer = self._add_to_mixer(state["mixer"], i, segment, timing_info)
+            state["mixer"] = mixer
+            
+            if state["encoder"] is None:
+                state["encoder"] = StreamingEncoder(output_filename, mixer.frame_rate, mixer.channels,
+                                                    mixer.sample_width, self.stream_format)
+            pcm = mixer.flush()
+            if pcm and state["first_audio"] is None:
+                state["first_audio"] = time.time() - started
+                print(f"🔊 First audio streamed after {state['first_audio']:.1f}s")
+            state["encoder"].write(pcm)
+        
+        audio_files = None
+        encoded = False
+        try:
+            audio_files = self._synthesize_segments(segments, on_ready=on_ready, segments_dir=segments_dir,
+                                                    manifest=manifest)
+            if audio_files is not None:
+                state["encoder"].write(state["mixer"].flush(final=True))
+        except Exception as e:
+            print(f"❌ Error while streaming episode: {str(e)}")
+            audio_files = None
+        finally:
+            if state["encoder"] is not None:
+                encoded = state["encoder"].close(complete=audio_files is not None)
+        
+        if audio_files is None or not encoded:
+            print("❌ Streaming encode failed")
+            return False
+        
+        print(f"🎉 Podcast streamed successfully: {output_filename} ({time.time() - started:.1f}s)")
+        return True
+    
+    def _segment_pool(self) -> ProcessPoolExecutor:
+        """The segment preparation pool, started on first use and shared by all episodes."""
+        with self._mix_pool_lock:
+            if self._mix_pool is None:
+                # Never forked from this process: TTS and poller threads may be holding locks by now
+                method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                self._mix_pool = ProcessPoolExecutor(max_workers=self.mix_workers,
+                                                     mp_context=multiprocessing.get_context(method),
+                                                     initializer=_init_segment_worker)
+            return self._mix_pool
+    
+    def _discard_segment_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Shut down a failed pool so the next episode starts a fresh one."""
+        with self._mix_pool_lock:
+            if self._mix_pool is pool:
+                self._mix_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _prepared_segments(self, segments: List[tuple]):
+        """
+        Decode, trim and measure segment files for the mixer in worker processes.
+        
+        Segments are independent until they are placed, so with at least
+        mix_pool_min_segments files (and more than one worker) they are prepared in
+        the pool and handed over in script order as they complete; the mixer places
+        each one while later ones are still being decoded. Segments that are already
+        decoded (in-memory PCM pipeline) are cheaper to trim in-process than to ship to
+        a worker, so they, smaller episodes and whatever is left if the pool fails
+        are prepared by the mixer itself.
+        
+        Args:
+            segments: (AudioSegment or file path, timing_info) tuples in script order
+        
+        Yields:
+            (PreparedSegment or the original audio, timing_info) tuples in script order
+        """
+        done = 0
+        jobs = [(i, audio) for i, (audio, _) in enumerate(segments) if isinstance(audio, str)]
+        if self.mix_workers > 1 and len(jobs) == len(segments) >= self.mix_pool_min_segments:
+            pool = None
+            try:
+                pool = self._segment_pool()
+                for prepared, seconds in pool.map(_prepare_segment_job, jobs):
+                    self.metrics.add(prepared_segments=1, prepare_seconds=seconds)
+                    yield prepared, segments[done][1]
+                    done += 1
+            except Exception as e:
+                print(f"⚠️ Parallel segment preparation failed ({str(e)}), continuing in-process")
+                if pool is not None:
+                    self._discard_segment_pool(pool)
+        yield from segments[done:]
+    
     def combine_audio_files_smart(self, audio_files: List[tuple], output_filename: str) -> bool:
         """
         Combine audio files with smart timing based on dialogue markers.
         
         Args:
-            audio_files: List of (filename, timing_info) tuples
+            audio_files: List of (filename or AudioSegment, timing_info) tuples
             output_filename: Output filename
         Returns:
             True if successful, False otherwise
@@ -928,76 +4048,30 @@ Create a script that feels like it was written by the same caring hosts who wrot
                 simple_files = [f[0] if isinstance(f, tuple) else f for f in audio_files]
                 return self.combine_audio_files(simple_files, output_filename, overlap_probability=0.2)
 
+            if importlib.util.find_spec("numpy") is None:
+                print("⚠️ numpy not available, falling back to simple combination")
+                simple_files = [f[0] if isinstance(f, tuple) else f for f in audio_files]
+                return self.combine_audio_files(simple_files, output_filename, overlap_probability=0.2)
+
             print(f"🔗 Combining {len(audio_files)} audio segments with smart timing")
             
-            # Load first segment
-            if isinstance(audio_files[0], tuple):
-                first_file, _ = audio_files[0]
-            else:
-                first_file = audio_files[0]
-            
-            # Load first segment with gentle trimming
-            combined = AudioSegment.from_mp3(first_file)
-            combined = self._trim_silence_gentle(combined)  # Use gentler trimming for first segment
-            combined = self._normalize_volume(combined)
+            segments = [audio_info if isinstance(audio_info, tuple) else (audio_info, "normal")
+                        for audio_info in audio_files]
             
-            # Natural conversation timing with more breathing room
-            tiny_pause = AudioSegment.silent(duration=200)     # 0.2 seconds - quick but natural
-            short_pause = AudioSegment.silent(duration=400)    # 0.4 seconds - comfortable pause
-            normal_pause = AudioSegment.silent(duration=600)   # 0.6 seconds - natural breath
+            # Plan every placement, then render the episode in a single pass
+            combined = self._mix_segments(self._prepared_segments(segments))
             
-            for i, audio_info in enumerate(audio_files[1:], 1):
-                if isinstance(audio_info, tuple):
-                    audio_file, timing_info = audio_info
-                else:
-                    audio_file = audio_info
-                    timing_info = "normal"
-                
-                # Load and trim silence from this segment
-                segment = AudioSegment.from_mp3(audio_file)
-                # Use gentler trimming for first few segments (intro is important)
-                if i <= 3:  # First 3 segments get gentle treatment
-                    segment = self._trim_silence_gentle(segment)
-                else:
-                    segment = self._trim_silence(segment)
-                # Normalize volume levels
-                segment = self._normalize_volume(segment)
-                
-                if timing_info == "overlap":
-                    # MUCH more aggressive overlap - cut into previous segment
-                    # Trim end of combined first, then overlap heavily
-                    combined = self._trim_silence(combined)
-                    overlap_ms = min(2000, len(segment) // 1.5, len(combined) // 2)  # Very aggressive
-                    print(f"   🔄 TIGHT overlap segment {i+1} by {overlap_ms} ms")
-                    
-                    if overlap_ms > 100:  # Only overlap if meaningful
-                        pre = combined[:-overlap_ms]
-                        overlay = combined[-overlap_ms:].overlay(segment[:overlap_ms])
-                        post = segment[overlap_ms:]
-                        combined = pre + overlay + post
-                    else:
-                        # Direct connection - no pause at all
-                        combined = combined + segment
-                    
-                elif timing_info == "simultaneous":
-                    # True simultaneous - back up significantly and overlay
-                    print(f"   🎭 SIMULTANEOUS overlay for segment {i+1}")
-                    combined = self._trim_silence(combined)
-                    backup_ms = min(1000, len(combined) // 3, len(segment))
-                    if backup_ms > 0:
-                        before = combined[:-backup_ms]
-                        overlay_section = combined[-backup_ms:].overlay(segment)
-                        combined = before + overlay_section
-                    else:
-                        combined = combined.overlay(segment)
-                    
-                else:  # normal - natural conversation flow
-                    # Trim both segments and add with crossfade
-                    combined = self._trim_silence(combined)
-                    combined = self._add_with_crossfade(combined, segment, short_pause)
-                    print(f"   ➡️  Added segment {i+1} with smooth crossfade")
-
-            combined.export(output_filename, format="mp3")
+            # .wav outputs skip the encoder (and so ffmpeg) entirely
+            export_format = "wav" if output_filename.lower().endswith(".wav") else "mp3"
+            partial_filename = partial_output_for(output_filename)
+            with self.metrics.span("export", format=export_format) as span:
+                try:
+                    combined.export(partial_filename, format=export_format)
+                    span.add(bytes=os.path.getsize(partial_filename))
+                except Exception:
+                    publish_output(partial_filename, output_filename, False)
+                    raise
+                publish_output(partial_filename, output_filename, True)
             print(f"✅ Combined audio saved to: {output_filename}")
             return True
             
@@ -1007,6 +4081,156 @@ Create a script that feels like it was written by the same caring hosts who wrot
             simple_files = [f[0] if isinstance(f, tuple) else f for f in audio_files]
             return self.combine_audio_files(simple_files, output_filename, overlap_probability=0.2)
 
+# Per-process generator used by the segment preparation workers (see _prepared_segments)
+_SEGMENT_PREPARER = None
+
+
+def _init_segment_worker() -> None:
+    global _SEGMENT_PREPARER
+    _SEGMENT_PREPARER = AIPodcastGenerator("", use_cache=False)
+
+
+def _prepare_segment_job(job: tuple) -> tuple:
+    """
+    Prepare one segment file in a worker process.
+    
+    Args:
+        job: (index, segment file path)
+    
+    Returns:
+        (PreparedSegment, seconds spent preparing it)
+    """
+    started = time.perf_counter()
+    i, filename = job
+    return _SEGMENT_PREPARER._prepare_segment(i, filename), time.perf_counter() - started
+
+
+def script_filename_for(output_filename: str) -> str:
+    """Return the path the generated script is saved to for a given audio output."""
+    if output_filename == "-":
+        return "podcast_stream_script.txt"
+    return os.path.splitext(output_filename)[0] + "_script.txt"
+
+def partial_output_for(output_filename: str) -> str:
+    """
+    Temporary path next to output_filename that an episode is rendered to.
+    
+    It keeps the extension (ffmpeg picks the container from it) and is only moved
+    over the output by publish_output once the render is complete, so a failed or
+    killed run never leaves a truncated episode at output_filename.
+    """
+    root, extension = os.path.splitext(output_filename)
+    return f"{root}.{os.getpid()}.{threading.get_ident()}.partial{extension}"
+
+def publish_output(partial_filename: str, output_filename: str, success: bool) -> bool:
+    """Move a complete render into place (or discard a failed one) and return success."""
+    if success:
+        os.replace(partial_filename, output_filename)
+    else:
+        try:
+            os.remove(partial_filename)
+        except OSError:
+            pass
+    return success
+
+def episode_job_id(output_filename: str) -> str:
+    """Stable workspace name for the episode rendered to output_filename."""
+    path = os.path.abspath(output_filename)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return f"{stem}_{hashlib.sha256(path.encode('utf-8')).hexdigest()[:12]}"
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count for OpenAI models (about 4 characters per token of English).
+    
+    Good enough to choose between single-shot and chunked analysis; it is not a
+    substitute for the model's tokenizer.
+    """
+    return max(1, (len(text) + 3) // 4)
+
+def split_transcript(transcript: str, max_tokens: int) -> List[str]:
+    """
+    Split a transcript into chunks of at most about max_tokens estimated tokens.
+    
+    Chunks break between lines where possible, then between sentences, and only
+    split inside a sentence (between words) when a single sentence is too long.
+    
+    Args:
+        transcript: The conversation transcript text
+        max_tokens: Token budget per chunk
+    
+    Returns:
+        List of transcript chunks in order
+    """
+    pieces = []
+    for line in transcript.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        if estimate_tokens(line) <= max_tokens:
+            pieces.append(line)
+            continue
+        for sentence in re.split(r'(?<=[.!?])\s+', line):
+            if estimate_tokens(sentence) <= max_tokens:
+                pieces.append(sentence)
+                continue
+            words = []
+            for word in sentence.split():
+                if words and estimate_tokens(" ".join(words + [word])) > max_tokens:
+                    pieces.append(" ".join(words))
+                    words = []
+                words.append(word)
+            if words:
+                pieces.append(" ".join(words))
+    
+    chunks = []
+    current = []
+    current_tokens = 0
+    for piece in pieces:
+        piece_tokens = estimate_tokens(piece)
+        if current and current_tokens + piece_tokens > max_tokens:
+            chunks.append("\n".join(current))
+            current, current_tokens = [], 0
+        current.append(piece)
+        current_tokens += piece_tokens
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+def merge_analyses(partials: List[Dict]) -> Dict:
+    """
+    Merge chunk analyses into one analysis without another model call.
+    
+    List items are deduplicated; items mentioned by more chunks come first. Core
+    themes are capped at 3, as the analysis prompt asks for.
+    
+    Args:
+        partials: Analyses of consecutive transcript chunks
+    
+    Returns:
+        Dictionary containing every field in ANALYSIS_FIELDS
+    """
+    merged = {}
+    for field in ANALYSIS_FIELDS:
+        counts = {}
+        items = {}
+        for partial in partials:
+            values = partial.get(field) or []
+            if not isinstance(values, list):
+                values = [values]
+            for value in values:
+                text = value if isinstance(value, str) else json.dumps(value)
+                key = text.strip().lower()
+                if key not in items:
+                    items[key] = value
+                    counts[key] = 0
+                counts[key] += 1
+        # Stable sort keeps first-seen order among equally common items
+        ranked = sorted(items, key=lambda key: -counts[key])
+        merged[field] = [items[key] for key in ranked]
+    merged["core_themes"] = merged["core_themes"][:3]
+    return merged
+
 def load_sample_conversations() -> Dict[str, str]:
     """
     Load sample conversations for testing.
@@ -1064,6 +4288,186 @@ def load_sample_conversations() -> Dict[str, str]:
     
     return conversations
 
+def load_batch_manifest(batch_path: str) -> List[Dict]:
+    """
+    Load the episodes for a batch run.
+    
+    Args:
+        batch_path: Either a directory of .txt transcripts (one episode per file) or a
+            JSONL manifest with one episode per line. Manifest entries need an "id"
+            and one of "transcript", "transcript_file", "script_file" or "sample";
+            "output" optionally overrides the output filename.
+    
+    Returns:
+        List of episode dictionaries
+    """
+    episodes = []
+    if os.path.isdir(batch_path):
+        for name in sorted(os.listdir(batch_path)):
+            if name.endswith(".txt"):
+                episodes.append({
+                    "id": os.path.splitext(name)[0],
+                    "transcript_file": os.path.join(batch_path, name)
+                })
+        return episodes
+    
+    base_dir = os.path.dirname(os.path.abspath(batch_path))
+    with open(batch_path, 'r') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            episode = json.loads(line)
+            episode.setdefault("id", f"episode_{line_number:04d}")
+            # Relative paths in a manifest are relative to the manifest itself
+            for key in ("transcript_file", "script_file"):
+                if key in episode and not os.path.isabs(episode[key]):
+                    episode[key] = os.path.join(base_dir, episode[key])
+            episodes.append(episode)
+    return episodes
+
+def _run_batch_episode(generator: 'AIPodcastGenerator', episode: Dict, output_dir: str) -> Dict:
+    """
+    Generate one batch episode and describe the outcome.
+    
+    Returns:
+        Result record with id, output, status ("ok", "failed" or "skipped"), timing and
+        TTS usage per provider
+    """
+    episode_id = str(episode["id"])
+    output_filename = episode.get("output") or os.path.join(output_dir, f"{episode_id}.mp3")
+    result = {"id": episode_id, "output": output_filename}
+    
+    # Resume support: anything already rendered is left alone (episodes are only moved
+    # to their output path once complete, so an existing file is a finished episode)
+    if os.path.exists(output_filename) and os.path.getsize(output_filename) > 0:
+        result.update(status="skipped", seconds=0.0)
+        return result
+    
+    started = time.time()
+    ledger = CharacterLedger()
+    token = _TTS_LEDGER.set(ledger)
+    try:
+        if "script_file" in episode:
+            success = generator.generate_podcast_from_script(episode["script_file"], output_filename)
+        else:
+            if "transcript" in episode:
+                transcript = episode["transcript"]
+            elif "transcript_file" in episode:
+                with open(episode["transcript_file"], 'r') as f:
+                    transcript = f.read()
+            elif "sample" in episode:
+                transcript = load_sample_conversations()[episode["sample"]]
+            else:
+                raise ValueError("episode needs transcript, transcript_file, script_file or sample")
+            if not transcript.strip():
+                raise ValueError("empty transcript")
+            success = generator.generate_podcast(transcript, output_filename)
+        result["status"] = "ok" if success else "failed"
+    except Exception as e:
+        result.update(status="failed", error=str(e))
+    finally:
+        _TTS_LEDGER.reset(token)
+    result["seconds"] = round(time.time() - started, 2)
+    result["tts_usage"] = ledger.usage
+    return result
+
+def run_batch(generator: 'AIPodcastGenerator', batch_path: str, output_dir: str, workers: int = 2) -> bool:
+    """
+    Generate every episode in a batch with one shared generator.
+    
+    Episodes run on a bounded worker pool and share the generator's HTTP session,
+    OpenAI client and caches. One result record per episode is appended to
+    batch_results.jsonl in the output directory.
+    
+    Args:
+        generator: Configured generator shared by all episodes
+        batch_path: Directory of transcripts or JSONL manifest (see load_batch_manifest)
+        output_dir: Directory for episode audio, scripts and results
+        workers: Number of episodes generated concurrently
+    
+    Returns:
+        True if no episode failed, False otherwise
+    """
+    try:
+        episodes = load_batch_manifest(batch_path)
+    except Exception as e:
+        print(f"❌ Error reading batch {batch_path}: {str(e)}")
+        return False
+    if not episodes:
+        print(f"❌ No episodes found in {batch_path}")
+        return False
+    
+    os.makedirs(output_dir, exist_ok=True)
+    workers = max(1, min(workers, len(episodes)))
+    
+    # Concurrent episodes multiply the number of in-flight provider requests; the governors
+    # are shared, so their ceilings scale with the episode count (AIMD backs off from there)
+    if workers > 1:
+        generator.http.resize(generator._http_pool_size(workers))
+        for governor in generator.governors.values():
+            governor.set_max_concurrency(generator.tts_concurrency * workers)
+    
+    results_path = os.path.join(output_dir, "batch_results.jsonl")
+    results_lock = threading.Lock()
+    usage = CharacterLedger()
+    counts = {"ok": 0, "failed": 0, "skipped": 0}
+    started = time.time()
+    print(f"📦 Batch: {len(episodes)} episodes, {workers} workers → {output_dir}")
+    
+    def process(episode: Dict) -> None:
+        result = _run_batch_episode(generator, episode, output_dir)
+        for provider, entry in result.get("tts_usage", {}).items():
+            usage.charge(provider, entry["chars"], entry["requests"])
+        with results_lock:
+            counts[result["status"]] += 1
+            with open(results_path, 'a') as f:
+                f.write(json.dumps(result) + "\n")
+        icon = {"ok": "✅", "failed": "❌", "skipped": "⏭️ "}[result["status"]]
+        print(f"{icon} [{result['id']}] {result['status']} ({result['seconds']:.1f}s)")
+    
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="episode") as executor:
+        list(executor.map(process, episodes))
+    
+    print(f"\n📦 Batch complete in {time.time() - started:.1f}s: "
+          f"{counts['ok']} ok, {counts['skipped']} skipped, {counts['failed']} failed")
+    print(f"📄 Results: {results_path}")
+    print(f"💳 Batch TTS usage: {usage.describe()}")
+    if generator.prompt_tokens_saved:
+        print(f"✂️  Example excerpting saved ~{generator.prompt_tokens_saved} prompt tokens across the batch")
+    return counts["failed"] == 0
+
+def write_run_reports(generator: AIPodcastGenerator, success: bool, metrics_out: Optional[str] = None,
+                      profiler=None, profile_out: Optional[str] = None) -> None:
+    """
+    Write the --metrics-out JSON and --profile dump for a finished run.
+    
+    Args:
+        generator: The generator whose metrics were recorded
+        success: Whether the run succeeded
+        metrics_out: Metrics JSON path (None to skip)
+        profiler: Running cProfile.Profile (None to skip)
+        profile_out: Where to dump the profile
+    """
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(profile_out)
+        print(f"🧭 Profile written to: {profile_out} (view with: python -m pstats {profile_out})")
+    
+    if metrics_out:
+        cache_stats = {}
+        for name, cache in (("tts", generator.tts_cache), ("llm", generator.llm_cache)):
+            if cache is not None:
+                cache_stats[name] = {"hits": cache.hits, "misses": cache.misses}
+        try:
+            generator.metrics.write(metrics_out, success=success, tts_retries=generator.http.retries,
+                                    prompt_tokens_saved=generator.prompt_tokens_saved, caches=cache_stats,
+                                    tts_providers={name: governor.stats()
+                                                   for name, governor in generator.governors.items()})
+            print(f"📈 Metrics written to: {metrics_out}")
+        except Exception as e:
+            print(f"⚠️ Could not write metrics: {str(e)}")
+
 def main():
     """Main function to run the AI Podcast Generator."""
     parser = argparse.ArgumentParser(description="Generate AI podcast episodes from conversation transcripts")
@@ -1071,26 +4475,86 @@ def main():
     parser.add_argument("--output", "-o", default="ai_podcast.mp3", help="Output filename")
     parser.add_argument("--sample", "-s", default="heavy_emotional_disclosure", help="Use a sample conversation (heavy_emotional_disclosure, goal_setting_accountability, light_reflective_checkin, crisis_management, long_term_patterns)")
     parser.add_argument("--script-file", help="Path to a pre-written script file (instead of transcript/sample)")
-    parser.add_argument("--combine-only", action="store_true", help="Just combine existing segments/ files")
+    parser.add_argument("--combine-only", action="store_true", help="Just combine existing segment files from --segments-dir")
+    parser.add_argument("--segments-dir", default=None, help="Segment directory for --combine-only (default: the kept workspace of the episode rendered to --output), or to use instead of a private workspace when generating")
+    parser.add_argument("--no-resume", action="store_true", help="Ignore checkpoints from an earlier, interrupted run of the same episode")
+    parser.add_argument("--work-dir", default=None, help=f"Parent directory for per-job workspaces (default: {DEFAULT_WORK_DIR})")
     parser.add_argument("--api-key", default="", help="ElevenLabs API key")
     parser.add_argument("--playht-key", default="", help="Play.ht API key")
     parser.add_argument("--playht-user", default="", help="Play.ht User ID")
     parser.add_argument("--openai-key", default="", help="OpenAI API key for script generation")
     parser.add_argument("--use-playht", default=False, action="store_true", help="Force use Play.ht instead of ElevenLabs")
+    parser.add_argument("--hedge", action="store_true", help="Send slow TTS requests to the other provider as well and use whichever finishes first")
+    parser.add_argument("--requests-per-minute", action="append", default=[], metavar="PROVIDER=N", help="Request quota for a TTS provider (elevenlabs or playht); repeatable")
+    parser.add_argument("--chars-per-minute", action="append", default=[], metavar="PROVIDER=N", help="Character quota for a TTS provider; repeatable")
+    parser.add_argument("--hedge-percentile", type=float, default=90.0, help="Hedge requests slower than this percentile of recent primary latencies (default: 90)")
+    parser.add_argument("--concurrency", "-j", type=int, default=4, help="Number of segments to synthesize in parallel (default: 4)")
+    parser.add_argument("--mix-workers", type=int, default=None, help="Processes that decode, trim and level segments before mixing (default: CPU count; 1 to prepare them in-process)")
+    parser.add_argument("--segment-chars", type=int, default=2000, help="Character budget per TTS request: merge short same-voice turns up to it, split longer ones at sentence boundaries (default: 2000, 0 to disable)")
+    parser.add_argument("--cache-dir", default=None, help=f"Directory for persistent caches (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--cache-max-mb", type=int, default=500, help="Size budget for the TTS audio cache in MB (default: 500)")
+    parser.add_argument("--no-cache", action="store_true", help="Always call the TTS provider and OpenAI instead of reusing cached audio and responses")
+    parser.add_argument("--refresh-llm", action="store_true", help="Ignore cached OpenAI analysis/script responses and regenerate (the new ones are cached)")
+    parser.add_argument("--pcm", action="store_true", help="Request raw PCM from the TTS provider and keep segments in memory (no per-segment decode)")
+    parser.add_argument("--keep-segments", action="store_true", help="Keep this job's segment files (PCM segments as WAV) for --combine-only")
+    parser.add_argument("--checkpoint-pcm", action="store_true", help="With --pcm, write each segment as WAV so an interrupted run resumes synthesis where it stopped")
+    parser.add_argument("--fast", action="store_true", help="Get the analysis and the script from a single OpenAI request (falls back to two if the response is malformed)")
+    parser.add_argument("--pipeline", action="store_true", help="Stream the script from OpenAI and start synthesizing each segment as soon as it is written")
+    parser.add_argument("--stream", action="store_true", help="Encode the episode progressively while segments are still being synthesized (use --output - for stdout)")
+    parser.add_argument("--stream-format", choices=["mp3", "opus"], default=None, help="Codec for --stream (default: from the output extension, else mp3)")
+    parser.add_argument("--batch", help="Directory of .txt transcripts or JSONL manifest to generate in one run")
+    parser.add_argument("--batch-out", default="batch_output", help="Output directory for --batch (default: batch_output)")
+    parser.add_argument("--batch-workers", type=int, default=2, help="Episodes generated concurrently in --batch mode (default: 2)")
+    parser.add_argument("--prune-cache", action="store_true", help="Evict least recently used cache entries down to --cache-max-mb and exit")
+    parser.add_argument("--metrics-out", default=None, help="Write per-stage and per-request timings (duration, bytes, chars, retries, cache hits) to this JSON file")
+    parser.add_argument("--profile", default=None, help="Write a cProfile dump of the run (main thread) to this file")
     
     args = parser.parse_args()
     
+    profiler = None
+    if args.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    
+    if args.output == "-":
+        if not args.stream:
+            parser.error("--output - requires --stream")
+        # Keep stdout clean for the audio stream; progress goes to stderr
+        sys.stdout = sys.stderr
+    
+    cache_max_bytes = args.cache_max_mb * 1024 * 1024
+    
+    # Handle cache maintenance
+    if args.prune_cache:
+        cache = DiskCache(os.path.join(args.cache_dir or DEFAULT_CACHE_DIR, "tts"), cache_max_bytes)
+        removed, freed = cache.prune()
+        stats = cache.stats()
+        print(f"🧹 Pruned {removed} cached segments ({freed / (1024 * 1024):.1f} MB freed)")
+        print(f"   Cache now holds {stats['entries']} segments ({stats['bytes'] / (1024 * 1024):.1f} MB)")
+        llm_cache = DiskCache(os.path.join(args.cache_dir or DEFAULT_CACHE_DIR, "llm"), LLM_CACHE_MAX_BYTES)
+        removed, freed = llm_cache.prune()
+        print(f"🧹 Pruned {removed} cached OpenAI responses ({freed / (1024 * 1024):.1f} MB freed)")
+        sys.exit(0)
+    
     # Handle combine-only mode
     if args.combine_only:
         print("🔗 Combine-only mode: combining existing segments...")
         # Create generator without API key for combining only
         generator = AIPodcastGenerator("dummy_key")  # Won't be used for combining
-        success = generator.combine_segments_only(args.output)
+        generator.metrics.enabled = bool(args.metrics_out)
+        if args.mix_workers is not None:
+            generator.mix_workers = max(1, args.mix_workers)
+        if args.work_dir:
+            generator.work_dir = args.work_dir
+        with generator.metrics.span("combine_only"):
+            success = generator.combine_segments_only(args.output, args.segments_dir)
         if success:
             print(f"\n🎉 Audio combination complete!")
             print(f"📁 Output file: {args.output}")
         else:
             print("\n❌ Audio combination failed")
+        write_run_reports(generator, success, args.metrics_out, profiler, args.profile)
         sys.exit(0 if success else 1)
     
     # Get API key
@@ -1109,9 +4573,52 @@ def main():
     if not openai_key:
         print("⚠️ OpenAI API key not provided - using fallback script generation")
         print("   Provide with --openai-key or OPENAI_API_KEY environment variable for AI generation")
+    elif importlib.util.find_spec("openai") is None:
+        print("❌ Error: the openai package is not installed.")
+        print("   Install the dependencies with: pip install -r requirements.txt")
+        sys.exit(1)
     
     # Initialize the generator
-    generator = AIPodcastGenerator(api_key, playht_key, playht_user, openai_key)
+    generator = AIPodcastGenerator(api_key, playht_key, playht_user, openai_key, tts_concurrency=args.concurrency,
+                                   cache_dir=args.cache_dir, cache_max_bytes=cache_max_bytes,
+                                   use_cache=not args.no_cache)
+    generator.metrics.enabled = bool(args.metrics_out)
+    
+    # Provider quotas
+    quotas = {}
+    try:
+        for option, values in (("requests", args.requests_per_minute), ("chars", args.chars_per_minute)):
+            for value in values:
+                provider, _, amount = value.partition("=")
+                if provider not in generator.governors:
+                    raise ValueError(f"unknown provider '{provider}'")
+                quotas.setdefault(provider, {})[option] = float(amount)
+    except ValueError as e:
+        parser.error(f"invalid quota: {str(e)}")
+    for provider, quota in quotas.items():
+        generator.governors[provider].set_quota(quota.get("requests"), quota.get("chars"))
+        print(f"🚦 {provider} quota: {quota.get('requests', 'unlimited')} requests/min, "
+              f"{quota.get('chars', 'unlimited')} chars/min")
+    
+    if args.stream:
+        generator.stream_output = True
+        generator.stream_format = args.stream_format
+    
+    generator.keep_segment_files = args.keep_segments
+    generator.checkpoint_pcm_segments = args.checkpoint_pcm
+    generator.refresh_llm_cache = args.refresh_llm
+    generator.pipeline_script = args.pipeline
+    generator.single_request = args.fast
+    generator.segment_char_budget = args.segment_chars
+    if args.mix_workers is not None:
+        generator.mix_workers = max(1, args.mix_workers)
+    generator.resume = not args.no_resume
+    if args.work_dir:
+        generator.work_dir = args.work_dir
+    
+    if args.pcm:
+        generator.audio_format = "pcm"
+        print(f"🎚️ In-memory PCM pipeline ({generator.pcm_sample_rate} Hz)")
     
     # Override to use Play.ht if requested
     if args.use_playht and playht_key and playht_user:
@@ -1124,6 +4631,21 @@ def main():
         print(f"🎙️ Using TTS provider: ELEVENLABS (default)")
         print(f"   ElevenLabs voices: Rachel & Elli")
     
+    if args.hedge:
+        if generator.tts_provider == "elevenlabs" and playht_key and playht_user:
+            generator.secondary_tts_provider = "playht"
+        if generator._secondary_backend() is not None:
+            generator.hedge_policy = HedgePolicy(percentile=args.hedge_percentile)
+            print(f"🏁 Hedging slow requests (p{args.hedge_percentile:g}) with {generator._secondary_backend().label}")
+        else:
+            print("⚠️ --hedge needs a second provider (Play.ht credentials); continuing without hedging")
+    
+    # Batch mode: many episodes through one generator
+    if args.batch:
+        success = run_batch(generator, args.batch, args.batch_out, args.batch_workers)
+        write_run_reports(generator, success, args.metrics_out, profiler, args.profile)
+        sys.exit(0 if success else 1)
+    
     # Get transcript or script file
     transcript = ""
     if args.sample:
@@ -1162,16 +4684,18 @@ def main():
     
     # Generate the podcast
     if args.script_file:
-        success = generator.generate_podcast_from_script(args.script_file, args.output)
+        success = generator.generate_podcast_from_script(args.script_file, args.output, args.segments_dir)
     else:
-        success = generator.generate_podcast(transcript, args.output)
+        success = generator.generate_podcast(transcript, args.output, args.segments_dir)
     
     if success:
         print(f"\n🎉 Podcast generation complete!")
         print(f"📁 Output file: {args.output}")
-        print(f"📝 Script file: {args.output.replace('.mp3', '_script.txt')}")
+        print(f"📝 Script file: {script_filename_for(args.output)}")
     else:
         print("\n❌ Podcast generation failed")
+    write_run_reports(generator, success, args.metrics_out, profiler, args.profile)
+    if not success:
         sys.exit(1)
 
 if __name__ == "__main__":
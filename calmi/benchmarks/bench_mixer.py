@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark: episode mixing time vs. segment count.
+
+Compares the original concatenation-based mixing loop (every step rebuilds the
+whole episode) with the TimelineMixer used by combine_audio_files_smart.
+Segments are synthetic tone bursts, so no API keys or ffmpeg are needed.
+
+Wherever the legacy mixer runs, its output is checked against the timeline
+mixer's for every seed: the episodes must have the same length and no sample
+may differ by more than MAX_SAMPLE_DIFF (the mixers round gains and fades
+slightly differently).
+
+Usage:
+    python benchmarks/bench_mixer.py --counts 10 20 40 80 --legacy-max 40 --seeds 1 2 3 7
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from pydub import AudioSegment
+
+from ai_podcast_generator import AIPodcastGenerator
+
+TIMINGS = ["normal", "normal", "overlap", "normal", "simultaneous", "normal"]
+
+# Largest per-sample difference (in LSB) allowed between the two mixers
+MAX_SAMPLE_DIFF = 2
+
+
+def make_segment(rng: np.random.Generator, frame_rate: int = 24000) -> AudioSegment:
+    """A 2-6 second tone burst with some leading and trailing silence."""
+    speech_ms = int(rng.integers(2000, 6000))
+    lead_ms, tail_ms = int(rng.integers(50, 400)), int(rng.integers(100, 800))
+    t = np.arange(int(frame_rate * speech_ms / 1000)) / frame_rate
+    tone = (np.sin(2 * np.pi * rng.uniform(150, 300) * t) * rng.uniform(3000, 12000)).astype(np.int16)
+    silence = lambda ms: np.zeros(int(frame_rate * ms / 1000), dtype=np.int16)
+    samples = np.concatenate([silence(lead_ms), tone, silence(tail_ms)])
+    return AudioSegment(data=samples.tobytes(), sample_width=2, frame_rate=frame_rate, channels=1)
+
+
+def legacy_mix(generator: AIPodcastGenerator, segments: list) -> AudioSegment:
+    """The mixing loop combine_audio_files_smart used before TimelineMixer."""
+    combined = generator._normalize_volume(generator._trim_silence_gentle(segments[0][0]))
+    short_pause = AudioSegment.silent(duration=400)
+
+    for i, (segment, timing_info) in enumerate(segments[1:], 1):
+        segment = generator._trim_silence_gentle(segment) if i <= 3 else generator._trim_silence(segment)
+        segment = generator._normalize_volume(segment)
+
+        if timing_info == "overlap":
+            combined = generator._trim_silence(combined)
+            overlap_ms = int(min(2000, len(segment) // 1.5, len(combined) // 2))
+            if overlap_ms > 100:
+                combined = (combined[:-overlap_ms] +
+                            combined[-overlap_ms:].overlay(segment[:overlap_ms]) +
+                            segment[overlap_ms:])
+            else:
+                combined = combined + segment
+        elif timing_info == "simultaneous":
+            combined = generator._trim_silence(combined)
+            backup_ms = min(1000, len(combined) // 3, len(segment))
+            if backup_ms > 0:
+                combined = combined[:-backup_ms] + combined[-backup_ms:].overlay(segment)
+            else:
+                combined = combined.overlay(segment)
+        else:
+            combined = generator._trim_silence(combined)
+            combined = generator._add_with_crossfade(combined, segment, short_pause)
+
+    return combined
+
+
+def max_sample_diff(episode: AudioSegment, legacy_episode: AudioSegment) -> int:
+    """Largest absolute per-sample difference between two episodes of equal length."""
+    a = np.array(episode.get_array_of_samples(), dtype=np.int64)
+    b = np.array(legacy_episode.get_array_of_samples(), dtype=np.int64)
+    assert len(a) == len(b), f"episode lengths differ by {len(a) - len(b)} samples"
+    return int(np.max(np.abs(a - b))) if len(a) else 0
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark episode mixing time vs. segment count")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 20, 40, 80])
+    parser.add_argument("--legacy-max", type=int, default=40,
+                        help="Skip the (quadratic) legacy mixer above this many segments")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[1, 2, 3, 7])
+    args = parser.parse_args()
+
+    generator = AIPodcastGenerator("dummy_key", use_cache=False)
+
+    print(f"{'seed':>4} {'segments':>8} {'episode':>9} {'legacy':>9} {'timeline':>9} {'speedup':>8} {'max diff':>9}")
+    for seed in args.seeds:
+        rng = np.random.default_rng(seed)
+        for count in args.counts:
+            segments = [(make_segment(rng), TIMINGS[i % len(TIMINGS)]) for i in range(count)]
+            new_time, episode = timed(generator._mix_segments, segments)
+
+            if count <= args.legacy_max:
+                old_time, legacy_episode = timed(legacy_mix, generator, segments)
+                diff = max_sample_diff(episode, legacy_episode)
+                assert diff <= MAX_SAMPLE_DIFF, f"seed {seed}, {count} segments: samples differ by {diff}"
+                speedup = f"{old_time / new_time:7.1f}x"
+                legacy_cell = f"{old_time:8.2f}s"
+                diff_cell = f"{diff:>7d}  "
+            else:
+                legacy_cell, speedup, diff_cell = f"{'-':>9}", f"{'-':>8}", f"{'-':>9}"
+
+            print(f"{seed:>4} {count:>8} {len(episode) / 1000:8.1f}s {legacy_cell} {new_time:8.2f}s {speedup} "
+                  f"{diff_cell}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Benchmark: script parsing (split_script_for_voices) on large multi-episode scripts.
+
+First checks the regex-driven ScriptSegmentParser against a copy of the original
+line-scanning split_script_for_voices (golden output on the bundled scripts, on
+the large synthetic scripts, and when the text is fed in random chunks as it is
+when streaming), then times both.
+
+Usage:
+    python benchmarks/bench_parser.py --episodes 10 100 500
+"""
+
+import argparse
+import glob
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_podcast_generator import AIPodcastGenerator, ScriptSegmentParser, SCRIPTS_DIR
+
+EDGE_CASES = """intro before any marker
+[Host 2] short
+[laughing]
+[OVERLAP - Host 1]
+[OVERLAP - Host 2] Exactly! [laughs]
+   
+[SIMULTANEOUS - Both hosts] together
+[Both - laughing]
+continued after the skipped lines
+[MAIN DISCUSSION - Host 1]
+[MAIN DISCUSSION - Host 2] So where do we start?
+some [pause] text
+[OUTRO - Host 1] Take care.
+"""
+
+
+def legacy_split(generator: AIPodcastGenerator, script: str) -> list:
+    """The original split_script_for_voices, kept verbatim as the golden reference."""
+    segments = []
+    lines = script.split('\n')
+    current_segment = ""
+    current_voice = generator.host_1_voice_id
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        if "[OVERLAP - Host" in line:
+            if current_segment:
+                segments.append((current_segment, current_voice, "normal"))
+            if "Host 1" in line:
+                current_voice = generator.host_1_voice_id
+            else:
+                current_voice = generator.host_2_voice_id
+            text = line.split("]", 1)[1].strip() if "]" in line else ""
+            if text:
+                segments.append((text, current_voice, "overlap"))
+            current_segment = ""
+        elif "[SIMULTANEOUS" in line or "[Both -" in line:
+            pass
+        elif any(marker in line for marker in ["[Host 1]", "[INTRO - Host 1]", "[MAIN DISCUSSION - Host 1]", "[OUTRO - Host 1]"]):
+            if current_segment:
+                segments.append((current_segment, current_voice, "normal"))
+            text = line
+            for marker in ["[Host 1]", "[INTRO - Host 1]", "[MAIN DISCUSSION - Host 1]", "[OUTRO - Host 1]"]:
+                text = text.replace(marker, "")
+            current_segment = text.strip()
+            current_voice = generator.host_1_voice_id
+        elif any(marker in line for marker in ["[Host 2]", "[INTRO - Host 2]", "[MAIN DISCUSSION - Host 2]", "[OUTRO - Host 2]"]):
+            if current_segment:
+                segments.append((current_segment, current_voice, "normal"))
+            text = line
+            for marker in ["[Host 2]", "[INTRO - Host 2]", "[MAIN DISCUSSION - Host 2]", "[OUTRO - Host 2]"]:
+                text = text.replace(marker, "")
+            current_segment = text.strip()
+            current_voice = generator.host_2_voice_id
+        elif line.startswith("[") and line.endswith("]"):
+            pass
+        else:
+            current_segment += " " + line
+
+    if current_segment:
+        segments.append((current_segment, current_voice, "normal"))
+
+    final_segments = []
+    for segment in segments:
+        if len(segment) == 2:
+            text, voice = segment
+            timing = "normal"
+        else:
+            text, voice, timing = segment
+        if text.strip():
+            final_segments.append((text.strip(), voice, timing))
+    return final_segments
+
+
+def chunked_split(generator: AIPodcastGenerator, script: str, rng: random.Random) -> list:
+    """Parse the script fed in random chunks, as the streaming pipeline does."""
+    parser = ScriptSegmentParser()
+    parsed = []
+    position = 0
+    while position < len(script):
+        size = rng.randint(1, 40)
+        parsed.extend(parser.feed(script[position:position + size]))
+        position += size
+    parsed.extend(parser.close())
+    return [(s.text, generator._host_voice(s.host), s.timing) for s in parsed]
+
+
+def bundled_scripts() -> list:
+    scripts = []
+    for path in sorted(glob.glob(os.path.join(SCRIPTS_DIR, "*.txt"))):
+        with open(path, 'r') as f:
+            scripts.append(f.read())
+    return scripts
+
+
+def check_golden(generator: AIPodcastGenerator, scripts: list, rng: random.Random) -> None:
+    for script in scripts:
+        expected = legacy_split(generator, script)
+        assert generator.split_script_for_voices(script) == expected
+        assert chunked_split(generator, script, rng) == expected
+    print(f"✅ Parser output matches the original split_script_for_voices on {len(scripts)} scripts")
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark script parsing on large multi-episode scripts")
+    parser.add_argument("--episodes", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    generator = AIPodcastGenerator("dummy_key", use_cache=False)
+    rng = random.Random(args.seed)
+    scripts = bundled_scripts()
+    if not scripts:
+        sys.exit(f"No scripts found in {SCRIPTS_DIR}")
+
+    big_scripts = {count: "\n\n".join(rng.choice(scripts) for _ in range(count)) for count in args.episodes}
+    check_golden(generator, scripts + [EDGE_CASES] + list(big_scripts.values())[:1], rng)
+
+    print(f"{'episodes':>8} {'lines':>8} {'segments':>9} {'legacy':>9} {'regex':>9} {'speedup':>8}")
+    for count, script in big_scripts.items():
+        old_time, expected = timed(legacy_split, generator, script)
+        new_time, actual = timed(generator.split_script_for_voices, script)
+        assert actual == expected
+        print(f"{count:>8} {script.count(chr(10)) + 1:>8} {len(actual):>9} "
+              f"{old_time * 1000:7.1f}ms {new_time * 1000:7.1f}ms {old_time / new_time:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
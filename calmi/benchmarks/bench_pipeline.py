@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Benchmark: end-to-end generate_podcast runs against the offline provider stubs.
+
+Every configuration (segment count x TTS concurrency) runs in its own subprocess
+with a fresh ProviderStubServer, so peak RSS is measured per run. Stage timings
+come from wrapping the generator's analysis, script, synthesis and mixing
+methods. No API keys, network access or ffmpeg are needed (the episode is
+written as WAV and the PCM pipeline is used by default).
+
+Usage:
+    python benchmarks/bench_pipeline.py --segments 10 40 --concurrency 1 4 8
+    python benchmarks/bench_pipeline.py --provider playht --error-rate 0.05 --pipeline
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Stage name -> generator method timed for it
+STAGES = {
+    "analysis": "analyze_conversation",
+    "script": "generate_podcast_script",
+    "tts": "_synthesize_segments",
+    "mix": "combine_audio_files_smart",
+}
+
+TRANSCRIPT = (
+    "Client: I keep putting off applying for the promotion. Part of me thinks I'm not ready.\n"
+    "Therapist: What would being ready look like to you?\n"
+    "Client: Knowing I wouldn't fail, I guess. My dad always said you only get one shot.\n"
+) * 20
+
+
+def timed_method(generator, name: str, timings: dict, stage: str) -> None:
+    """Accumulate wall time spent in generator.<name> under timings[stage]."""
+    original = getattr(generator, name)
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - start
+
+    setattr(generator, name, wrapper)
+
+
+def run_one(config: dict) -> dict:
+    """Generate one episode against fresh stubs (runs in the child process)."""
+    from ai_podcast_generator import AIPodcastGenerator, HedgePolicy
+    from provider_stubs import ProviderStubServer, StubConfig
+
+    stub_config = StubConfig(tts_latency=config["tts_latency"], playht_job_seconds=config["playht_job_seconds"],
+                             llm_latency=config["llm_latency"], error_rate=config["error_rate"],
+                             script_segments=config["segments"], seed=config["seed"],
+                             slow_rate=config["slow_rate"], slow_seconds=config["slow_seconds"],
+                             repeat_host_rate=config["repeat_host_rate"])
+    timings = {}
+    with ProviderStubServer(stub_config) as stubs, tempfile.TemporaryDirectory() as work_dir:
+        generator = AIPodcastGenerator("stub", "stub", "stub", "stub", tts_concurrency=config["concurrency"],
+                                       use_cache=False)
+        stubs.configure(generator)
+        generator.work_dir = work_dir
+        generator.resume = False
+        generator.audio_format = config["audio_format"]
+        generator.pipeline_script = config["pipeline"]
+        generator.segment_char_budget = config["segment_chars"]
+        if config["provider"] == "playht":
+            generator.tts_provider = "playht"
+            generator.host_1_voice_id = generator.playht_host_1
+            generator.host_2_voice_id = generator.playht_host_2
+        if config["hedge"]:
+            generator.secondary_tts_provider = "elevenlabs" if config["provider"] == "playht" else "playht"
+            generator.hedge_policy = HedgePolicy()
+        for stage, method in STAGES.items():
+            timed_method(generator, method, timings, stage)
+
+        output = os.path.join(work_dir, "episode.wav")
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            ok = generator.generate_podcast(TRANSCRIPT, output)
+        total = time.perf_counter() - start
+        stats = dict(stubs.stats)
+
+    return {
+        "ok": bool(ok),
+        "total": total,
+        "stages": timings,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,  # KiB on Linux
+        "requests": stats,
+    }
+
+
+def run_in_subprocess(config: dict) -> dict:
+    result = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", json.dumps(config)],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"benchmark run failed for {config}:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark generate_podcast end to end against provider stubs")
+    parser.add_argument("--segments", type=int, nargs="+", default=[10, 40])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--provider", choices=["elevenlabs", "playht"], default="elevenlabs")
+    parser.add_argument("--audio-format", choices=["pcm", "mp3"], default="pcm",
+                        help="Generator audio pipeline (mp3 needs ffmpeg to decode segments)")
+    parser.add_argument("--pipeline", action="store_true", help="Stream the script into TTS (--pipeline)")
+    parser.add_argument("--tts-latency", type=float, default=0.3)
+    parser.add_argument("--playht-job-seconds", type=float, default=1.0)
+    parser.add_argument("--llm-latency", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="Share of TTS requests that are slow outliers")
+    parser.add_argument("--slow-seconds", type=float, default=5.0)
+    parser.add_argument("--hedge", action="store_true", help="Hedge slow requests with the other provider")
+    parser.add_argument("--repeat-host-rate", type=float, default=0.0,
+                        help="Share of scripted turns that are short follow-ups by the same host")
+    parser.add_argument("--segment-chars", type=int, default=2000, help="TTS packing budget (0 disables packing)")
+    parser.add_argument("--seed", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="Print raw results as JSON lines")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_one(json.loads(args.child))))
+        return
+
+    if not args.json:
+        print(f"{'segments':>8} {'workers':>7} {'total':>8} {'analysis':>9} {'script':>8} {'tts':>8} {'mix':>7} "
+              f"{'rss':>8} {'errors':>6} {'tts reqs':>8}")
+    for segments in args.segments:
+        for concurrency in args.concurrency:
+            config = {
+                "segments": segments, "concurrency": concurrency, "provider": args.provider,
+                "audio_format": args.audio_format, "pipeline": args.pipeline, "tts_latency": args.tts_latency,
+                "playht_job_seconds": args.playht_job_seconds, "llm_latency": args.llm_latency,
+                "error_rate": args.error_rate, "seed": args.seed, "slow_rate": args.slow_rate,
+                "slow_seconds": args.slow_seconds, "hedge": args.hedge,
+                "repeat_host_rate": args.repeat_host_rate, "segment_chars": args.segment_chars,
+            }
+            result = run_in_subprocess(config)
+            if args.json:
+                print(json.dumps({**config, **result}))
+                continue
+            stages = result["stages"]
+            requests = result["requests"]
+            status = "" if result["ok"] else "  ❌ failed"
+            print(f"{segments:>8} {concurrency:>7} {result['total']:7.2f}s "
+                  f"{stages.get('analysis', 0):8.2f}s {stages.get('script', 0):7.2f}s "
+                  f"{stages.get('tts', 0):7.2f}s {stages.get('mix', 0):6.2f}s "
+                  f"{result['peak_rss_mb']:6.0f}MB {requests.get('errors', 0):>6} "
+                  f"{requests.get('elevenlabs_tts', 0) + requests.get('playht_create', 0):>8}{status}")
+
+
+if __name__ == "__main__":
+    main()
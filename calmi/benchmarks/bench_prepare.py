@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-segment preparation (decode, trim, level) in-process vs. the worker pool.
+
+Writes synthetic segment files, combines them with combine_audio_files_smart using
+one worker (everything in-process) and with each requested pool size, checks that
+every run produces the same episode, and reports the combine time. Segments are
+MP3 when ffmpeg is available (the case the pool is for: decoding dominates) and
+WAV otherwise. The first pooled run includes starting the workers; it is
+reported separately from a warm rerun.
+
+Usage:
+    python benchmarks/bench_prepare.py --segments 40 80 --workers 4 16
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from ai_podcast_generator import AIPodcastGenerator
+from bench_mixer import TIMINGS, make_segment
+
+
+def combine(generator: AIPodcastGenerator, audio_files: list, output: str) -> float:
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        ok = generator.combine_audio_files_smart(audio_files, output)
+    elapsed = time.perf_counter() - start
+    if not ok:
+        raise RuntimeError(f"combining into {output} failed")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parallel segment preparation before mixing")
+    parser.add_argument("--segments", type=int, nargs="+", default=[40, 80])
+    parser.add_argument("--workers", type=int, nargs="+", default=[os.cpu_count() or 1])
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    segment_format = "mp3" if shutil.which("ffmpeg") else "wav"
+    print(f"Segment files: {segment_format}, {os.cpu_count()} CPUs")
+    print(f"{'segments':>8} {'workers':>7} {'cold':>8} {'warm':>8} {'speedup':>8}")
+
+    rng = np.random.default_rng(args.seed)
+    with tempfile.TemporaryDirectory() as scratch:
+        for count in args.segments:
+            audio_files = []
+            for i in range(count):
+                filename = os.path.join(scratch, f"segment_{count}_{i:03d}.{segment_format}")
+                make_segment(rng).export(filename, format=segment_format)
+                audio_files.append((filename, TIMINGS[i % len(TIMINGS)]))
+
+            serial = AIPodcastGenerator("dummy_key", use_cache=False)
+            serial.mix_workers = 1
+            expected = os.path.join(scratch, "serial.wav")
+            serial_time = combine(serial, audio_files, expected)
+            print(f"{count:>8} {1:>7} {serial_time:7.2f}s {'-':>8} {'1.0x':>8}")
+
+            for workers in args.workers:
+                generator = AIPodcastGenerator("dummy_key", use_cache=False)
+                generator.mix_workers = workers
+                generator.mix_pool_min_segments = 1
+                output = os.path.join(scratch, f"pool_{workers}.wav")
+                cold = combine(generator, audio_files, output)
+                warm = combine(generator, audio_files, output)
+                with open(expected, "rb") as a, open(output, "rb") as b:
+                    assert a.read() == b.read(), f"{workers} workers produced a different episode"
+                print(f"{count:>8} {workers:>7} {cold:7.2f}s {warm:7.2f}s {serial_time / warm:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark: silence detection used by _trim_silence / _trim_silence_gentle.
+
+First checks that the vectorized _detect_nonsilent returns exactly what
+pydub.silence.detect_nonsilent returns (odd frame rates, stereo, 8/16/32-bit,
+both trim settings), and that the edge-window _speech_bounds agrees with a full
+detection pass, then times both detectors on multi-minute segments.
+
+Usage:
+    python benchmarks/bench_silence.py --minutes 1 3 5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from pydub import AudioSegment
+from pydub.silence import detect_nonsilent
+
+from ai_podcast_generator import AIPodcastGenerator
+
+# (min_silence_len, silence_thresh) used by _trim_silence and _trim_silence_gentle
+TRIM_SETTINGS = [(200, -40), (300, -50)]
+
+
+def make_speechlike(rng: np.random.Generator, seconds: float, frame_rate: int = 24000,
+                    channels: int = 1, sample_width: int = 2) -> AudioSegment:
+    """Alternating bursts of noise-modulated tone and near-silence, like a voice track."""
+    dtype = {1: np.int8, 2: np.int16, 4: np.int32}[sample_width]
+    peak = float(np.iinfo(dtype).max)
+    pieces = []
+    remaining = int(seconds * frame_rate)
+    while remaining > 0:
+        n = min(remaining, int(frame_rate * rng.uniform(0.05, 1.5)))
+        level = rng.choice([0.0, 0.002, 0.01, rng.uniform(0.05, 0.5)])
+        t = np.arange(n) / frame_rate
+        burst = np.sin(2 * np.pi * rng.uniform(100, 400) * t) + rng.normal(0, 0.3, n)
+        pieces.append(np.clip(burst * level * peak, -peak, peak))
+        remaining -= n
+    mono = np.concatenate(pieces)
+    samples = np.repeat(mono[:, None], channels, axis=1).astype(dtype)
+    return AudioSegment(data=samples.tobytes(), sample_width=sample_width,
+                        frame_rate=frame_rate, channels=channels)
+
+
+def check_compatibility(generator: AIPodcastGenerator, rng: np.random.Generator) -> None:
+    formats = [(24000, 1, 2), (44100, 2, 2), (22050, 1, 1), (16000, 1, 4), (11025, 2, 2)]
+    cases = 0
+    for frame_rate, channels, sample_width in formats:
+        for _ in range(4):
+            segment = make_speechlike(rng, rng.uniform(0.1, 8.0), frame_rate, channels, sample_width)
+            for min_silence_len, silence_thresh in TRIM_SETTINGS:
+                expected = detect_nonsilent(segment, min_silence_len=min_silence_len,
+                                            silence_thresh=silence_thresh)
+                actual = generator._detect_nonsilent(segment, min_silence_len=min_silence_len,
+                                                     silence_thresh=silence_thresh)
+                assert actual == expected, (frame_rate, channels, sample_width, expected, actual)
+                cases += 1
+    print(f"✅ Vectorized detection matches pydub on {cases} cases")
+
+
+def check_speech_bounds(generator: AIPodcastGenerator, rng: np.random.Generator) -> None:
+    # 22050 and 11025 Hz put most millisecond positions between two frames
+    formats = [(24000, 1, 2), (44100, 2, 2), (22050, 1, 2), (22050, 2, 1), (11025, 1, 2), (16000, 1, 4)]
+    cases = 0
+    for frame_rate, channels, sample_width in formats:
+        for _ in range(40):
+            segment = make_speechlike(rng, rng.uniform(0.5, 12.0), frame_rate, channels, sample_width)
+            gain_db = float(rng.uniform(-10, 10))
+            chunks = generator._detect_nonsilent(segment.apply_gain(gain_db), min_silence_len=200,
+                                                 silence_thresh=-40)
+            expected = (chunks[0][0], chunks[-1][1]) if chunks else None
+            actual = generator._speech_bounds(segment, gain_db, need_start=True)
+            assert actual == expected, (frame_rate, channels, sample_width, len(segment), expected, actual)
+            cases += 1
+    print(f"✅ Edge-window speech bounds match a full pass on {cases} cases")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark silence detection on long segments")
+    parser.add_argument("--minutes", type=float, nargs="+", default=[1, 3, 5])
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    generator = AIPodcastGenerator("dummy_key", use_cache=False)
+    rng = np.random.default_rng(args.seed)
+    check_compatibility(generator, rng)
+    check_speech_bounds(generator, rng)
+
+    print(f"{'minutes':>8} {'pydub':>9} {'numpy':>9} {'speedup':>8}")
+    for minutes in args.minutes:
+        segment = make_speechlike(rng, minutes * 60)
+
+        start = time.perf_counter()
+        expected = detect_nonsilent(segment, min_silence_len=200, silence_thresh=-40)
+        pydub_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = generator._detect_nonsilent(segment, min_silence_len=200, silence_thresh=-40)
+        numpy_time = time.perf_counter() - start
+
+        assert actual == expected
+        print(f"{minutes:>8g} {pydub_time:8.2f}s {numpy_time:8.3f}s {pydub_time / numpy_time:7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
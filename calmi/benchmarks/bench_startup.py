@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark: startup time per CLI mode.
+
+Runs each mode in a fresh interpreter several times and reports the median wall
+time (interpreter start included) along with which heavy libraries the mode
+ended up importing. Modes that never talk to a provider or mix audio should not
+load openai, pydub, requests or numpy at all.
+
+Usage:
+    python benchmarks/bench_startup.py --repeat 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(PACKAGE_DIR, "ai_podcast_generator.py")
+HEAVY_MODULES = ["openai", "pydub", "requests", "numpy"]
+
+# Runs one mode in-process, then reports which heavy modules it imported
+CHILD = """
+import json, runpy, sys
+sys.argv = {argv!r}
+sys.path.insert(0, {package_dir!r})
+try:
+    {statement}
+except SystemExit:
+    pass
+sys.__stderr__.write("STARTUP " + json.dumps([m for m in {heavy!r} if m in sys.modules]) + "\\n")
+"""
+
+
+def modes(scratch: str) -> dict:
+    """Mode name -> (argv, statement executed in the child)."""
+    run_cli = f"runpy.run_path({SCRIPT!r}, run_name='__main__')"
+    empty_segments = os.path.join(scratch, "segments")
+    os.makedirs(empty_segments, exist_ok=True)
+    return {
+        "import": ([SCRIPT], "import ai_podcast_generator"),
+        "generator init": ([SCRIPT], "from ai_podcast_generator import AIPodcastGenerator; "
+                                     "AIPodcastGenerator('key', openai_api_key='key', use_cache=False)"),
+        "--help": ([SCRIPT, "--help"], run_cli),
+        "--prune-cache": ([SCRIPT, "--prune-cache", "--cache-dir", os.path.join(scratch, "cache")], run_cli),
+        "--combine-only": ([SCRIPT, "--combine-only", "--segments-dir", empty_segments,
+                            "--output", os.path.join(scratch, "out.wav")], run_cli),
+    }
+
+
+def run_mode(argv: list, statement: str) -> tuple:
+    code = CHILD.format(argv=argv, package_dir=PACKAGE_DIR, statement=statement, heavy=HEAVY_MODULES)
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=PACKAGE_DIR)
+    elapsed = time.perf_counter() - start
+    loaded = None
+    for line in result.stderr.splitlines():
+        if line.startswith("STARTUP "):
+            loaded = json.loads(line[len("STARTUP "):])
+    if loaded is None:
+        raise RuntimeError(f"mode {argv[1:]} did not finish:\n{result.stderr}")
+    return elapsed, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CLI startup time per mode")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    baseline = statistics.median(
+        run_mode([SCRIPT], "pass")[0] for _ in range(args.repeat))
+    print(f"Bare interpreter: {baseline * 1000:.0f}ms")
+    print(f"{'mode':>16} {'median':>9} {'over bare':>10}  heavy imports")
+
+    with tempfile.TemporaryDirectory() as scratch:
+        for name, (argv, statement) in modes(scratch).items():
+            timings = []
+            for _ in range(args.repeat):
+                elapsed, loaded = run_mode(argv, statement)
+                timings.append(elapsed)
+            median = statistics.median(timings)
+            print(f"{name:>16} {median * 1000:7.0f}ms {(median - baseline) * 1000:8.0f}ms  "
+                  f"{', '.join(loaded) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+Local stand-ins for the ElevenLabs, Play.ht and OpenAI APIs.
+
+Runs a small HTTP server that mimics the endpoints AIPodcastGenerator talks to:
+ElevenLabs text-to-speech/{voice_id}, Play.ht's create/poll/download job flow and
+OpenAI chat completions (plain, JSON mode and streamed). Latency, error rates and
+the size of generated scripts are configurable, and the audio is synthetic
+(tone bursts sized to the text), so whole episodes can be generated offline for
+benchmarks and regression tests.
+
+Usage:
+    python provider_stubs.py --port 8765 --tts-latency 0.3 --error-rate 0.05
+
+    # In code
+    with ProviderStubServer(StubConfig(script_segments=40)) as stubs:
+        generator = AIPodcastGenerator("stub", "stub", "stub", "stub")
+        stubs.configure(generator)
+        generator.generate_podcast(transcript, "episode.wav")
+"""
+
+import argparse
+import io
+import json
+import random
+import re
+import shutil
+import threading
+import time
+import uuid
+import wave
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+# Silent MPEG-1 Layer III frame (128 kbps, 44.1 kHz): used for MP3 responses when
+# ffmpeg isn't available to encode the synthetic tone
+_SILENT_MP3_FRAME = bytes([0xFF, 0xFB, 0x90, 0x64]) + bytes(413)
+
+# Speaking rate used to size synthetic audio
+CHARS_PER_SECOND = 15.0
+
+
+class StubConfig:
+    """Behaviour of the stub providers."""
+
+    def __init__(self, tts_latency: float = 0.3, tts_latency_per_char: float = 0.001,
+                 playht_job_seconds: float = 1.0, llm_latency: float = 1.0, llm_tokens_per_second: float = 200.0,
+                 error_rate: float = 0.0, script_segments: int = 20, seed: Optional[int] = None,
+                 slow_rate: float = 0.0, slow_seconds: float = 5.0, repeat_host_rate: float = 0.0):
+        """
+        Args:
+            tts_latency: Base seconds per TTS request (ElevenLabs) or Play.ht job creation
+            tts_latency_per_char: Extra TTS seconds per character of text
+            playht_job_seconds: Average seconds until a Play.ht job reports completion (±50%)
+            llm_latency: Seconds before a chat completion starts producing tokens
+            llm_tokens_per_second: Generation speed of chat completions (~4 chars per token)
+            error_rate: Probability that a TTS or chat request fails with 429 or 503 (both
+                with Retry-After, so the client may safely resend even a POST)
+            script_segments: Number of speaker turns in generated scripts
+            seed: Seed for the synthetic content and error injection
+            slow_rate: Probability that a TTS request (or Play.ht job) is a slow outlier
+            slow_seconds: Extra seconds added to slow outliers
+            repeat_host_rate: Probability that a scripted turn is a short follow-up by the same host
+        """
+        self.tts_latency = tts_latency
+        self.tts_latency_per_char = tts_latency_per_char
+        self.playht_job_seconds = playht_job_seconds
+        self.llm_latency = llm_latency
+        self.llm_tokens_per_second = llm_tokens_per_second
+        self.error_rate = error_rate
+        self.script_segments = script_segments
+        self.seed = seed
+        self.slow_rate = slow_rate
+        self.slow_seconds = slow_seconds
+        self.repeat_host_rate = repeat_host_rate
+
+
+def synthetic_speech(text: str, sample_rate: int = 24000, seed: int = 0) -> np.ndarray:
+    """
+    Synthetic "speech" for a piece of text: tone bursts with short pauses, with a
+    little silence at both ends so trimming has something to do.
+
+    Returns:
+        Mono int16 samples, about len(text) / CHARS_PER_SECOND seconds long
+    """
+    rng = np.random.default_rng(seed)
+    seconds = max(0.5, len(text) / CHARS_PER_SECOND)
+    pieces = [np.zeros(int(sample_rate * 0.15), dtype=np.float64)]
+    remaining = int(sample_rate * seconds)
+    while remaining > 0:
+        n = min(remaining, int(sample_rate * rng.uniform(0.2, 0.8)))
+        t = np.arange(n) / sample_rate
+        envelope = np.minimum(1.0, np.minimum(t, t[::-1]) * 20)
+        pieces.append(np.sin(2 * np.pi * rng.uniform(140, 260) * t) * envelope * rng.uniform(4000, 9000))
+        pieces.append(np.zeros(int(sample_rate * rng.uniform(0.03, 0.12))))
+        remaining -= n
+    pieces.append(np.zeros(int(sample_rate * 0.3)))
+    return np.concatenate(pieces).astype(np.int16)
+
+
+def encode_wav(samples: np.ndarray, sample_rate: int) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+def encode_mp3(samples: np.ndarray, sample_rate: int) -> bytes:
+    """MP3 via ffmpeg when it is installed, otherwise silent frames of the same length."""
+    if shutil.which("ffmpeg"):
+        from pydub import AudioSegment
+        buffer = io.BytesIO()
+        AudioSegment(data=samples.tobytes(), sample_width=2, frame_rate=sample_rate, channels=1).export(
+            buffer, format="mp3")
+        return buffer.getvalue()
+    frames = max(1, int(len(samples) / sample_rate * 44100 / 1152))
+    return _SILENT_MP3_FRAME * frames
+
+
+def synthetic_script(segments: int, rng: random.Random, repeat_host_rate: float = 0.0) -> str:
+    """
+    A script in the podcast's marker format with the given number of speaker turns.
+
+    Hosts alternate, except that at repeat_host_rate a turn is a one-sentence
+    follow-up by the host who just spoke.
+    """
+    words = ("feel", "growth", "pattern", "courage", "honest", "moment", "family", "fear", "hope",
+             "change", "listen", "space", "gentle", "story", "trust", "learning", "really", "together")
+    lines = []
+    host = 2
+    for i in range(segments):
+        repeat = i > 0 and repeat_host_rate > 0 and rng.random() < repeat_host_rate
+        if not repeat:
+            host = 3 - host
+        if i == 0:
+            marker = f"[INTRO - Host {host}]"
+        elif i == segments - 1 and segments > 1:
+            marker = f"[OUTRO - Host {host}]"
+        elif rng.random() < 0.12:
+            marker = f"[OVERLAP - Host {host}]"
+        else:
+            marker = f"[Host {host}]"
+        sentence_count = 1 if repeat or marker.startswith("[OVERLAP") else rng.randint(2, 4)
+        sentences = []
+        for _ in range(sentence_count):
+            sentence = " ".join(rng.choice(words) for _ in range(rng.randint(6, 14)))
+            sentences.append(sentence.capitalize() + ".")
+        if marker.startswith("[OVERLAP"):
+            lines.append(f"{marker} {' '.join(sentences)}")
+        else:
+            lines.append(f"{marker}\n{' '.join(sentences)}")
+    return "\n\n".join(lines)
+
+
+def synthetic_analysis(rng: random.Random) -> Dict:
+    themes = ["fear of success", "family expectations", "self-compassion", "relationship patterns",
+              "uncertainty", "perfectionism", "grief", "belonging"]
+    return {
+        "core_themes": rng.sample(themes, 3),
+        "emotional_patterns": ["anticipatory anxiety", "self-criticism"],
+        "therapeutic_insights": ["naming the fear reduces its power", "small steps build safety",
+                                 "old protective patterns", "values-based action"],
+        "philosophical_angles": ["what does it mean to be ready?", "growth as becoming"],
+        "reframing_opportunities": ["hesitation as care rather than weakness"],
+        "growth_indicators": ["self-awareness", "reaching out"],
+        "support_suggestions": ["one small action a day", "journaling"]
+    }
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_StubHTTPServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    # ---- plumbing ----
+
+    def _body(self) -> Dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        return json.loads(raw) if raw else {}
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[Dict] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, payload, headers: Optional[Dict] = None) -> None:
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json", headers)
+
+    def _maybe_fail(self) -> bool:
+        """Inject a rate limit or an overload response at the configured rate."""
+        stubs = self.server.stubs
+        if stubs.roll() >= stubs.config.error_rate:
+            return False
+        stubs.count("errors")
+        if stubs.roll() < 0.5:
+            self._send_json(429, {"detail": "rate limited (stub)"}, {"Retry-After": "0"})
+        else:
+            self._send_json(503, {"detail": "overloaded (stub)"}, {"Retry-After": "0"})
+        return True
+
+    # ---- routing ----
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        if path.startswith("/v1/text-to-speech/"):
+            return self._elevenlabs_tts()
+        if path == "/api/v2/tts":
+            return self._playht_create()
+        if path == "/v1/chat/completions":
+            return self._chat_completion()
+        self._send_json(404, {"detail": f"unknown endpoint {path}"})
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        match = re.fullmatch(r"/api/v2/tts/([\w-]+)", path)
+        if match:
+            return self._playht_status(match.group(1))
+        match = re.fullmatch(r"/api/v2/audio/([\w-]+)", path)
+        if match:
+            return self._playht_download(match.group(1))
+        self._send_json(404, {"detail": f"unknown endpoint {path}"})
+
+    # ---- ElevenLabs ----
+
+    def _elevenlabs_tts(self):
+        stubs = self.server.stubs
+        stubs.count("elevenlabs_tts")
+        body = self._body()
+        text = body.get("text", "")
+        time.sleep(stubs.config.tts_latency + stubs.config.tts_latency_per_char * len(text) + stubs.outlier())
+        if self._maybe_fail():
+            return
+
+        output_format = parse_qs(urlparse(self.path).query).get("output_format", ["mp3_44100_128"])[0]
+        stubs.count("tts_chars", len(text))
+        if output_format.startswith("pcm_"):
+            sample_rate = int(output_format.split("_")[1])
+            self._send(200, synthetic_speech(text, sample_rate, hash(text) & 0xFFFF).tobytes(), "audio/pcm")
+        else:
+            self._send(200, encode_mp3(synthetic_speech(text, 24000, hash(text) & 0xFFFF), 24000), "audio/mpeg")
+
+    # ---- Play.ht ----
+
+    def _playht_create(self):
+        stubs = self.server.stubs
+        stubs.count("playht_create")
+        body = self._body()
+        time.sleep(stubs.config.tts_latency)
+        if self._maybe_fail():
+            return
+        job_id = uuid.uuid4().hex
+        stubs.jobs[job_id] = {
+            "ready_at": time.time() + stubs.config.playht_job_seconds * (0.5 + stubs.roll()) + stubs.outlier(),
+            "text": body.get("text", ""),
+            "output_format": body.get("output_format", "mp3"),
+            "sample_rate": int(body.get("sample_rate", 24000))
+        }
+        stubs.count("tts_chars", len(body.get("text", "")))
+        self._send_json(201, {"id": job_id, "status": "generating"})
+
+    def _playht_status(self, job_id: str):
+        stubs = self.server.stubs
+        stubs.count("playht_poll")
+        job = stubs.jobs.get(job_id)
+        if job is None:
+            return self._send_json(404, {"detail": "unknown job"})
+        if time.time() < job["ready_at"]:
+            return self._send_json(200, {"id": job_id, "status": "generating"})
+        host, port = self.server.server_address[:2]
+        url = f"http://{host}:{port}/api/v2/audio/{job_id}"
+        self._send_json(200, {"id": job_id, "status": "complete", "output": {"url": url}})
+
+    def _playht_download(self, job_id: str):
+        stubs = self.server.stubs
+        stubs.count("playht_download")
+        job = stubs.jobs.pop(job_id, None)
+        if job is None:
+            return self._send_json(404, {"detail": "unknown job"})
+        samples = synthetic_speech(job["text"], job["sample_rate"], hash(job["text"]) & 0xFFFF)
+        if job["output_format"] == "wav":
+            self._send(200, encode_wav(samples, job["sample_rate"]), "audio/wav")
+        else:
+            self._send(200, encode_mp3(samples, job["sample_rate"]), "audio/mpeg")
+
+    # ---- OpenAI ----
+
+    def _chat_completion(self):
+        stubs = self.server.stubs
+        stubs.count("chat_completions")
+        body = self._body()
+        prompt = "\n".join(str(message.get("content", "")) for message in body.get("messages", []))
+        time.sleep(stubs.config.llm_latency)
+        if self._maybe_fail():
+            return
+
+        rng = random.Random(stubs.roll())
+        if body.get("response_format", {}).get("type") == "json_object":
+            content = json.dumps({"analysis": synthetic_analysis(rng),
+                                  "script": synthetic_script(stubs.config.script_segments, rng,
+                                                             stubs.config.repeat_host_rate)})
+        elif "Please provide a JSON response" in prompt:
+            content = json.dumps(synthetic_analysis(rng))
+        else:
+            content = synthetic_script(stubs.config.script_segments, rng, stubs.config.repeat_host_rate)
+
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        model = body.get("model", "stub")
+        seconds_per_char = 1.0 / (4 * stubs.config.llm_tokens_per_second)
+
+        if not body.get("stream"):
+            time.sleep(len(content) * seconds_per_char)
+            return self._send_json(200, {
+                "id": completion_id, "object": "chat.completion", "created": int(time.time()), "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content},
+                             "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(content) // 4,
+                          "total_tokens": (len(prompt) + len(content)) // 4}
+            })
+
+        # Server-sent events, a few tokens per chunk
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        for start in range(0, len(content), 16):
+            piece = content[start:start + 16]
+            time.sleep(len(piece) * seconds_per_char)
+            chunk = {"id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                     "model": model, "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]}
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+        done = {"id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                "model": model, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+        self.wfile.write(f"data: {json.dumps(done)}\n\ndata: [DONE]\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+
+class ProviderStubServer:
+    """
+    Background HTTP server hosting the stub providers.
+
+    Use as a context manager (or call start/stop), then point a generator at it
+    with configure(). Request counts per endpoint are kept in stats.
+    """
+
+    def __init__(self, config: Optional[StubConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Args:
+            config: Stub behaviour (default: StubConfig())
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free one)
+        """
+        self.config = config or StubConfig()
+        self.jobs = {}
+        self.stats = {}
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._httpd = _StubHTTPServer((host, port), _StubHandler)
+        self._httpd.stubs = self
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def roll(self) -> float:
+        with self._lock:
+            return self._random.random()
+
+    def outlier(self) -> float:
+        """Extra latency for a request: slow_seconds at slow_rate, else 0."""
+        if self.roll() < self.config.slow_rate:
+            self.count("slow")
+            return self.config.slow_seconds
+        return 0.0
+    
+    def count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[name] = self.stats.get(name, 0) + amount
+
+    def start(self) -> 'ProviderStubServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="provider-stubs", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> 'ProviderStubServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.stop()
+        return False
+
+    def configure(self, generator) -> None:
+        """Point an AIPodcastGenerator's provider endpoints (and OpenAI client) at the stubs."""
+        generator.elevenlabs_base_url = f"{self.url}/v1"
+        generator.playht_base_url = f"{self.url}/api/v2"
+        try:
+            from openai import OpenAI
+        except ImportError:
+            return
+        generator.openai_client = OpenAI(api_key="stub", base_url=f"{self.url}/v1")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve local stand-ins for the ElevenLabs, Play.ht and OpenAI APIs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--tts-latency", type=float, default=0.3, help="Base seconds per TTS request")
+    parser.add_argument("--tts-latency-per-char", type=float, default=0.001, help="Extra TTS seconds per character")
+    parser.add_argument("--playht-job-seconds", type=float, default=1.0, help="Average seconds until a Play.ht job completes (±50%%)")
+    parser.add_argument("--llm-latency", type=float, default=1.0, help="Seconds before a chat completion starts")
+    parser.add_argument("--llm-tokens-per-second", type=float, default=200.0, help="Chat completion generation speed")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of a 429/503 response")
+    parser.add_argument("--script-segments", type=int, default=20, help="Speaker turns in generated scripts")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="Probability of a slow TTS outlier")
+    parser.add_argument("--slow-seconds", type=float, default=5.0, help="Extra seconds for slow outliers")
+    parser.add_argument("--repeat-host-rate", type=float, default=0.0, help="Probability of a short follow-up turn by the same host")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = StubConfig(args.tts_latency, args.tts_latency_per_char, args.playht_job_seconds, args.llm_latency,
+                        args.llm_tokens_per_second, args.error_rate, args.script_segments, args.seed,
+                        args.slow_rate, args.slow_seconds, args.repeat_host_rate)
+    with ProviderStubServer(config, args.host, args.port) as stubs:
+        print(f"🧪 Provider stubs listening on {stubs.url}")
+        print(f"   ElevenLabs: {stubs.url}/v1   Play.ht: {stubs.url}/api/v2   OpenAI: {stubs.url}/v1")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            print(f"\n📊 Requests: {json.dumps(stubs.stats)}")
+
+
+if __name__ == "__main__":
+    main()